@@ -0,0 +1,35 @@
+# ShelfPacker 클래스: 프린터 build plate(WIDTH x DEPTH)에 Job을 shelf 방식으로 배치하는 2D bin-packing heuristic
+# - shelf: plate의 DEPTH 방향으로 쌓이는 줄, 각 줄의 깊이는 첫 번째 Job의 깊이
+# - Job은 기존 shelf 중 들어가는 첫 번째 shelf에 배치하고, 없으면 새 shelf를 만듦 (수직축 기준 90도 회전 허용)
+# - Job 높이는 프린터 HEIGHT 이하여야 함
+class ShelfPacker:
+    def __init__(self, width, height, depth, spacing=0):
+        self.width = width  # plate 너비
+        self.height = height  # 최대 높이
+        self.depth = depth  # plate 깊이
+        self.spacing = spacing  # 부품 사이 간격
+        self.shelves = []  # [shelf 깊이, 사용한 너비]
+        self.used_depth = 0  # shelf가 차지한 깊이
+        self.count = 0  # 배치된 Job 수
+
+    def place(self, job):
+        """Job을 plate에 배치 (배치할 수 없으면 False)"""
+        if job.height > self.height:
+            return False
+        # 기존 shelf에 배치 (회전하지 않은 방향 먼저)
+        for width, depth in ((job.width, job.depth), (job.depth, job.width)):
+            for shelf in self.shelves:
+                gap = self.spacing if shelf[1] else 0
+                if depth <= shelf[0] and shelf[1] + gap + width <= self.width:
+                    shelf[1] += gap + width
+                    self.count += 1
+                    return True
+        # 새 shelf에 배치 (깊이를 적게 쓰는 방향 선택)
+        gap = self.spacing if self.shelves else 0
+        for width, depth in sorted(((job.width, job.depth), (job.depth, job.width)), key=lambda size: size[1]):
+            if width <= self.width and self.used_depth + gap + depth <= self.depth:
+                self.shelves.append([depth, width])
+                self.used_depth += gap + depth
+                self.count += 1
+                return True
+        return False
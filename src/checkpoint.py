@@ -0,0 +1,174 @@
+import pickle
+import numpy as np
+from job_table import Job
+
+# checkpoint 파일 형식 버전 (상태 구성이 바뀌면 올림)
+CHECKPOINT_VERSION = 3
+
+# checkpoint에 저장되는 상태
+# - SimPy 프로세스(generator)는 저장할 수 없으므로 모델 상태(대기열, 작업 중인 Job의 시작/종료 시간,
+#   다음 Job 도착 시간, 난수 생성기 상태, 누적값)를 저장하고, 재개 시 같은 상태에서 프로세스를 다시 시작함
+# - 이벤트 sink의 내용은 저장하지 않음 (저장 전에 flush)
+
+def _job_id(job):
+    return None if job is None else job.job_id
+
+def _stage_state(stage):
+    """후처리/포장 공정 상태: 대기열, idle 작업자 순서, 작업 중인 Job"""
+    return {
+        "queue": stage.queue.snapshot(),
+        "idle": list(stage.workers.idle),
+        "in_progress": {
+            worker_id: (job.job_id, start_time, end_time)
+            for worker_id, (job, start_time, end_time) in stage.in_progress.items()
+        },
+    }
+
+def capture_state(sim):
+    """Simulation의 현재 상태를 pickle 가능한 dict로 변환"""
+    table = sim.logs.job_table
+    generator = sim.customer.job_generator
+    return {
+        "version": CHECKPOINT_VERSION,
+        "config": vars(sim.config).copy(),
+        "now": sim.simpy_env.now,
+        "streams": sim.streams.state(),
+        "table": {
+            "columns": {name: column[:table.reserved].copy() for name, column in table.columns.items()},
+            "suitable_mask": table.suitable_mask[:table.reserved].copy(),
+            "event_job": table.event_job[:table.event_count].copy(),
+            "event_stage": table.event_stage[:table.event_count].copy(),
+            "reserved": table.reserved,
+            "size": table.size,
+        },
+        "generator": {
+            "interval": generator.interval, "start": generator.start, "cursor": generator.cursor,
+            "demand_offset": generator.demand_offset,
+        },
+        "customer": {
+            "queue": sim.customer.create_job_list.snapshot(),
+            "next_arrival": sim.customer.next_arrival,
+            "current_job_id": sim.customer.current_job_id,
+        },
+        "printers": [
+            {
+                "busy_time": printer.busy_time,
+                "current": None if printer.current is None else (
+                    printer.current[0].job_id, [job.job_id for job in printer.current[1]],
+                    printer.current[2], printer.current[3]
+                ),
+                # 고장 / 정비 상태
+                "down": None if not printer.down else (printer.down_kind, printer.down_until),
+                "aborted": None if printer.aborted is None else (
+                    printer.aborted[0].job_id, [job.job_id for job in printer.aborted[1]]
+                ),
+                "next_failure": printer.next_failure,
+                "maintenance_due": printer.maintenance_due,
+                "counters": (printer.failures, printer.down_time, printer.lost_time),
+            }
+            for printer in sim.printers
+        ],
+        "post_processing": _stage_state(sim.post_processor),
+        "packaging": _stage_state(sim.packaging),
+        "satisfication": sim.satisfication.total_satisfication,
+        "logs": {
+            "satisfication_log": list(sim.logs.satisfication_log),
+            "cost_log": list(sim.logs.cost_log),
+            "daily_cost_report": dict(sim.logs.daily_cost_report),
+        },
+        "cost": {"daily": sim.cost.daily[:sim.cost.last_day].copy(), "last_day": sim.cost.last_day},
+        "monitor": {name: stage.series() for name, stage in sim.monitor.stages.items()},
+    }
+
+def _restore_stage(stage, state, table):
+    stage.queue.restore(state["queue"], table)
+    stage.workers.idle.clear()
+    stage.workers.idle.extend(state["idle"])
+    for worker_id in stage.workers.is_busy:
+        stage.workers.is_busy[worker_id] = worker_id not in state["idle"]
+    for worker_id, (job_id, start_time, end_time) in state["in_progress"].items():
+        stage.env.process(stage.process_job(worker_id, Job(table, job_id), resume=(start_time, end_time)))
+
+def restore_state(sim, state):
+    """capture_state의 상태를 새로 만든 Simulation에 적용하고 프로세스를 다시 시작
+    (sim은 SimPy 환경 시작 시간을 state["now"]로 하여 생성되어 있어야 함)
+    """
+    # JobTable
+    table = sim.logs.job_table
+    saved = state["table"]
+    table.reserve(saved["reserved"])
+    for name, column in saved["columns"].items():
+        table.columns[name][:len(column)] = column
+    table.suitable_mask[:saved["reserved"]] = saved["suitable_mask"]
+    event_count = len(saved["event_job"])
+    if event_count > len(table.event_job):
+        table.event_job = np.zeros(event_count, dtype=np.int64)
+        table.event_stage = np.zeros(event_count, dtype=np.int8)
+    table.event_job[:event_count] = saved["event_job"]
+    table.event_stage[:event_count] = saved["event_stage"]
+    table.event_count = event_count
+    table.size = saved["size"]
+
+    # 난수 생성기 및 Job 생성기
+    sim.streams.set_state(state["streams"])
+    generator = sim.customer.job_generator
+    generator.interval = state["generator"]["interval"]
+    generator.start = state["generator"]["start"]
+    generator.cursor = state["generator"]["cursor"]
+    generator.demand_offset = state["generator"]["demand_offset"]
+
+    # 누적값
+    sim.satisfication.total_satisfication = state["satisfication"]
+    sim.logs.satisfication_log[:] = state["logs"]["satisfication_log"]
+    sim.logs.cost_log[:] = state["logs"]["cost_log"]
+    sim.logs.daily_cost_report.update(state["logs"]["daily_cost_report"])
+    daily = state["cost"]["daily"]
+    if len(daily) > len(sim.cost.daily):
+        sim.cost.daily = np.zeros((len(daily), len(sim.cost.cost_types)))
+    sim.cost.daily[:len(daily)] = daily
+    sim.cost.last_day = state["cost"]["last_day"]
+    for name, (times, busy, queue_length) in state["monitor"].items():
+        stage = sim.monitor.stages[name]
+        stage.times, stage.busy, stage.queue_length = times.copy(), busy.copy(), queue_length.copy()
+        stage.count = len(times)
+
+    # 대기열 및 작업 중인 Job (프로세스 재시작)
+    customer = sim.customer
+    customer.create_job_list.restore(state["customer"]["queue"], table)
+    customer.next_arrival = state["customer"]["next_arrival"]
+    customer.current_job_id = state["customer"]["current_job_id"]
+    for printer, saved_printer in zip(sim.printers, state["printers"]):
+        printer.busy_time = saved_printer["busy_time"]
+        printer.next_failure = saved_printer["next_failure"]
+        printer.maintenance_due = saved_printer["maintenance_due"]
+        printer.failures, printer.down_time, printer.lost_time = saved_printer["counters"]
+        if saved_printer["aborted"] is not None:
+            job_id, plate = saved_printer["aborted"]
+            printer.aborted = (Job(table, job_id), [Job(table, other) for other in plate])
+            printer.is_busy = True
+        if saved_printer["down"] is not None:
+            printer.down = True
+            printer.down_kind, printer.down_until = saved_printer["down"]
+            printer.is_busy = printer.is_busy  # idle bitmask 갱신
+            printer.env.process(printer.downtime())
+        if saved_printer["current"] is not None:
+            job_id, plate, start_time, end_time = saved_printer["current"]
+            printer.is_busy = True
+            printer.job_process = printer.env.process(printer.process_job(
+                Job(table, job_id), [Job(table, other) for other in plate], resume=(start_time, end_time)
+            ))
+    _restore_stage(sim.post_processor, state["post_processing"], table)
+    _restore_stage(sim.packaging, state["packaging"], table)
+
+def save_checkpoint(sim, path):
+    """Simulation 상태를 파일로 저장"""
+    with open(path, "wb") as file:
+        pickle.dump(capture_state(sim), file, protocol=pickle.HIGHEST_PROTOCOL)
+
+def load_checkpoint(path):
+    """checkpoint 파일의 상태 dict 읽기"""
+    with open(path, "rb") as file:
+        state = pickle.load(file)
+    if state.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"Unsupported checkpoint version: {state.get('version')}")
+    return state
@@ -0,0 +1,190 @@
+import math
+import numpy as np
+from shift_calendar import compile_calendars  # 작업자 근무 달력
+
+# Job 유형 설정의 필수 항목 (MATERIAL, LAYER_HEIGHT, INFILL은 없으면 기본값 사용)
+JOB_TYPE_KEYS = (
+    "WIDTH_RANGE", "HEIGHT_RANGE", "DEPTH_RANGE", "POST_PROCESSING_TIME_COEFFICIENT",
+    "SMALL_PACKAGING_TIME_RANGE", "LARGE_PACKAGING_TIME_RANGE", "FILAMENT_DIAMETER", "BUILD_SPEED", "DUE_DATE"
+)
+JOB_TYPE_DEFAULTS = {"MATERIAL": "PLA", "LAYER_HEIGHT": 0.2, "INFILL": 1.0}
+
+# 프린터 기술별 제작 시간 모델
+# - EXTRUSION (FDM): 볼륨 * INFILL / (BUILD_SPEED * 필라멘트 단면적)
+# - LAYER (SLA / SLS): 층 수(ceil(높이 / LAYER_HEIGHT)) * 기술의 LAYER_TIME (plate 전체가 한 층씩 동시에 출력)
+BUILD_MODELS = ("EXTRUSION", "LAYER")
+DEFAULT_TECHNOLOGY = "FDM"  # PRINTERS에 TECHNOLOGY가 없으면 사용
+
+
+# CompiledConfig 클래스: JOB_TYPES / JOB_TYPE_MIX / PRINTER_TECHNOLOGIES / PRINTERS / WORK_CALENDARS를 시작 시 한 번 검증하고
+# Job 유형(행) x 프린터 기술(열) 배열로 변환한 lookup table
+# - Job별 계산(치수 범위, 제작/후처리/포장 시간, 납기, 적합 프린터)은 dict 접근 대신 배열 indexing으로 처리
+class CompiledConfig:
+    def __init__(self, config):
+        errors = []
+        job_types = config.JOB_TYPES
+        technologies = config.PRINTER_TECHNOLOGIES
+
+        # Job 유형
+        self.type_names = list(job_types)
+        self.type_index = {name: index for index, name in enumerate(self.type_names)}
+        settings = []
+        for name in self.type_names:
+            values = {**JOB_TYPE_DEFAULTS, **job_types[name]}
+            missing = [key for key in JOB_TYPE_KEYS if key not in values]
+            if missing:
+                errors.append(f"JOB_TYPES[{name!r}] is missing {missing}")
+                continue
+            for key in ("WIDTH_RANGE", "HEIGHT_RANGE", "DEPTH_RANGE", "SMALL_PACKAGING_TIME_RANGE", "LARGE_PACKAGING_TIME_RANGE"):
+                low, high = values[key]
+                if not low < high:
+                    errors.append(f"JOB_TYPES[{name!r}][{key!r}] must satisfy low < high, got {values[key]}")
+            if not 0 < values["INFILL"] <= 1:
+                errors.append(f"JOB_TYPES[{name!r}]['INFILL'] must be in (0, 1], got {values['INFILL']}")
+            if values["LAYER_HEIGHT"] <= 0 or values["BUILD_SPEED"] <= 0:
+                errors.append(f"JOB_TYPES[{name!r}] LAYER_HEIGHT and BUILD_SPEED must be positive")
+            settings.append(values)
+
+        # 프린터 기술
+        self.technology_names = list(technologies)
+        self.technology_index = {name: index for index, name in enumerate(self.technology_names)}
+        for name, technology in technologies.items():
+            if technology.get("BUILD_MODEL") not in BUILD_MODELS:
+                errors.append(f"PRINTER_TECHNOLOGIES[{name!r}]['BUILD_MODEL'] must be one of {BUILD_MODELS}")
+            elif technology["BUILD_MODEL"] == "LAYER" and technology.get("LAYER_TIME", 0) <= 0:
+                errors.append(f"PRINTER_TECHNOLOGIES[{name!r}] needs a positive LAYER_TIME")
+
+        # 프린터 (PRINTERS 순서 = PrinterIndex의 bit 위치)
+        self.printer_technology = []
+        for printer_id, printer in config.PRINTERS.items():
+            technology = printer.get("TECHNOLOGY", DEFAULT_TECHNOLOGY)
+            if technology not in self.technology_index:
+                errors.append(f"PRINTERS[{printer_id!r}]['TECHNOLOGY'] {technology!r} is not in PRINTER_TECHNOLOGIES")
+            self.printer_technology.append(self.technology_index.get(technology, -1))
+
+        # Job 유형 비율
+        unknown = set(config.JOB_TYPE_MIX) - set(job_types)
+        if unknown:
+            errors.append(f"JOB_TYPE_MIX has unknown job type(s): {sorted(unknown)}")
+        weights = np.array([config.JOB_TYPE_MIX.get(name, 0) for name in self.type_names], dtype=float)
+        if (weights < 0).any() or weights.sum() <= 0:
+            errors.append("JOB_TYPE_MIX weights must be non-negative with a positive sum")
+        # 프린터 신뢰성: 기술별 MTBF / MTTR (PRINTERS 항목의 MTBF / MTTR가 있으면 우선)
+        self.printer_mtbf, self.printer_mttr = [], []
+        for printer_id, printer in config.PRINTERS.items():
+            values = {**config.PRINTER_RELIABILITY.get(printer.get("TECHNOLOGY", DEFAULT_TECHNOLOGY), {}), **printer}
+            mtbf, mttr = values.get("MTBF"), values.get("MTTR")
+            if config.RELIABILITY and not (mtbf and mttr and mtbf > 0 and mttr > 0):
+                errors.append(f"PRINTERS[{printer_id!r}] needs positive MTBF and MTTR (PRINTER_RELIABILITY) when RELIABILITY is on")
+            self.printer_mtbf.append(mtbf)
+            self.printer_mttr.append(mttr)
+        if config.FAILURE_POLICY not in ("RESTART", "REQUEUE"):
+            errors.append(f"FAILURE_POLICY must be 'RESTART' or 'REQUEUE', got {config.FAILURE_POLICY!r}")
+        maintenance = config.MAINTENANCE
+        if maintenance is not None and not (maintenance.get("INTERVAL", 0) > 0 and 0 < maintenance.get("DURATION", 0) < maintenance["INTERVAL"]):
+            errors.append("MAINTENANCE needs 0 < DURATION < INTERVAL")
+        # 작업자 근무 달력: 공정 이름 -> ShiftCalendar (None이면 24시간 근무)
+        self.work_calendars = compile_calendars(config, errors)
+        if errors:
+            raise ValueError("Invalid configuration:\n  " + "\n  ".join(errors))
+
+        self.type_probability = weights / weights.sum()
+        self.mixed = np.count_nonzero(weights) > 1  # 유형이 하나이면 유형 선택 난수를 사용하지 않음
+        self.single_type = int(np.argmax(weights))  # 주 유형 (비율이 가장 큰 유형)
+
+        # Job 유형별 값 (행 번호 = 유형 번호)
+        def column(key, dtype=float):
+            return np.array([values[key] for values in settings], dtype=dtype)
+
+        self.width_range = column("WIDTH_RANGE", np.int64)
+        self.height_range = column("HEIGHT_RANGE", np.int64)
+        self.depth_range = column("DEPTH_RANGE", np.int64)
+        self.small_packaging_range = column("SMALL_PACKAGING_TIME_RANGE", np.int64)
+        self.large_packaging_range = column("LARGE_PACKAGING_TIME_RANGE", np.int64)
+        self.post_processing_coefficient = column("POST_PROCESSING_TIME_COEFFICIENT")
+        self.due_date = column("DUE_DATE")
+        self.infill = column("INFILL")
+        self.layer_height = column("LAYER_HEIGHT")
+        self.materials = list(dict.fromkeys(values["MATERIAL"] for values in settings))  # 재료 코드 -> 재료 이름
+        self.material_code = {material: code for code, material in enumerate(self.materials)}
+        self.type_material = np.array([self.material_code[values["MATERIAL"]] for values in settings], dtype=np.int16)
+        self.material_type = {}  # 재료 이름 -> 그 재료를 사용하는 첫 번째 Job 유형 (주문 trace용)
+        for index, values in enumerate(settings):
+            self.material_type.setdefault(values["MATERIAL"], index)
+
+        # Job 유형 x 프린터 기술 배열
+        shape = (len(settings), len(self.technology_names))
+        self.compatible = np.zeros(shape, dtype=bool)  # 기술이 Job 유형의 재료를 출력할 수 있는지
+        self.extrusion_rate = np.full(shape, np.inf)  # EXTRUSION: 볼륨 / 시간 (LAYER 기술은 inf -> 볼륨 항 0)
+        self.layer_time = np.zeros(shape)  # LAYER: 층당 시간 (EXTRUSION 기술은 0)
+        for row, values in enumerate(settings):
+            for name, technology in technologies.items():
+                col = self.technology_index[name]
+                self.compatible[row, col] = values["MATERIAL"] in technology.get("MATERIALS", ())
+                if technology["BUILD_MODEL"] == "EXTRUSION":
+                    self.extrusion_rate[row, col] = values["BUILD_SPEED"] * 3.14 * (values["FILAMENT_DIAMETER"] / 2) ** 2
+                else:
+                    self.layer_time[row, col] = technology["LAYER_TIME"]
+
+        # Job 유형별 적합 프린터 bitmask (재료를 출력할 수 있는 기술의 프린터) 및 기본 기술 (첫 번째 적합 프린터의 기술)
+        self.type_mask = []
+        self.primary_technology = np.zeros(len(settings), dtype=np.int64)
+        for row in range(len(settings)):
+            mask = 0
+            for position, technology in enumerate(self.printer_technology):
+                if self.compatible[row, technology]:
+                    if not mask:
+                        self.primary_technology[row] = technology
+                    mask |= 1 << position
+            self.type_mask.append(mask)
+        unprintable = [self.type_names[row] for row in np.flatnonzero(weights) if not self.type_mask[row]]
+        if unprintable:
+            raise ValueError(f"Invalid configuration:\n  No printer can print job type(s) {unprintable} in JOB_TYPE_MIX")
+
+    def draw_types(self, size, rng):
+        """JOB_TYPE_MIX 비율로 size개 Job 유형 선택 (유형이 하나이면 난수를 사용하지 않음)"""
+        if not self.mixed:
+            return np.full(size, self.single_type, dtype=np.int16)
+        return rng.choice(len(self.type_names), size=size, p=self.type_probability).astype(np.int16)
+
+    def build_times(self, job_type, volume, height, technology=None):
+        """Job 배열의 제작 시간 (technology가 None이면 유형별 기본 기술 기준)"""
+        if technology is None:
+            technology = self.primary_technology[job_type]
+        layers = np.ceil(height / self.layer_height[job_type])
+        return np.rint(
+            volume * self.infill[job_type] / self.extrusion_rate[job_type, technology]
+            + layers * self.layer_time[job_type, technology]
+        ).astype(np.int64)
+
+    def build_time(self, job, technology):
+        """Job 하나의 technology 프린터 제작 시간 (기본 기술이면 JobTable 값 사용)"""
+        job_type = job.job_type
+        if technology == self.primary_technology[job_type]:
+            return job.build_time
+        layers = math.ceil(job.height / self.layer_height[job_type])
+        return int(np.rint(
+            job.volume * self.infill[job_type] / self.extrusion_rate[job_type, technology]
+            + layers * self.layer_time[job_type, technology]
+        ))
+
+    def plate_build_time(self, jobs, technology):
+        """한 plate에 배치한 Job들의 technology 프린터 제작 시간
+        (EXTRUSION: 유형별로 합친 볼륨으로 계산, LAYER: 가장 높은 Job의 층 수만큼)
+        """
+        volumes = {}
+        layers = 0
+        for job in jobs:
+            job_type = job.job_type
+            volumes[job_type] = volumes.get(job_type, 0) + job.volume
+            layers = max(layers, math.ceil(job.height / self.layer_height[job_type]) * self.layer_time[job_type, technology])
+        extrusion = sum(
+            volume * self.infill[job_type] / self.extrusion_rate[job_type, technology]
+            for job_type, volume in volumes.items()
+        )
+        return int(np.rint(extrusion + layers))
+
+
+def compile_config(config):
+    """설정을 검증하고 CompiledConfig로 변환 (잘못된 설정이면 ValueError)"""
+    return CompiledConfig(config)
@@ -9,6 +9,9 @@ import random
 # JOB_ARRIVAL_RATE: 포아송 분포의 λ 값, 단위 시간당 평균 Job 발생 수를 의미함
 # JOB_INTERVAL: Job 생성 간격 (시간 단위), 기본은 24시간 (하루에 한 번 Job 생성)
 # JOB_CREATION_INTERVAL: Job 생성 간격의 평균값 (시간 단위)
+# JOB_GENERATION_MODE: "BATCH" -> Job 속성과 도착 간격을 NumPy 배열로 chunk 단위 생성
+#                      "SCALAR" -> Job마다 개별 난수 생성 (chunk 크기 1)
+# JOB_BATCH_SIZE: BATCH 모드에서 한 번에 생성할 Job 수
 #### 주문 관련 설정 ###########################################################
 # ORDER_CYCLE: 주문이 반복되는 주기, 매일 주문이 발생하도록 설정 (일 단위)
 # ORDER_QUANTITY_RANGE: 주문 수량의 최소 및 최대 범위를 지정 (랜덤 값으로 생성)
@@ -25,6 +28,9 @@ import random
 # DEMAND_QTY_MIN: 하루 수요량의 최소값
 # DEMAND_QTY_MAX: 하루 수요량의 최대값
 # DEMAND_QTY_FUNC(): 하루 수요량을 결정하는 함수, 최소값과 최대값 사이에서 랜덤 선택
+#### Dispatcher 설정 ##########################################################
+# DISPATCH_MODE: "EVENT" -> Job 도착/프린터 작업 완료 시에만 Dispatcher 실행
+#                "POLLING" -> 1시간마다 대기열을 확인 (기존 방식)
 #### 3D 프린터 정보 설정 #######################################################
 # PRINTERS: 각 프린터의 정보 설정 (ID와 최대 처리 용량)
 # PRINTERS_INVEN: 각 프린터별 Job 대기열을 저장하는 리스트
@@ -34,6 +40,22 @@ SIM_TIME = 2  # 시뮬레이션 기간 (일 단위)
 
 # Job 생성 파라미터 설정
 JOB_CREATION_INTERVAL = 2  # 평균 1시간 간격으로 Job 생성
+JOB_GENERATION_MODE = "BATCH"  # Job 생성 방식
+JOB_BATCH_SIZE = 1024  # chunk 당 Job 수
+
+# Dispatcher 설정
+DISPATCH_MODE = "EVENT"
+# 프린터 스케줄링 정책: "FIFO" (QUEUE_POLICY["PRINTING"] 순서, 첫 번째 적합 프린터), "SPT" (제작 시간 짧은 순),
+# "EDD" (납기 빠른 순), "BEST_FIT" (build volume이 가장 작은 적합 프린터), "LEAST_LOADED" (누적 작업 시간이 가장 적은 적합 프린터)
+SCHEDULING_POLICY = "FIFO"
+
+# Build plate batching: 대기 중인 Job 여러 개를 한 프린터의 build plate(WIDTH x DEPTH)에 배치하여 한 번에 출력
+# (shelf 방식 2D bin-packing, 제작 시간은 합친 볼륨으로 계산, 출력 후 Job별로 후처리)
+BATCHING = False
+BATCH_MAX_JOBS = 8  # plate 당 최대 Job 수
+BATCH_LOOKAHEAD = 32  # plate에 배치를 시도할 대기 Job 수 (우선순위 순서)
+BATCH_SPACING = 5  # 부품 사이 간격 (mm)
+PRINT_SETUP_TIME = 0  # 출력 1회당 준비 시간 (단위: 시간, batch 여부와 관계없이 적용)
 
 # MIN, MAX RANGE / 단위: mm
 LENGHT_RANGE = {
@@ -60,9 +82,66 @@ JOB_TYPES = {
         "SMALL_PACKAGING_TIME_RANGE": (10, 20),  # SMALL 제품 포장시간 범위
         "LARGE_PACKAGING_TIME_RANGE": (20, 30),  # LARGE 제품 포장시간 범위
         "FILAMENT_DIAMETER": 1.75,
-        "BUILD_SPEED": 3600 # mm/min
+        "BUILD_SPEED": 3600, # mm/min
+        "DUE_DATE": 72,  # 납기 (Job 생성 후 시간)
+        "MATERIAL": "PLA",  # 재료 (PRINTER_TECHNOLOGIES의 MATERIALS로 출력 가능한 프린터 결정)
+        "LAYER_HEIGHT": 0.2,  # 층 높이 (mm, LAYER 방식 기술의 층 수 계산)
+        "INFILL": 1.0  # 내부 채움 비율 (0~1, EXTRUSION 방식 기술의 출력 볼륨)
+    },
+    "ABS_PART": {
+        "WIDTH_RANGE": (LENGHT_RANGE["WIDTH"]["MIN"], LENGHT_RANGE["WIDTH"]["MAX"]),
+        "HEIGHT_RANGE": (LENGHT_RANGE["HEIGHT"]["MIN"], LENGHT_RANGE["HEIGHT"]["MAX"]),
+        "DEPTH_RANGE": (LENGHT_RANGE["DEPTH"]["MIN"], LENGHT_RANGE["DEPTH"]["MAX"]),
+        "POST_PROCESSING_TIME_COEFFICIENT": 20,
+        "SMALL_PACKAGING_TIME_RANGE": (10, 20),
+        "LARGE_PACKAGING_TIME_RANGE": (20, 30),
+        "FILAMENT_DIAMETER": 1.75,
+        "BUILD_SPEED": 3000,
+        "DUE_DATE": 96,
+        "MATERIAL": "ABS",
+        "LAYER_HEIGHT": 0.2,
+        "INFILL": 0.4
+    },
+    "RESIN_DETAIL": {
+        "WIDTH_RANGE": (10, 120),
+        "HEIGHT_RANGE": (10, 150),
+        "DEPTH_RANGE": (10, 70),
+        "POST_PROCESSING_TIME_COEFFICIENT": 10,
+        "SMALL_PACKAGING_TIME_RANGE": (10, 20),
+        "LARGE_PACKAGING_TIME_RANGE": (20, 30),
+        "FILAMENT_DIAMETER": 1.75,
+        "BUILD_SPEED": 3600,
+        "DUE_DATE": 48,
+        "MATERIAL": "RESIN",
+        "LAYER_HEIGHT": 0.05,
+        "INFILL": 1.0
+    },
+    "NYLON_FUNCTIONAL": {
+        "WIDTH_RANGE": (10, 160),
+        "HEIGHT_RANGE": (10, 300),
+        "DEPTH_RANGE": (10, 160),
+        "POST_PROCESSING_TIME_COEFFICIENT": 15,
+        "SMALL_PACKAGING_TIME_RANGE": (10, 20),
+        "LARGE_PACKAGING_TIME_RANGE": (20, 30),
+        "FILAMENT_DIAMETER": 1.75,
+        "BUILD_SPEED": 3600,
+        "DUE_DATE": 120,
+        "MATERIAL": "NYLON",
+        "LAYER_HEIGHT": 0.1,
+        "INFILL": 1.0
     }
 }
+# 생성할 Job 유형의 비율 (JOB_TYPES 이름 -> 가중치, 유형이 하나이면 유형 선택 난수를 사용하지 않음)
+JOB_TYPE_MIX = {"DEFAULT": 1.0}
+
+# 프린터 기술: 제작 시간 모델과 출력 가능한 재료
+# - BUILD_MODEL "EXTRUSION": 볼륨 * INFILL / (BUILD_SPEED * 필라멘트 단면적)
+# - BUILD_MODEL "LAYER": ceil(높이 / LAYER_HEIGHT) * LAYER_TIME (plate의 Job들은 한 층씩 동시에 출력)
+PRINTER_TECHNOLOGIES = {
+    "FDM": {"BUILD_MODEL": "EXTRUSION", "MATERIALS": ("PLA", "ABS", "PETG")},
+    "SLA": {"BUILD_MODEL": "LAYER", "LAYER_TIME": 0.01, "MATERIALS": ("RESIN",)},
+    "SLS": {"BUILD_MODEL": "LAYER", "LAYER_TIME": 0.02, "MATERIALS": ("NYLON",)}
+}
 
 SATISFICATION_TYPE = {
     "POSITIVE" : 1,
@@ -80,7 +159,24 @@ COST_TYPES = {
     }
 }
 
+# 프린터 고장: RELIABILITY가 True이면 프린터마다 MTBF(평균 고장 간격) / MTTR(평균 수리 시간, 단위: 시간, 지수 분포)로 고장 발생
+# (기술별 값, PRINTERS 항목에 MTBF / MTTR가 있으면 그 값 사용)
+# FAILURE_POLICY: 출력 중 고장 시 "RESTART" (수리 후 같은 프린터에서 처음부터 다시 출력), "REQUEUE" (Job을 할당 대기열로 되돌림)
+RELIABILITY = False
+PRINTER_RELIABILITY = {
+    "FDM": {"MTBF": 2000, "MTTR": 12},
+    "SLA": {"MTBF": 3000, "MTTR": 24},
+    "SLS": {"MTBF": 2500, "MTTR": 48}
+}
+FAILURE_POLICY = "RESTART"
+# 정기 정비 (예: 노즐 교체): None이면 없음
+# 프린터 i의 정비 시작 시간 = START + i * STAGGER + k * INTERVAL, DURATION 동안 정지
+# PREEMPT가 False이면 출력 중인 프린터는 출력이 끝난 뒤 정비 (True이면 출력을 중단하고 FAILURE_POLICY로 처리,
+# INTERVAL보다 제작 시간이 긴 Job은 출력을 끝낼 수 없으므로 주의)
+MAINTENANCE = None  # 예: {"INTERVAL": 168, "DURATION": 4, "START": 0, "STAGGER": 4, "PREEMPT": False}
+
 # 3D 프린터 정보 설정, VOL: WIDTH * HEIGHT * DEPTH / 단위: mm
+# TECHNOLOGY: PRINTER_TECHNOLOGIES의 기술 이름 (없으면 "FDM")
 PRINTERS = {
     0: {"ID": 0, "VOL": 16777216, "WIDTH": 256, "HEIGHT": 256, "DEPTH": 256}, 
     1: {"ID": 1, "VOL": 9245000, "WIDTH": 215, "HEIGHT": 215, "DEPTH": 200},
@@ -109,7 +205,45 @@ PACKAGING_MACHINE = {
     2: {"ID": 2}
 }
 
+# 작업자 근무 달력: 공정별 근무 요일 / 근무 시간 / 휴식 시간 (None이면 24시간 근무)
+# - 시뮬레이션 시간 0 = 월요일 0시, DAYS: 근무 요일 (0 = 월요일 ... 6 = 일요일)
+# - SHIFTS: 하루의 근무 시간 [(시작 시, 종료 시)] (종료 시 <= 시작 시이면 다음 날까지 이어지는 야간 근무)
+# - BREAKS: 매일의 휴식 시간 [(시작 시, 종료 시)]
+# 근무 외 시간에는 진행 중인 작업이 멈췄다가 다음 근무 시작 시 이어서 처리되고, 도착한 Job은 대기열에 쌓였다가 근무 시작 시 할당됨
+WORK_CALENDARS = {
+    "POST_PROCESSING": None,  # 예: {"DAYS": (0, 1, 2, 3, 4), "SHIFTS": ((8, 17),), "BREAKS": ((12, 13),)}
+    "PACKAGING": None
+}
+
+# 대기열 방식: "FIFO" (기본), "DUE_DATE" (납기 순), "VOLUME" (볼륨 순), "CREATE_TIME" (생성 시간 순), "BUILD_TIME" (제작 시간 순)
+QUEUE_POLICY = {
+    "PRINTING": "FIFO",  # 프린터 할당 대기열 (Customer.create_job_list)
+    "POST_PROCESSING": "FIFO",
+    "PACKAGING": "FIFO"
+}
+
 PRINT_SATISFICATION = True
 VISUALIZATION = True
+GANTT_LABEL_MAX_JOBS = 200  # Job 수가 이 값보다 많으면 Gantt 차트의 막대별 라벨과 Job 범례를 생략
+# 긴 시뮬레이션용 Gantt 차트: GANTT_WINDOW_HOURS 단위 시간 창으로 나누어 저장 (None이면 전체 기간을 한 번에 표시)
+# GANTT_OUTPUT이 ".html"로 끝나면 HTML 파일 하나, 그 외에는 창별 PNG를 저장할 디렉토리
+# (보이는 작업이 많은 창은 Job별 막대 대신 리소스별 점유율로 표시)
+GANTT_WINDOW_HOURS = None
+GANTT_OUTPUT = "./gantt.html"
 PRINT_SIM_EVENTS = True
+# 이벤트 로그 sink: "CONSOLE" (PRINT_SIM_EVENTS가 True일 때 하루마다 출력), "NULL" (기록 안 함),
+# "CSV" / "BINARY" (EVENT_LOG_PATH 파일에 버퍼 단위로 기록)
+EVENT_SINK = "CONSOLE"
+EVENT_LOG_PATH = "./events.bin"
+# 결과 테이블(jobs, stages, costs, satisfication) 내보내기: None (내보내지 않음), "CSV",
+# "PARQUET" / "FEATHER" (pyarrow 필요, RESULT_EXPORT_COMPRESSION으로 압축: "zstd", "lz4" 또는 None)
+RESULT_EXPORT = None
+RESULT_EXPORT_DIR = "./results"
+RESULT_EXPORT_COMPRESSION = "zstd"
+# 주문 trace 파일 (CSV / Parquet, 열: timestamp, width, height, depth, material, due_date)로 수요 replay
+# (None이면 JOB_CREATION_INTERVAL / JOB_TYPES로 난수 생성, SIM_TIME 이후의 주문은 생성되지 않음)
+DEMAND_TRACE = None
+# 정상 상태(steady-state) KPI의 warm-up 구간: "MSER" (완료 순서 리드타임에 MSER-5 적용), 시간(숫자) 또는 None (warm-up 없음)
+WARMUP = "MSER"
+STEADY_STATE_BATCHES = 20  # batch means 신뢰구간의 batch 수
 PRINT_SIM_COST = True  # True로 설정하면 비용이 출력됨, False로 설정하면 출력되지 않음
\ No newline at end of file
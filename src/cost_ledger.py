@@ -0,0 +1,145 @@
+import numpy as np
+import pandas as pd
+from job_table import STAGES
+
+# 비용 항목 -> Job별 비용을 기록할 JobTable 열 (None: Job별로 기록하지 않음)
+COST_COLUMNS = {
+    "Holding cost": None,
+    "Printing cost": "printing_cost",
+    "Post Processing cost": "post_processing_cost",
+    "Packaging cost": "packaging_cost",
+    "Delivery cost": "delivery_cost",
+    "Shortage cost": "shortage_cost",
+}
+
+# 공정별 비용 열 (자원별 비용 집계용): 비용 열 -> STAGES의 공정 코드
+STAGE_COST_COLUMNS = {
+    "printing_cost": 0,
+    "post_processing_cost": 1,
+    "packaging_cost": 2,
+}
+
+
+def cost_functions(unit_costs):
+    """비용 항목별 비용 함수 생성 (단가는 한 번만 읽어 closure에 저장)"""
+    printing_cost = unit_costs['PRINTING_COST']
+    post_processing_cost = unit_costs['POSTPROCESSING_COST']
+    packaging_cost = unit_costs['PACKAGING_COST']
+    shortage_cost = unit_costs['SHORTAGE_COST']
+    return {
+        "Holding cost": lambda instance: instance.unit_holding_cost * instance.on_hand_inventory * (
+            instance.env.now - instance.holding_cost_last_updated),
+        "Printing cost": lambda job: (job.volume + job.build_time) * printing_cost,  # Example formula
+        "Post Processing cost": lambda job: job.post_processing_time * post_processing_cost,  # Example formula
+        # $2 for packaging if volume >= 25, $1 if volume < 25
+        "Packaging cost": lambda job: (2 if job.volume >= 25 else 1) * packaging_cost,
+        "Delivery cost": lambda job: 1,  # $1 for delivery cost
+        "Shortage cost": lambda job: job.shortage * shortage_cost,  # Example: $1 per shortage
+    }
+
+
+# CostLedger 클래스: Simulation별 비용 장부
+# - 비용 항목별 charge 함수(chargers)를 미리 만들어 두고 호출 시 바로 계산 및 기록 (문자열 비교 없음)
+# - 비용은 JobTable의 Job별 비용 열, 일별 누적 배열, daily_cost_report(하루 단위 출력용)에 동시에 기록
+# - 일별 누적 배열은 초기화하지 않으므로 clear_cost 이후에도 일별/주별/이동 합계를 조회할 수 있음
+class CostLedger:
+    def __init__(self, sim, env):
+        self.sim = sim  # 설정/로그를 가진 Simulation 객체
+        self.env = env  # SimPy 환경 객체 (비용 발생 날짜 계산용)
+        self.cost_types = list(sim.logs.daily_cost_report)  # 비용 항목 (daily_cost_report 순서)
+        self.daily = np.zeros((64, len(self.cost_types)))  # [날짜 - 1, 비용 항목] 누적 비용
+        self.last_day = 0  # 비용이 기록된 마지막 날짜
+        functions = cost_functions(sim.config.COST_TYPES[0])
+        self.chargers = {
+            cost_type: self._make_charger(index, cost_type, functions[cost_type])
+            for index, cost_type in enumerate(self.cost_types)
+        }
+
+    def _make_charger(self, type_index, cost_type, cost_function):
+        """비용 항목 하나의 charge 함수 생성 (instance: Job 또는 holding cost 계산 객체)"""
+        column = COST_COLUMNS[cost_type]
+        daily_cost_report = self.sim.logs.daily_cost_report
+
+        def charge(instance):
+            amount = cost_function(instance)
+            if column is not None:
+                instance.table.columns[column][instance.job_id] += amount  # Job별 비용
+            day = int(self.env.now // 24) + 1
+            if day > len(self.daily):
+                daily = np.zeros((max(2 * len(self.daily), day), len(self.cost_types)))
+                daily[:len(self.daily)] = self.daily
+                self.daily = daily
+            self.daily[day - 1, type_index] += amount
+            self.last_day = max(self.last_day, day)
+            daily_cost_report[cost_type] += amount
+            return amount
+
+        return charge
+
+    def cal_cost(self, instance, cost_type):
+        """비용 항목 이름으로 비용 계산 및 기록 (자주 호출하는 곳은 chargers의 함수를 미리 꺼내 사용)"""
+        return self.chargers[cost_type](instance)
+
+    def update_cost_log(self):
+        """
+        Update the cost log at the end of each day.
+        """
+        cost_log = self.sim.logs.cost_log
+        cost_log.append(sum(self.sim.logs.daily_cost_report.values()))  # Update daily total cost
+        return cost_log[-1]
+
+    def clear_cost(self):
+        """
+        Clear the daily cost report (장부의 일별 누적값은 유지).
+        """
+        daily_cost_report = self.sim.logs.daily_cost_report
+        for key in daily_cost_report.keys():
+            daily_cost_report[key] = 0
+
+    #### 조회 ####################################################################
+
+    def totals(self):
+        """비용 항목별 전체 누적 비용"""
+        return dict(zip(self.cost_types, self.daily[:self.last_day].sum(axis=0).tolist()))
+
+    def day_costs(self, day):
+        """해당 날짜(1부터 시작)의 비용 항목별 비용"""
+        if not 1 <= day <= self.last_day:
+            return dict.fromkeys(self.cost_types, 0.0)
+        return dict(zip(self.cost_types, self.daily[day - 1].tolist()))
+
+    def daily_table(self):
+        """일별 비용 DataFrame (index: DAY)"""
+        table = pd.DataFrame(self.daily[:self.last_day], columns=self.cost_types)
+        table.index = pd.RangeIndex(1, self.last_day + 1, name="DAY")
+        return table
+
+    def weekly_table(self):
+        """주별 비용 DataFrame (index: WEEK, 1주 = 1~7일)"""
+        daily = self.daily_table()
+        return daily.groupby((daily.index - 1) // 7 + 1).sum().rename_axis("WEEK")
+
+    def rolling_table(self, days=7):
+        """최근 days일 이동 합계 DataFrame (index: DAY)"""
+        return self.daily_table().rolling(days, min_periods=1).sum()
+
+    def job_table(self):
+        """Job별 비용 DataFrame (JobTable의 비용 열)"""
+        table = self.sim.logs.job_table
+        columns = {"job_id": np.arange(table.size)}
+        columns.update({
+            column: table.columns[column][:table.size] for column in COST_COLUMNS.values() if column is not None
+        })
+        return pd.DataFrame(columns)
+
+    def resource_table(self):
+        """자원(프린터, 후처리 작업자, 포장 작업자)별 비용 DataFrame"""
+        table = self.sim.logs.job_table
+        frames = []
+        for column, code in STAGE_COST_COLUMNS.items():
+            stage, resource_column, _, _ = STAGES[code]
+            resources = table.columns[resource_column][:table.size]
+            assigned = resources >= 0
+            costs = pd.Series(table.columns[column][:table.size][assigned]).groupby(resources[assigned]).sum()
+            frames.append(pd.DataFrame({"stage": stage, "resource_id": costs.index, "cost": costs.values}))
+        return pd.concat(frames, ignore_index=True)
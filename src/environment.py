@@ -1,249 +1,266 @@
 import simpy
 import numpy as np
-from config_Simpy import *  # 설정 파일 (JOB_TYPES, PRINTERS, PRINTERS_INVEN 등)
-from log_simpy import *  # 로그 파일 (DAILY_EVENTS 등)
+from job_generator import JobGenerator  # 배열 기반 Job 일괄 생성
+from job_table import Job  # JobTable 행을 가리키는 Job
+from printer_index import PrinterIndex  # 적합 프린터 bitmask index
+from job_queue import make_queue  # FIFO / 우선순위 대기열
+from scheduling import Scheduler  # 프린터 스케줄링 정책
+from worker_pool import WorkerPool  # idle 작업자 free list
+from cost_ledger import CostLedger  # 비용 장부 (Job별/일별/자원별 비용)
+from resource_monitor import ResourceMonitor  # 공정별 가동률/대기열 시계열
+from reliability import start_reliability  # 프린터 고장 / 정기 정비 프로세스
+from shift_calendar import start_shifts  # 작업자 근무 달력 프로세스
 
 # Display 클래스: 시뮬레이션 시간(일 단위)을 추적하고 일별 보고서를 기록
 class Display:
     def __init__(self, env, daily_events):
         self.env = env  # SimPy 환경 객체
-        self.daily_events = daily_events  # 일별 이벤트 로그 리스트
+        self.daily_events = daily_events  # 일별 이벤트 sink
 
     def track_days(self):
-        """현재 날짜를 추적하여 DAILY_EVENTS에 기록"""
+        """현재 날짜를 추적하여 이벤트 sink에 기록 (checkpoint에서 재개한 경우 다음 날짜 경계부터)"""
+        yield self.env.timeout(-self.env.now % 24)
         while True:
             day = int(self.env.now // 24) + 1  # 현재 시뮬레이션 시간을 일 단위로 계산
-            self.daily_events.append(f"\n===== Day {day} Report: =====")  # 일별 보고서 제목 추가
+            self.daily_events.emit(self.env.now, "day", value=day)  # 일별 보고서 제목 추가
             yield self.env.timeout(24)  # 24시간(1일)마다 실행
      
+# DispatchSignal 클래스: 상태 변화(Job 도착, 프린터 작업 완료)를 Dispatcher에 알림
+class DispatchSignal:
+    def __init__(self, env):
+        self.env = env  # SimPy 환경 객체
+        self.event = env.event()  # Dispatcher가 기다리는 이벤트
+
+    def notify(self):
+        """Dispatcher를 깨움 (같은 시점의 여러 알림은 한 번의 dispatch로 합쳐짐)"""
+        if not self.event.triggered:
+            self.event.succeed()
+
+    def reset(self):
+        """다음 상태 변화를 기다릴 새 이벤트 생성"""
+        self.event = self.env.event()
+
 # Customer 클래스: 지속적으로 Job(작업)을 생성
 class Customer:
-    def __init__(self, env, shortage_cost, daily_events, satisfication):
+    def __init__(self, env, sim, shortage_cost, daily_events, satisfication, dispatch_signal=None, printer_index=None):
         self.env = env  # SimPy 환경 객체
-        self.daily_events = daily_events  # 일별 이벤트 로그 리스트
+        self.sim = sim  # 설정/로그를 가진 Simulation 객체
+        self.daily_events = daily_events  # 일별 이벤트 sink
         self.current_job_id = 0  # Job ID 초기값
+        self.next_arrival = None  # 다음 Job 도착 시간 (checkpoint 재개용)
+        self.arrival_end = sim.config.SIM_TIME * 24  # 이 시간 이후에는 Job 생성 중단 (Simulation.run의 horizon)
         self.last_assigned_printer = -1  # 마지막으로 할당된 프린터 ID
         self.unit_shortage_cost = shortage_cost  # Shortage cost
+        self.charge_shortage_cost = sim.cost.chargers["Shortage cost"]  # 비용 계산 및 기록 함수
         self.satisfication = satisfication
-        self.create_job_list = []
+        self.dispatch_signal = dispatch_signal  # Job 도착 시 Dispatcher 호출용
+        self.printer_index = printer_index if printer_index is not None else PrinterIndex(sim.config.PRINTERS)  # 적합 프린터 검색용
+        # 스케줄링 정책 (SCHEDULING_POLICY) 및 프린터 할당 대기열 (적합 프린터 묶음별 heap)
+        self.scheduler = Scheduler(env, sim.config, self.printer_index)
+        self.create_job_list = self.scheduler.queue
+        self.type_mask = sim.compiled.type_mask  # Job 유형별 재료를 출력할 수 있는 프린터 bitmask
+        # 프린팅 공정 모니터 (바쁜 프린터 수, 프린터 할당 대기열 길이)
+        self.monitor = sim.monitor.register("Printing", len(sim.config.PRINTERS), self.printer_index.busy_count, self.create_job_list)
+        # BATCH 모드: Job 속성과 도착 간격을 chunk 단위로 미리 생성하여 JobTable에 기록
+        batch_size = sim.config.JOB_BATCH_SIZE if sim.config.JOB_GENERATION_MODE == "BATCH" else 1
+        self.job_generator = JobGenerator(
+            sim.config, sim.compiled, batch_size, sim.logs.job_table, sim.streams, sim.demand
+        )
+        # 주문 trace처럼 첫 Job 도착 시간이 정해진 demand이면 그 시간까지 대기 후 생성 시작
+        if hasattr(sim.demand, "first_arrival"):
+            self.next_arrival = sim.demand.first_arrival()
+
+    def requeue(self, job):
+        """출력이 중단된 Job을 할당 대기열로 되돌림 (FAILURE_POLICY "REQUEUE")"""
+        self.create_job_list.append(job)
+        self.monitor.update()
+        if self.dispatch_signal is not None:
+            self.dispatch_signal.notify()
 
     def create_jobs_continuously(self):
         """지속적으로 Job을 생성하고 프린터에 할당"""
-        
+        if self.next_arrival is not None:
+            # checkpoint에서 재개 (또는 trace의 첫 주문): 예정된 다음 Job 도착까지 대기
+            yield self.env.timeout(self.next_arrival - self.env.now)
+
         while True:
-            # SIM_TIME 이후에는 Job 생성 중단
-            if self.env.now >= SIM_TIME * 24:
+            # SIM_TIME(또는 run의 horizon) 이후에는 Job 생성 중단
+            if self.env.now >= self.arrival_end:
                 break
 
-            # 현재 날짜 계산
-            day = int(self.env.now // 24) + 1
-
-            # Job 생성
-            job = Job(self.env, self.current_job_id, JOB_TYPES["DEFAULT"])
-            self.current_job_id += 1
-            # JOB_LOG에 Job 기록 추가
-            JOB_LOG.append({
-                'day': day,
-                'job_id': job.job_id,
-                'width': job.width,
-                'height': job.height,
-                'depth': job.depth,
-                'create_time': job.create_time,
-                'volume': job.volume,
-                'build_time': job.build_time,
-                'post_processing_time': job.post_processing_time,
-                'packaging_time': job.packaging_time
-            })
-            # 적합한 프린터 검색
-            suitable_printers = []
-            for printer_id, printer in PRINTERS.items():
-                if job.width <= printer["WIDTH"] and job.height <= printer["HEIGHT"] and job.depth <= printer["DEPTH"]:  # Job의 볼륨이 프린터 용량 이하인지 확인
-                    suitable_printers.append(printer_id)
-                    
-            # 적합한 프린터 정보를 Job 객체에 저장
-            job.suitable_printers = suitable_printers
-            
+            # Job 생성 (JobTable에 기록되며 JOB_LOG는 이를 읽는 view)
+            job, interval = self.job_generator.next_job(self.env.now)
+            if job is None:
+                break  # 미리 생성한 수요(DemandStream)를 모두 사용
+            self.current_job_id = job.job_id + 1
+            # 적합한 프린터 검색 (치수별 이진 탐색 + bitmask AND, Job 유형의 재료를 출력할 수 있는 기술의 프린터만)
+            job.suitable_mask = self.printer_index.fit_mask(job.width, job.height, job.depth) & self.type_mask[job.job_type]
+
             # 프린터 할당
-            if suitable_printers:
+            if job.suitable_mask:
                 self.create_job_list.append(job)
+                self.monitor.update()
+                if self.dispatch_signal is not None:
+                    self.dispatch_signal.notify()  # 새 Job 도착 알림
 
             else:
                 # Shortage cost 발생: 적합한 프린터가 없을 때
-                self.daily_events.append(
-                    f"Job {job.job_id} could not be assigned: No suitable printer available (Job size: {job.volume:.2f})"
-                )
+                self.daily_events.emit(self.env.now, "shortage", job.job_id, value=job.volume)
                 # Shortage cost 발생
                 job.shortage = 1  # Shortage는 한 번에 한 프린터가 부족할 때 1로 설정
                 
-                Cost.cal_cost(job, "Shortage cost")
+                self.charge_shortage_cost(job)
                 
                 # 고객 만족도 계산
                 self.satisfication.cal_satisfication(job, self.env.now)
 
             # 다음 Job 생성 간격 (지수 분포 사용)
-            interval = np.random.exponential(JOB_CREATION_INTERVAL)
+            self.next_arrival = self.env.now + interval
             yield self.env.timeout(interval)
 
+# WorkerStage 클래스: 작업자 pool(WorkerPool)과 근무 달력(calendar)을 가진 공정의 공통 메서드
+# - 하위 클래스(PostProcessing / Packaging)는 env, queue, workers, monitor, calendar 속성과 start_job 메서드를 가짐
+class WorkerStage:
+    def on_shift(self):
+        """현재 근무 시간인지"""
+        return self.calendar is None or self.calendar.is_working(self.env.now)
+
+    def finish_time(self, duration):
+        """지금 시작한 duration 시간 작업의 종료 시간 (근무 외 시간에는 작업이 멈춤)"""
+        if self.calendar is None:
+            return self.env.now + duration
+        return self.calendar.finish_time(self.env.now, duration)
+
+    def start_shift(self):
+        """근무 시작: 근무 외 시간에 쌓인 Job을 비어 있는 작업자에게 할당"""
+        while self.queue and self.workers.idle_count():
+            self.start_job(self.workers.acquire(), self.queue.pop())
+        self.monitor.update()
+
+    def finish_job(self, worker_id):
+        """작업을 마친 작업자에게 대기열의 다음 Job을 할당하거나 free list에 반환 (근무 외 시간이면 반환)"""
+        if self.queue and self.on_shift():
+            self.start_job(worker_id, self.queue.pop())  # 대기열에서 다음 작업을 꺼냄
+        else:
+            self.workers.release(worker_id)
+        self.monitor.update()
+
 # PostProcessing 클래스: 후처리 작업을 관리
-class PostProcessing:
-    def __init__(self, env, post_processing_cost, daily_events, packaging):
+class PostProcessing(WorkerStage):
+    def __init__(self, env, sim, post_processing_cost, daily_events, packaging):
         self.env = env  # SimPy 환경 객체
-        self.daily_events = daily_events  # 일별 이벤트 로그 리스트
-        self.workers = {worker_id: {"is_busy": False} for worker_id in POST_PROCESSING_WORKER.keys()}
-        self.queue = []  # 대기열
+        self.sim = sim  # 설정/로그를 가진 Simulation 객체
+        self.daily_events = daily_events  # 일별 이벤트 sink
+        self.workers = WorkerPool(sim.config.POST_PROCESSING_WORKER.keys())  # idle 작업자 free list
+        self.queue = make_queue(env, sim.config.QUEUE_POLICY["POST_PROCESSING"])  # 대기열
         self.packaging = packaging  # Packaging 객체 참조
         self.unit_post_processing_cost = post_processing_cost
+        self.monitor = sim.monitor.register("Post-Processing", len(sim.config.POST_PROCESSING_WORKER), self.workers.busy_count, self.queue)
+        self.in_progress = {}  # 작업자 ID -> (Job, 시작 시간, 종료 시간)
+        self.charge_cost = sim.cost.chargers["Post Processing cost"]  # 비용 계산 및 기록 함수
+        self.calendar = sim.compiled.work_calendars["POST_PROCESSING"]  # 근무 달력 (None이면 24시간 근무)
+
+    def backlog(self):
+        """대기 중인 Job 수와 가장 오래 기다린 Job의 대기 시간 (O(1))"""
+        return len(self.queue), self.queue.oldest_age()
 
     def assign_job(self, job):
         """작업자에게 Job을 할당"""
-        for worker_id, worker in self.workers.items():
-            if not worker["is_busy"]:
-                worker["is_busy"] = True
-                self.daily_events.append(
-                    f"{int(self.env.now % 24)}:{int((self.env.now % 1) * 60):02d} - Job {job.job_id} is starting on Worker {worker_id} (Post-processing)"
-                )
-                self.env.process(self.process_job(worker_id, job))
-                return True
-        self.queue.append(job)  # 모든 작업자가 바쁠 경우 대기열에 추가
-        return False
-
-    def process_job(self, worker_id, job):
-        """Job 처리"""
-        start_time = self.env.now
-        yield self.env.timeout(job.post_processing_time)  # 후처리 시간 대기
-        end_time = self.env.now
-        self.daily_events.append(
-            f"{int(self.env.now % 24)}:{int((self.env.now % 1) * 60):02d} - Job {job.job_id} is finishing on Worker {worker_id} (Post-processing)"
-        )
-        # DAILY_REPORTS에 기록
-        DAILY_REPORTS.append({
-            'job_id': job.job_id,
-            'worker_id': worker_id,
-            'start_time': start_time,
-            'end_time': end_time,
-            'process': 'Post-Processing'
-        })
+        worker_id = self.workers.acquire() if self.on_shift() else None  # 비어 있는 작업자 (O(1))
+        if worker_id is None:
+            self.queue.append(job)  # 모든 작업자가 바쁘거나 근무 외 시간이면 대기열에 추가
+            self.monitor.update()
+            return False
+        self.start_job(worker_id, job)
+        self.monitor.update()
+        return True
+
+    def start_job(self, worker_id, job):
+        """작업자에게 Job 처리 시작"""
+        self.daily_events.emit(self.env.now, "post_processing_start", job.job_id, worker_id)
+        self.env.process(self.process_job(worker_id, job))
+
+    def process_job(self, worker_id, job, resume=None):
+        """Job 처리 (resume: checkpoint에서 재개한 작업의 (시작 시간, 종료 시간))"""
+        start_time, end_time = resume or (self.env.now, self.finish_time(job.post_processing_time))
+        self.in_progress[worker_id] = (job, start_time, end_time)
+        yield self.env.timeout(end_time - self.env.now)  # 후처리 시간 대기
+        del self.in_progress[worker_id]
+        self.daily_events.emit(end_time, "post_processing_finish", job.job_id, worker_id)
+        # DAILY_REPORTS에 기록 (JobTable)
+        job.table.record_stage(job.job_id, "Post-Processing", worker_id, start_time, end_time)
         # Post Processing 비용 계산
-        Cost.cal_cost(job, "Post Processing cost")
-        self.workers[worker_id]["is_busy"] = False
+        self.charge_cost(job)
 
         # 후처리 완료 후 포장 작업에 전달
         self.packaging.assign_job(job)
 
-        # 대기열에 Job이 있으면 다음 작업 처리
-        if self.queue:
-            # 대기열에 작업이 있는 경우
-            next_job = self.queue.pop(0)  # 대기열에서 첫 번째 작업을 꺼냄
-
-            # 모든 작업자에 대해 is_busy 상태를 확인
-            for worker_id, worker in self.workers.items():
-                if not worker["is_busy"]:  # 작업자가 비어 있으면
-                    self.workers[worker_id]["is_busy"] = True  # 작업할당
-                    self.env.process(self.process_job(worker_id, next_job))  # 새로운 작업 처리
-                    break  # 첫 번째 비어 있는 작업자에게 할당하고 종료
+        # 대기열에 Job이 있으면 같은 작업자가 바로 다음 작업 처리, 없으면 free list에 반환
+        self.finish_job(worker_id)
 
 # Packaging 클래스: 포장 작업을 관리
-class Packaging:
-    def __init__(self, env, packaging_cost, daily_events, satisfication):
+class Packaging(WorkerStage):
+    def __init__(self, env, sim, packaging_cost, daily_events, satisfication):
         self.env = env  # SimPy 환경 객체
-        self.daily_events = daily_events  # 일별 이벤트 로그 리스트
-        self.workers = {worker_id: {"is_busy": False} for worker_id in PACKAGING_MACHINE.keys()}
+        self.sim = sim  # 설정/로그를 가진 Simulation 객체
+        self.daily_events = daily_events  # 일별 이벤트 sink
+        self.workers = WorkerPool(sim.config.PACKAGING_MACHINE.keys())  # idle 작업자 free list
         self.unit_packaging_cost = packaging_cost
-        self.queue = []  # 대기열
+        self.charge_cost = sim.cost.chargers["Packaging cost"]  # 비용 계산 및 기록 함수
+        self.queue = make_queue(env, sim.config.QUEUE_POLICY["PACKAGING"])  # 대기열
+        self.monitor = sim.monitor.register("Packaging", len(sim.config.PACKAGING_MACHINE), self.workers.busy_count, self.queue)
+        self.in_progress = {}  # 작업자 ID -> (Job, 시작 시간, 종료 시간)
         self.satisfication = satisfication
+        self.calendar = sim.compiled.work_calendars["PACKAGING"]  # 근무 달력 (None이면 24시간 근무)
+
+    def backlog(self):
+        """대기 중인 Job 수와 가장 오래 기다린 Job의 대기 시간 (O(1))"""
+        return len(self.queue), self.queue.oldest_age()
 
     def assign_job(self, job):
         """포장 작업자에게 Job을 할당"""
-        for worker_id, worker in self.workers.items():
-            if not worker["is_busy"]:
-                worker["is_busy"] = True
-                self.daily_events.append(
-                    f"{int(self.env.now % 24)}:{int((self.env.now % 1) * 60):02d} - Job {job.job_id} is starting on Worker {worker_id} (Packaging)"
-                )
-                self.env.process(self.process_job(worker_id, job))
-                return True
-        self.queue.append(job)  # 모든 작업자가 바쁠 경우 대기열에 추가
-        return False
-
-    def process_job(self, worker_id, job):
-        """Job 포장 처리"""
-        start_time = self.env.now
-        yield self.env.timeout(job.packaging_time / 60)  # 포장 시간을 시간 단위로 변환
-        end_time = self.env.now
-        self.daily_events.append(
-            f"{int(end_time % 24)}:{int((end_time % 1) * 60):02d} - Job {job.job_id} is finishing on Worker {worker_id} (Packaging) & End_Time: s{end_time: .4f}"
-        )
-        # DAILY_REPORTS에 기록
-        DAILY_REPORTS.append({
-            'job_id': job.job_id,
-            'worker_id': worker_id,
-            'start_time': start_time,
-            'end_time': end_time,
-            'process': 'Packaging'
-        })
+        worker_id = self.workers.acquire() if self.on_shift() else None  # 비어 있는 작업자 (O(1))
+        if worker_id is None:
+            self.queue.append(job)  # 모든 작업자가 바쁘거나 근무 외 시간이면 대기열에 추가
+            self.monitor.update()
+            return False
+        self.start_job(worker_id, job)
+        self.monitor.update()
+        return True
+
+    def start_job(self, worker_id, job):
+        """작업자에게 Job 처리 시작"""
+        self.daily_events.emit(self.env.now, "packaging_start", job.job_id, worker_id)
+        self.env.process(self.process_job(worker_id, job))
+
+    def process_job(self, worker_id, job, resume=None):
+        """Job 포장 처리 (resume: checkpoint에서 재개한 작업의 (시작 시간, 종료 시간))"""
+        start_time, end_time = resume or (self.env.now, self.finish_time(job.packaging_time / 60))  # 포장 시간을 시간 단위로 변환
+        self.in_progress[worker_id] = (job, start_time, end_time)
+        yield self.env.timeout(end_time - self.env.now)
+        del self.in_progress[worker_id]
+        self.daily_events.emit(end_time, "packaging_finish", job.job_id, worker_id)
+        # DAILY_REPORTS에 기록 (JobTable)
+        job.table.record_stage(job.job_id, "Packaging", worker_id, start_time, end_time)
         # Packaging 비용 계산
-        Cost.cal_cost(job, "Packaging cost")
+        self.charge_cost(job)
 
         # 고객 만족도 계산
         self.satisfication.cal_satisfication(job, end_time)
-        self.workers[worker_id]["is_busy"] = False
-
-        # 대기열에서 다음 Job 처리
-        if self.queue:
-            # 대기열에 작업이 있는 경우
-            next_job = self.queue.pop(0)  # 대기열에서 첫 번째 작업을 꺼냄
-
-            # 모든 작업자에 대해 is_busy 상태를 확인
-            for worker_id, worker in self.workers.items():
-                if not worker["is_busy"]:  # 작업자가 비어 있으면
-                    self.workers[worker_id]["is_busy"] = True  # 작업할당
-                    self.env.process(self.process_job(worker_id, next_job))  # 새로운 작업 처리
-                    break  # 첫 번째 비어 있는 작업자에게 할당하고 종료
-
-# Job 클래스: Job의 속성을 정의
-class Job:
-    def __init__(self, env, job_id, config):
-        self.env = env  # SimPy 환경 객체
-        self.job_id = job_id  # Job ID
-        self.create_time = env.now  # Job 생성 시간 기록
-        self.suitable_printers = []
-        self.height = np.random.randint(*config["HEIGHT_RANGE"])
-        self.width = np.random.randint(*config["WIDTH_RANGE"])
-        self.depth = np.random.randint(*config["DEPTH_RANGE"])
-        self.volume = (
-                         self.height
-                       * self.width
-                       * self.depth
-                       )# Job 볼륨
-        self.build_time = int(round(self.volume / (config["BUILD_SPEED"] 
-                                         * 3.14 
-                                         * (config["FILAMENT_DIAMETER"]/2)**2
-                                         )))  # 제작 시간        
-        self.post_processing_time = np.mean([self.height, self.width, self.depth]) // (config["POST_PROCESSING_TIME_COEFFICIENT"])  # 후처리 시간
-
-        if self.volume <= (LENGHT_RANGE["WIDTH"]["MAX"] * LENGHT_RANGE["HEIGHT"]["MAX"] * LENGHT_RANGE["DEPTH"]["MAX"])/2:
-            self.packaging_time = np.random.randint(*config["SMALL_PACKAGING_TIME_RANGE"])  # 포장 시간
-
-        elif ((LENGHT_RANGE["WIDTH"]["MAX"] * LENGHT_RANGE["HEIGHT"]["MAX"] * LENGHT_RANGE["DEPTH"]["MAX"])/2 + 1 
-              <= self.volume 
-              <= (LENGHT_RANGE["WIDTH"]["MAX"] * LENGHT_RANGE["HEIGHT"]["MAX"] * LENGHT_RANGE["DEPTH"]["MAX"])):
-            self.packaging_time = np.random.randint(*config["LARGE_PACKAGING_TIME_RANGE"])  # 포장 시간
-
-        # 추가: 비용 항목들 초기화
-        self.printing_cost = 0
-        self.post_processing_cost = 0
-        self.packaging_cost = 0
-        self.delivery_cost = 0
-        self.shortage_cost = 0
-        self.shortage = 0  # 부족 수량 (Shortage Cost 계산용)
 
+        # 대기열에서 다음 Job 처리 (같은 작업자에게 바로 할당)
+        self.finish_job(worker_id)
 
 # Printer 클래스: 프린터의 작업 처리
 class Printer:
-    def __init__(self, env, printing_cost, daily_events, printer_id, width, height, depth, post_processor):
+    def __init__(self, env, sim, printing_cost, daily_events, printer_id, width, height, depth, post_processor, dispatch_signal=None, printer_index=None, requeue=None):
         self.env = env
+        self.sim = sim  # 설정/로그를 가진 Simulation 객체
         self.daily_events = daily_events
         self.printer_id = printer_id
+        self.printer_index = printer_index  # idle 상태를 bitmask로 공유하는 PrinterIndex
+        # 프린터 기술 번호 (CompiledConfig.technology_names 순서, 제작 시간 모델 선택)
+        self.technology = sim.compiled.printer_technology[list(sim.config.PRINTERS).index(printer_id)]
         
         # 프린터의 최대 치수
         self.width = width
@@ -251,26 +268,101 @@ class Printer:
         self.depth = depth
         
         # 바쁨 상태 및 대기열
-        self.is_busy = False
+        self._is_busy = False
+
+        # 고장 / 정비 상태 (reliability.py의 프로세스가 start_downtime 호출)
+        self.down = False  # 고장 수리 또는 정비 중
+        self.down_kind = None  # "failure" / "maintenance"
+        self.down_until = None  # 정지가 끝나는 시간
+        self.next_failure = None  # 다음 고장 시간 (고장 프로세스가 사용)
+        self.maintenance_due = None  # 출력이 끝나면 시작할 정비 시간 (출력 중 정비 시간이 된 경우)
+        self.aborted = None  # 수리 후 다시 출력할 (Job, plate) (FAILURE_POLICY "RESTART")
+        self.requeue = requeue  # Job을 할당 대기열로 되돌리는 함수 (FAILURE_POLICY "REQUEUE")
+        self.job_process = None  # 출력 프로세스 (고장 시 interrupt)
+        self.failures = 0  # 고장 횟수
+        self.down_time = 0  # 누적 정지 시간
+        self.lost_time = 0  # 중단되어 버려진 출력 시간
         
         self.post_processor = post_processor
         self.unit_printing_cost = printing_cost
+        self.charge_cost = sim.cost.chargers["Printing cost"]  # 비용 계산 및 기록 함수
+        self.monitor = sim.monitor.stages["Printing"]  # 프린팅 공정 모니터 (Customer에서 등록)
+        self.dispatch_signal = dispatch_signal  # 작업 완료 시 Dispatcher 호출용
+        self.busy_time = 0  # 누적 작업 시간 (LEAST_LOADED 정책용, 할당 시점에 더함)
+        self.current = None  # 출력 중인 (Job, plate, 시작 시간, 종료 시간)
+
+    @property
+    def is_busy(self):
+        return self._is_busy
+
+    @is_busy.setter
+    def is_busy(self, value):
+        """바쁨 상태 변경 시 PrinterIndex의 idle bitmask도 갱신"""
+        self._is_busy = value
+        self._update_idle()
+
+    def _update_idle(self):
+        """출력 중도 아니고 정지 중도 아닐 때만 idle (Dispatcher가 할당 가능), 정지 중이면 busy로 세지 않음"""
+        if self.printer_index is not None:
+            position = self.printer_index.position[self.printer_id]
+            self.printer_index.set_idle(position, not (self._is_busy or self.down))
+            self.printer_index.set_down(position, self.down)
+
+    def start_downtime(self, kind, duration):
+        """고장(kind="failure") 또는 정비("maintenance")로 duration 동안 프린터 정지 (출력 중이면 출력 프로세스 interrupt)"""
+        self.down = True
+        self.down_kind = kind
+        self.down_until = self.env.now + duration
+        self.down_time += duration
+        self._update_idle()
+        self.monitor.update()  # 정지 중인 프린터는 busy로 세지 않음
+        self.daily_events.emit(self.env.now, kind + "_start", -1, self.printer_id, value=duration)
+        if self.current is not None:
+            self.job_process.interrupt(kind)
+        self.env.process(self.downtime())
+
+    def downtime(self):
+        """정지가 끝날 때까지 대기한 뒤 중단된 출력을 다시 시작하거나 idle 상태로 복귀"""
+        yield self.env.timeout(self.down_until - self.env.now)
+        self.daily_events.emit(self.env.now, self.down_kind + "_end", -1, self.printer_id)
+        self.down = False
+        self.down_kind = None
+        self.down_until = None
+        self._update_idle()
+        self.monitor.update()
+        if self.aborted is not None:
+            # FAILURE_POLICY "RESTART": 같은 Job(plate)을 처음부터 다시 출력
+            job, plate = self.aborted
+            self.aborted = None
+            self.job_process = self.env.process(self.process_job(job, plate))
+        elif self.dispatch_signal is not None:
+            self.dispatch_signal.notify()
+
+    def request_maintenance(self, duration, preempt=False):
+        """정기 정비 시간 도착: 출력 중이면 출력이 끝난 뒤 정비 (preempt이면 즉시), 이미 정지 중이면 건너뜀"""
+        if self.down:
+            return
+        if self.is_busy and not preempt:
+            self.maintenance_due = duration
+        else:
+            self.start_downtime("maintenance", duration)
 
-    def assign_job(self, job):
-        self.daily_events.append(
-            f"[{self.env.now}] Job {job.job_id} is assigned to Printer {self.printer_id}."
-        )
+    def assign_job(self, job, plate=()):
+        """Job 할당 (plate: 같은 build plate에 함께 출력할 Job 목록)"""
+        self.daily_events.emit(self.env.now, "printer_assigned", job.job_id, self.printer_id)
+        for other in plate:
+            self.daily_events.emit(self.env.now, "printer_assigned", other.job_id, self.printer_id)
 
         if not self.is_busy:
             # 프린터가 비어 있으면 즉시 처리
             self.is_busy = True
-            self.env.process(self.process_job(job))
+            self.job_process = self.env.process(self.process_job(job, plate))
+            return True
         else:
             # 이미 바쁜 상태라면 어떻게 처리할지 결정
             # 예) 로그만 남김, 혹은 다른 프린터 찾기, 에러 처리 등
-            self.daily_events.append(
-                f"[{self.env.now}] Printer {self.printer_id} is busy. Job {job.job_id} cannot be processed right now."
-            )
+            self.daily_events.emit(self.env.now, "printer_busy", job.job_id, self.printer_id)
+            return False
         '''
         if Customer.create_job_list and len(self.job_list) == 0:
             for job in Customer.create_job_list:
@@ -295,81 +387,83 @@ class Printer:
             self.job_list.append(appending_job)
             Customer.create_job_list.remove(appending_job)
         '''    
-    def process_job(self, job):
+    def process_job(self, job, plate=(), resume=None):
         """
         실제 Job을 처리하는 메서드.
+        plate가 있으면 모든 Job을 한 번에 출력 (제작 시간은 합친 볼륨으로 계산)하고, 완료 후 Job별로 후처리에 전달.
+        resume: checkpoint에서 재개한 출력의 (시작 시간, 종료 시간)
         """
-        start_time = self.env.now
-        self.daily_events.append(
-            f"[{start_time}] Printer {self.printer_id} starts printing Job {job.job_id}."
-        )
+        jobs = [job, *plate]
+        if resume is None and self.down:
+            # 할당과 같은 시간에 고장 / 정비가 시작되어 출력을 시작하기 전에 정지됨:
+            # FAILURE_POLICY에 따라 수리 후 출력하거나 ("RESTART") 할당 대기열로 되돌림 ("REQUEUE")
+            if self.sim.config.FAILURE_POLICY == "REQUEUE":
+                self.is_busy = False
+                for queued in jobs:
+                    self.requeue(queued)
+            else:
+                self.aborted = (job, list(plate))
+            return
+        if resume is None:
+            start_time = self.env.now
+            if plate:
+                build_time = self.sim.compiled.plate_build_time(jobs, self.technology)
+                self.daily_events.emit(start_time, "plate_batch", job.job_id, self.printer_id, value=len(jobs))
+            else:
+                build_time = self.sim.compiled.build_time(job, self.technology)
+            build_time += self.sim.config.PRINT_SETUP_TIME  # 출력 1회당 준비 시간
+            self.busy_time += build_time
+            for printed in jobs:
+                self.daily_events.emit(start_time, "printing_start", printed.job_id, self.printer_id)
+            end_time = start_time + build_time
+        else:
+            start_time, end_time = resume
+        self.current = (job, list(plate), start_time, end_time)
 
         # 예: job.build_time만큼 소요 (단위에 맞춰 조정)
-        yield self.env.timeout(job.build_time)
-
-        end_time = self.env.now
-        self.is_busy = False
-        self.daily_events.append(
-            f"[{end_time}] Printer {self.printer_id} finished printing Job {job.job_id}."
-        )
-
-        # 후처리
-        self.post_processor.assign_job(job)
-
-
-class Cost:
-    # Class for managing costs in the simulation
-    def cal_cost(instance, cost_type):
-        """
-        Calculate and log different types of costs.
-        """
-
-        if cost_type == "Holding cost":
-            # Calculate holding cost
-            DAILY_COST_REPORT[cost_type] += instance.unit_holding_cost * instance.on_hand_inventory * (
-                instance.env.now - instance.holding_cost_last_updated)
-        elif cost_type == "Printing cost":
-            # Calculate processing cost
-            DAILY_COST_REPORT[cost_type] += (instance.volume + instance.build_time) * COST_TYPES[0]['PRINTING_COST']  # Example formula
-        elif cost_type == "Post Processing cost":
-            # Calculate delivery cost
-            DAILY_COST_REPORT[cost_type] += instance.post_processing_time * COST_TYPES[0]['POSTPROCESSING_COST']  # Example formula
-        elif cost_type == "Delivery cost":
-            # Calculate order cost
-            DAILY_COST_REPORT[cost_type] += 1  # $1 for delivery cost
-        elif cost_type == "Packaging cost":
-            # Calculate order cost
-            if instance.volume >= 25:
-                DAILY_COST_REPORT[cost_type] += 2 * COST_TYPES[0]['PACKAGING_COST'] # $2 for packaging if volume >= 25
+        try:
+            yield self.env.timeout(end_time - self.env.now)
+        except simpy.Interrupt:
+            # 고장 / 정비로 출력 중단: 출력물은 버리고 FAILURE_POLICY에 따라 다시 출력하거나 대기열로 되돌림
+            self.current = None
+            self.lost_time += self.env.now - start_time
+            requeue = self.sim.config.FAILURE_POLICY == "REQUEUE"
+            for printed in jobs:
+                self.daily_events.emit(self.env.now, "print_aborted", printed.job_id, self.printer_id, value=requeue)
+            if requeue:
+                self.is_busy = False  # 정지 중이므로 수리가 끝날 때까지 idle이 아님
+                for printed in jobs:
+                    self.requeue(printed)
             else:
-                DAILY_COST_REPORT[cost_type] += 1 * COST_TYPES[0]['PACKAGING_COST'] # $1 for packaging if volume < 25
-        elif cost_type == "Shortage cost":
-            # Calculate shortage cost
-            DAILY_COST_REPORT[cost_type] += instance.shortage * COST_TYPES[0]['SHORTAGE_COST']  # Example: $1 per shortage
-
-
-    def update_cost_log():
-        """
-        Update the cost log at the end of each day.
-        """
-        COST_LOG.append(0)
-        # Update daily total cost
-        for key in DAILY_COST_REPORT.keys():
-            COST_LOG[-1] += DAILY_COST_REPORT[key]
+                self.aborted = (job, list(plate))
+            return
 
-        return COST_LOG[-1]
+        self.current = None
+        self.is_busy = False
+        if self.maintenance_due is not None:
+            # 출력 중 정비 시간이 되었으면 바로 정비 시작 (Dispatcher가 할당하기 전에 정지 상태로 변경)
+            duration, self.maintenance_due = self.maintenance_due, None
+            self.start_downtime("maintenance", duration)
+        self.monitor.update()
+        for printed in jobs:
+            self.daily_events.emit(end_time, "printing_finish", printed.job_id, self.printer_id)
+            # DAILY_REPORTS에 기록 (JobTable)
+            printed.table.record_stage(printed.job_id, "Printing", self.printer_id, start_time, end_time)
+            # Printing 비용 계산
+            self.charge_cost(printed)
+
+            # 후처리
+            self.post_processor.assign_job(printed)
+
+        # 프린터가 비었으므로 대기 중인 Job 할당 요청
+        if self.dispatch_signal is not None:
+            self.dispatch_signal.notify()
 
-    def clear_cost():
-        """
-        Clear the daily cost report.
-        """
-        # Clear daily report
-        for key in DAILY_COST_REPORT.keys():
-            DAILY_COST_REPORT[key] = 0
 
 class Satisfication:
-    def __init__(self, env, daily_events):
+    def __init__(self, env, sim, daily_events):
         self.env = env
+        self.sim = sim  # 설정/로그를 가진 Simulation 객체
         self.daily_events = daily_events
         self.total_satisfication = 0
 
@@ -377,80 +471,91 @@ class Satisfication:
         
         """고객 만족도 계산 및 기록"""
         if job.create_time is not None and end_time is not None and (job.create_time != end_time):
-            satisfication = SATISFICATION_TYPE["POSITIVE"] / (end_time - job.create_time)
+            satisfication = self.sim.config.SATISFICATION_TYPE["POSITIVE"] / (end_time - job.create_time)
             self.total_satisfication += satisfication
-            self.daily_events.append(
-                f"Job {job.job_id}: Satisfication calculated as {satisfication:.4f}\nTotal Satisfication: {self.total_satisfication: .4f}"
-            )
+            self.daily_events.emit(end_time, "satisfication", job.job_id, value=satisfication, aux=self.total_satisfication)
         
         elif job.create_time == end_time:
-            satisfication = SATISFICATION_TYPE["NEGATIVE"]
+            satisfication = self.sim.config.SATISFICATION_TYPE["NEGATIVE"]
             self.total_satisfication += satisfication
-            self.daily_events.append(
-                f"Job {job.job_id}: No printer assigned, satisfication set to {satisfication:.4f}\nTotal Satisfication: {self.total_satisfication: .4f}"
-            )
+            self.daily_events.emit(end_time, "no_satisfication", job.job_id, value=satisfication, aux=self.total_satisfication)
+        else:
+            satisfication = 0
+        job.satisfication = satisfication  # JobTable에 Job별 만족도 기록
+        self.sim.logs.satisfication_log.append(self.total_satisfication)
+
+def dispatch_jobs(env, customer, printers, daily_events):
+    """대기 중인 Job을 비어 있는 적합한 프린터에 할당 (스케줄링 정책에 따라 Job과 프린터 선택)
+    - idle 프린터에 들어갈 수 있는 Job이 없을 때까지 반복 (할당 한 번에 O(C + log n))
+    """
+    while True:
+        assignment = customer.scheduler.next_assignment(printers)  # 대기열에서 꺼낸 Job과 프린터
+        if assignment is None:
+            break
+        job, position = assignment
+        plate = customer.scheduler.fill_plate(job, position)  # 같은 build plate에 배치할 Job (BATCHING)
+        printers[position].assign_job(job, plate)
 
-        SATISFICATION_LOG.append(self.total_satisfication)
+    customer.monitor.update()
 
 def job_dispatcher(env, customer, printers, daily_events):
-    
+    """1시간마다 대기열을 확인하는 polling 방식 Dispatcher"""
     while True:
         # create_job_list가 비어있지 않은 경우
         if customer.create_job_list:
-            # 현재 queue(리스트)를 복사해서 for문에서 안전하게 순회하기 위함
-            job_list_snapshot = list(customer.create_job_list)
-            
-            for job in job_list_snapshot:
-                assigned = False
-            
-                # job.suitable_printers에 있는 프린터 중 현재 is_busy가 False인 곳 탐색
-                for printer_obj in printers:
-                    # Printer의 ID가 job의 suitable_printers 중 하나인지 체크
-                    if (printer_obj.printer_id in job.suitable_printers and printer_obj.is_busy == False):
-                        success = printer_obj.assign_job(job)
-                        
-                        if success:
-                            # 성공적으로 활당되면 create_job_list에서 제거
-                            customer.create_job_list.remove(job)
-                            assigned = True
-                            break # 해당 job을 처리했으므로 프린터 탐색 종료 
-                        
-                if not assigned:
-                    # 이 Job을 할당할 수 있는 프린터가 없는 경우
-                    daily_events.append(
-                        f"Dispatcher: No available printer for Job {job.job_id} at time {env.now}. "
-                        f"Will re-check after some delay."
-                    )
-                    
-            # 모든 job을 한 차례 확인한 뒤 잠시 대기
-            yield env.timeout(1)
-            
-        else:
-            # 대기 열이 비었다면 일정 시간 대기
-            yield env.timeout(1)
-                
+            dispatch_jobs(env, customer, printers, daily_events)
+
+        # 모든 job을 한 차례 확인한 뒤 잠시 대기
+        yield env.timeout(1)
+
+def event_job_dispatcher(env, customer, printers, daily_events, dispatch_signal):
+    """Job 도착 또는 프린터 작업 완료 시에만 실행되는 이벤트 기반 Dispatcher"""
+    while True:
+        # 상태 변화가 있을 때까지 대기
+        yield dispatch_signal.event
+        dispatch_signal.reset()
+
+        if customer.create_job_list:
+            dispatch_jobs(env, customer, printers, daily_events)
+
 
 # 환경 생성 함수
-def create_env(daily_events):
+def create_env(sim, initial_time=0):
     """
-    SimPy 환경 및 객체를 생성하고 초기화합니다.
+    Simulation 객체(sim)의 설정과 로그로 SimPy 환경 및 객체를 생성하고 초기화합니다.
+    생성된 객체는 sim에도 저장됩니다. (initial_time: checkpoint에서 재개할 때의 시작 시간)
     """
-    simpy_env = simpy.Environment()  # SimPy 환경 생성
+    config = sim.config
+    daily_events = sim.events  # 이벤트 sink
+    simpy_env = simpy.Environment(initial_time=initial_time)  # SimPy 환경 생성
+    dispatch_signal = DispatchSignal(simpy_env)  # 이벤트 기반 Dispatcher 알림
+    printer_index = PrinterIndex(config.PRINTERS)  # 적합/idle 프린터 bitmask index (한 번만 생성)
 
     # 각 객체 생성
-    satisfication = Satisfication(simpy_env, daily_events)
-    packaging = Packaging(simpy_env, COST_TYPES[0]['PACKAGING_COST'], daily_events, satisfication)
-    post_processor = PostProcessing(simpy_env, COST_TYPES[0]['POSTPROCESSING_COST'], daily_events, packaging)
-    customer = Customer(simpy_env, COST_TYPES[0]['SHORTAGE_COST'], daily_events, satisfication)
+    sim.cost = CostLedger(sim, simpy_env)
+    sim.monitor = ResourceMonitor(simpy_env)  # 공정별 가동률/대기열 모니터 (공정 객체 생성 시 등록)
+    satisfication = Satisfication(simpy_env, sim, daily_events)
+    packaging = Packaging(simpy_env, sim, config.COST_TYPES[0]['PACKAGING_COST'], daily_events, satisfication)
+    post_processor = PostProcessing(simpy_env, sim, config.COST_TYPES[0]['POSTPROCESSING_COST'], daily_events, packaging)
+    customer = Customer(simpy_env, sim, config.COST_TYPES[0]['SHORTAGE_COST'], daily_events, satisfication, dispatch_signal, printer_index)
     display = Display(simpy_env, daily_events)
     
 
-    # 각 프린터 생성
+    # 각 프린터 생성 (printers 리스트 순서 = PrinterIndex의 bit 위치)
     printers = [
-        Printer(simpy_env, COST_TYPES[0]['PRINTING_COST'], daily_events, pid, details["WIDTH"], details["HEIGHT"], details["DEPTH"], post_processor)
-        for pid, details in PRINTERS.items()
+        Printer(simpy_env, sim, config.COST_TYPES[0]['PRINTING_COST'], daily_events, pid, details["WIDTH"], details["HEIGHT"], details["DEPTH"], post_processor, dispatch_signal, printer_index, customer.requeue)
+        for pid, details in config.PRINTERS.items()
     ]
 
+    # Simulation 객체에 저장
+    sim.simpy_env = simpy_env
+    sim.packaging = packaging
+    sim.post_processor = post_processor
+    sim.customer = customer
+    sim.display = display
+    sim.printers = printers
+    sim.satisfication = satisfication
+
     # 초기화된 환경 및 객체 반환
     return simpy_env, packaging, post_processor, customer, display, printers, daily_events, satisfication
 
@@ -463,7 +568,14 @@ def simpy_event_processes(simpy_env, packaging, post_processor, customer, displa
     simpy_env.process(display.track_days())
     simpy_env.process(customer.create_jobs_continuously())
     # Dispatcher 등록
-    simpy_env.process(job_dispatcher(simpy_env, customer, printers, daily_events))
+    if customer.sim.config.DISPATCH_MODE == "EVENT":
+        simpy_env.process(event_job_dispatcher(simpy_env, customer, printers, daily_events, customer.dispatch_signal))
+    else:
+        simpy_env.process(job_dispatcher(simpy_env, customer, printers, daily_events))
+    # 프린터 고장 / 정기 정비 (설정된 경우)
+    start_reliability(simpy_env, customer.sim, printers)
+    # 후처리 / 포장 작업자 근무 시작 (근무 달력이 설정된 경우)
+    start_shifts(simpy_env, (post_processor, packaging))
     '''
     # 각 프린터의 작업 처리 프로세스 추가
     for printer in printers:
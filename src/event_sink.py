@@ -0,0 +1,138 @@
+import csv
+import math
+import numpy as np
+
+#### 이벤트 종류 ##############################################################
+# 이벤트는 (time, kind, job_id, resource, value, aux) 형태의 숫자 record로 전달되며,
+# 문자열은 sink가 실제로 텍스트를 출력할 때만 아래 formatter로 만듦
+
+def _clock(time):
+    """시뮬레이션 시간을 하루 안의 "시:분" 문자열로 변환"""
+    return f"{int(time % 24)}:{int((time % 1) * 60):02d}"
+
+# 이벤트 종류 이름 -> 텍스트 formatter (기존 daily_events 문자열과 동일한 형식)
+EVENT_FORMATS = {
+    "day": lambda r: f"\n===== Day {int(r[4])} Report: =====",
+    "shortage": lambda r: f"Job {r[2]} could not be assigned: No suitable printer available (Job size: {r[4]:.2f})",
+    "printer_assigned": lambda r: f"[{r[0]}] Job {r[2]} is assigned to Printer {r[3]}.",
+    "printer_busy": lambda r: f"[{r[0]}] Printer {r[3]} is busy. Job {r[2]} cannot be processed right now.",
+    "printing_start": lambda r: f"[{r[0]}] Printer {r[3]} starts printing Job {r[2]}.",
+    "printing_finish": lambda r: f"[{r[0]}] Printer {r[3]} finished printing Job {r[2]}.",
+    "no_printer": lambda r: f"Dispatcher: No available printer for Job {r[2]} at time {r[0]}. Will re-check after some delay.",
+    "post_processing_start": lambda r: f"{_clock(r[0])} - Job {r[2]} is starting on Worker {r[3]} (Post-processing)",
+    "post_processing_finish": lambda r: f"{_clock(r[0])} - Job {r[2]} is finishing on Worker {r[3]} (Post-processing)",
+    "packaging_start": lambda r: f"{_clock(r[0])} - Job {r[2]} is starting on Worker {r[3]} (Packaging)",
+    "packaging_finish": lambda r: f"{_clock(r[0])} - Job {r[2]} is finishing on Worker {r[3]} (Packaging) & End_Time: s{r[0]: .4f}",
+    "satisfication": lambda r: f"Job {r[2]}: Satisfication calculated as {r[4]:.4f}\nTotal Satisfication: {r[5]: .4f}",
+    "no_satisfication": lambda r: f"Job {r[2]}: No printer assigned, satisfication set to {r[4]:.4f}\nTotal Satisfication: {r[5]: .4f}",
+    "plate_batch": lambda r: f"[{r[0]}] Printer {r[3]} prints {int(r[4])} jobs on one build plate (first: Job {r[2]}).",
+    "failure_start": lambda r: f"[{r[0]}] Printer {r[3]} failed. Repair time: {r[4]:.2f}",
+    "failure_end": lambda r: f"[{r[0]}] Printer {r[3]} is repaired.",
+    "maintenance_start": lambda r: f"[{r[0]}] Printer {r[3]} starts maintenance ({r[4]:.2f} hours).",
+    "maintenance_end": lambda r: f"[{r[0]}] Printer {r[3]} finished maintenance.",
+    "print_aborted": lambda r: f"[{r[0]}] Printer {r[3]} aborted printing Job {r[2]} ({'requeued' if r[4] else 'restart after repair'}).",
+}
+EVENT_KINDS = list(EVENT_FORMATS)  # 이벤트 코드 (binary 기록용) -> 이름
+EVENT_CODES = {kind: code for code, kind in enumerate(EVENT_KINDS)}
+
+# binary 기록 형식 (record 하나 = 37 bytes)
+EVENT_DTYPE = np.dtype([
+    ("time", "<f8"),
+    ("kind", "u1"),
+    ("job_id", "<i8"),
+    ("resource", "<i4"),
+    ("value", "<f8"),
+    ("aux", "<f8"),
+])
+
+def format_event(record):
+    """(time, kind, job_id, resource, value, aux) record를 텍스트로 변환"""
+    return EVENT_FORMATS[record[1]](record)
+
+#### Event sink ###############################################################
+# 모든 sink는 emit / flush / close를 제공
+# - emit(time, kind, job_id, resource, value, aux): 이벤트 하나 전달 (문자열 생성 없음)
+# - flush(): 버퍼에 쌓인 이벤트를 출력/기록 (main.py에서 하루마다 호출)
+# - close(): 남은 이벤트를 기록하고 파일을 닫음
+
+# NullSink 클래스: 이벤트를 버림 (로그가 필요 없는 실행용)
+class NullSink:
+    def emit(self, time, kind, job_id=-1, resource=-1, value=math.nan, aux=math.nan):
+        pass
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+# ConsoleSink 클래스: 이벤트를 모아 두었다가 flush할 때 텍스트로 변환하여 출력
+class ConsoleSink:
+    def __init__(self):
+        self.buffer = []
+
+    def emit(self, time, kind, job_id=-1, resource=-1, value=math.nan, aux=math.nan):
+        self.buffer.append((time, kind, job_id, resource, value, aux))
+
+    def flush(self):
+        for record in self.buffer:
+            print(format_event(record))
+        self.buffer.clear()
+
+    def close(self):
+        self.flush()
+
+# FileSink 클래스: 이벤트를 고정 크기 NumPy 버퍼에 모아 파일에 일괄 기록
+# - fmt="binary": EVENT_DTYPE 형식의 raw record (read_binary_events로 읽음)
+# - fmt="csv": time, kind, job_id, resource, value, aux 열의 CSV
+class FileSink:
+    def __init__(self, path, fmt="binary", buffer_size=65536):
+        self.path = path
+        self.fmt = fmt
+        self.buffer = np.zeros(buffer_size, dtype=EVENT_DTYPE)
+        self.count = 0
+        if fmt == "binary":
+            self.file = open(path, "wb")
+        else:
+            self.file = open(path, "w", newline="")
+            self.writer = csv.writer(self.file)
+            self.writer.writerow(EVENT_DTYPE.names)
+
+    def emit(self, time, kind, job_id=-1, resource=-1, value=math.nan, aux=math.nan):
+        self.buffer[self.count] = (time, EVENT_CODES[kind], job_id, resource, value, aux)
+        self.count += 1
+        if self.count == len(self.buffer):
+            self._write()
+
+    def _write(self):
+        """버퍼의 record를 파일에 기록"""
+        records = self.buffer[:self.count]
+        if self.fmt == "binary":
+            records.tofile(self.file)
+        else:
+            kinds = np.array(EVENT_KINDS)[records["kind"]]
+            self.writer.writerows(zip(records["time"], kinds, records["job_id"], records["resource"],
+                                      records["value"], records["aux"]))
+        self.count = 0
+
+    def flush(self):
+        self._write()
+        self.file.flush()
+
+    def close(self):
+        self._write()
+        self.file.close()
+
+def read_binary_events(path):
+    """FileSink(fmt="binary")로 기록한 이벤트를 NumPy structured array로 읽음 (memory-map)"""
+    return np.memmap(path, dtype=EVENT_DTYPE, mode="r")
+
+def make_sink(config):
+    """설정(EVENT_SINK, EVENT_LOG_PATH, PRINT_SIM_EVENTS)에 맞는 event sink 생성"""
+    if config.EVENT_SINK == "BINARY":
+        return FileSink(config.EVENT_LOG_PATH, "binary")
+    if config.EVENT_SINK == "CSV":
+        return FileSink(config.EVENT_LOG_PATH, "csv")
+    if config.EVENT_SINK == "CONSOLE" and config.PRINT_SIM_EVENTS:
+        return ConsoleSink()
+    return NullSink()
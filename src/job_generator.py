@@ -0,0 +1,156 @@
+import numpy as np
+from job_table import Job  # JobTable 행을 가리키는 Job
+from random_streams import RandomStreams  # 용도별 난수 stream
+from compiled_config import compile_config  # Job 유형 / 프린터 기술 lookup table
+
+# JobTable에 기록되는 Job 속성 (JobBatch / DemandStream 공통)
+JOB_FIELDS = (
+    "job_type", "material", "width", "height", "depth", "volume",
+    "build_time", "post_processing_time", "packaging_time"
+)
+
+# JobBatch 클래스: 여러 Job의 속성을 NumPy 배열 연산으로 한 번에 생성
+# (streams: RandomStreams, 도착 간격 / 유형 / 치수 / 포장 시간은 각각 별도 stream 사용)
+class JobBatch:
+    def __init__(self, sim_config, compiled, size, streams):
+        self.size = size  # Batch에 포함된 Job 수
+
+        # 도착 간격 (지수 분포) 및 Job 유형 (JOB_TYPE_MIX 비율)
+        self.interval = streams.arrivals.exponential(sim_config.JOB_CREATION_INTERVAL, size)
+        self.job_type = compiled.draw_types(size, streams.job_types)
+
+        # 치수 (유형별 범위의 균등 분포, 상한 미포함)
+        self.height = np.empty(size, dtype=np.int64)
+        self.width = np.empty(size, dtype=np.int64)
+        self.depth = np.empty(size, dtype=np.int64)
+        for job_type in np.unique(self.job_type):
+            rows = self.job_type == job_type
+            count = int(rows.sum())
+            self.height[rows] = streams.dimensions.integers(*compiled.height_range[job_type], size=count)
+            self.width[rows] = streams.dimensions.integers(*compiled.width_range[job_type], size=count)
+            self.depth[rows] = streams.dimensions.integers(*compiled.depth_range[job_type], size=count)
+        vars(self).update(job_attributes(sim_config, compiled, self.job_type, self.width, self.height, self.depth, streams))
+
+def job_attributes(sim_config, compiled, job_type, width, height, depth, streams):
+    """유형/치수 배열로 재료, 볼륨, 제작/후처리/포장 시간 배열 계산 (유형별 값은 CompiledConfig 배열 indexing)
+    (포장 시간 범위 선택에는 packaging stream 사용)
+    """
+    volume = np.asarray(height, dtype=np.int64) * width * depth  # Job 볼륨
+
+    # 제작 시간 (유형별 기본 프린터 기술 기준)
+    build_time = compiled.build_times(job_type, volume, height)
+    # 후처리 시간 (세 치수의 평균 // 계수)
+    post_processing_time = ((height + width + depth) / 3) // compiled.post_processing_coefficient[job_type]
+
+    # 포장 시간: 최대 볼륨의 절반 이하이면 SMALL, 그 외에는 LARGE 범위에서 선택
+    length_range = sim_config.LENGHT_RANGE
+    max_volume = length_range["WIDTH"]["MAX"] * length_range["HEIGHT"]["MAX"] * length_range["DEPTH"]["MAX"]
+    small = streams.packaging.integers(*compiled.small_packaging_range[job_type].T)
+    large = streams.packaging.integers(*compiled.large_packaging_range[job_type].T)
+    packaging_time = np.where(volume <= max_volume / 2, small, large)
+    return {
+        "material": compiled.type_material[job_type],
+        "volume": volume,
+        "build_time": build_time,
+        "post_processing_time": post_processing_time,
+        "packaging_time": packaging_time,
+    }
+
+# Demand source 공통 인터페이스 (JobGenerator의 demand 인자)
+# - chunk(start, size): start번째부터 최대 size개 Job의 (도착 간격, {속성 이름: 배열}), 끝이면 빈 배열
+# - 속성 배열은 JOB_FIELDS를 포함하고, 선택적으로 "due_date"(절대 시간, NaN이면 Job 유형의 기본 납기)를 포함
+
+# DemandStream 클래스: 미리 생성한 Job 도착 stream
+# - 여러 시나리오(PRINTERS 구성, 정책 등)에 같은 객체를 넘기면 모든 시나리오가 똑같은 수요를 처리함
+#   (common random numbers: 시나리오 간 차이에서 수요 표본 차이가 제거됨)
+# - Job 속성은 JOB_TYPES / JOB_TYPE_MIX / 프린터 기술 설정으로 계산되므로 이 설정이 같은 시나리오끼리만 공유
+class DemandStream:
+    def __init__(self, interval, **fields):
+        self.interval = np.asarray(interval, dtype=float)  # 다음 Job까지의 도착 간격
+        self.fields = {name: np.asarray(fields[name]) for name in JOB_FIELDS}  # Job 속성 배열
+
+    @classmethod
+    def generate(cls, sim_config, size=None, seed=None, horizon=None):
+        """size개 또는 horizon 시간(기본: SIM_TIME * 24) 동안 도착하는 Job stream 생성"""
+        streams = RandomStreams(seed)
+        compiled = compile_config(sim_config)
+        if size is not None:
+            batch = JobBatch(sim_config, compiled, size, streams)
+            return cls(batch.interval, **{name: getattr(batch, name) for name in JOB_FIELDS})
+        horizon = sim_config.SIM_TIME * 24 if horizon is None else horizon
+        chunk = max(int(horizon / sim_config.JOB_CREATION_INTERVAL), 1)  # 예상 Job 수 단위로 추가 생성
+        batches, arrival = [], 0.0
+        while arrival < horizon:
+            batch = JobBatch(sim_config, compiled, chunk, streams)
+            batches.append(batch)
+            arrival += batch.interval.sum()
+        return cls(
+            np.concatenate([batch.interval for batch in batches]),
+            **{name: np.concatenate([getattr(batch, name) for batch in batches]) for name in JOB_FIELDS}
+        )
+
+    def __len__(self):
+        return len(self.interval)
+
+    def chunk(self, start, size):
+        """start번째부터 최대 size개 Job의 (도착 간격, {속성 이름: 배열})"""
+        rows = slice(start, start + size)
+        return self.interval[rows], {name: values[rows] for name, values in self.fields.items()}
+
+    def save(self, path):
+        """npz 파일로 저장"""
+        np.savez(path, interval=self.interval, **self.fields)
+
+    @classmethod
+    def load(cls, path):
+        """save()로 저장한 파일 읽기"""
+        with np.load(path) as data:
+            return cls(data["interval"], **{name: data[name] for name in JOB_FIELDS})
+
+# JobGenerator 클래스: JobBatch를 chunk 단위로 생성해 JobTable에 기록하고 Job을 순서대로 제공
+# - demand(DemandStream)가 있으면 난수 대신 미리 생성한 stream에서 chunk를 읽음 (다 쓰면 Job 생성 종료)
+class JobGenerator:
+    def __init__(self, sim_config, compiled, batch_size, table, streams, demand=None):
+        self.sim_config = sim_config  # Simulation 설정 (JOB_CREATION_INTERVAL, LENGHT_RANGE 등)
+        self.compiled = compiled  # Job 유형 / 프린터 기술 lookup table (CompiledConfig)
+        self.batch_size = batch_size  # 한 번에 생성할 Job 수
+        self.table = table  # Job 속성을 저장할 JobTable
+        self.streams = streams  # 용도별 난수 stream (RandomStreams)
+        self.demand = demand  # 미리 생성한 Job 도착 stream (DemandStream 또는 None)
+        self.demand_offset = 0  # demand에서 다음에 읽을 위치
+        self.interval = None  # 현재 chunk의 도착 간격
+        self.start = 0  # 현재 chunk의 시작 행 번호
+        self.cursor = 0
+
+    def _new_chunk(self):
+        """새 chunk를 생성하여 JobTable의 예약된 행에 한 번에 기록"""
+        if self.demand is not None:
+            interval, fields = self.demand.chunk(self.demand_offset, self.batch_size)
+            self.demand_offset += len(interval)
+        else:
+            batch = JobBatch(self.sim_config, self.compiled, self.batch_size, self.streams)
+            interval, fields = batch.interval, {name: getattr(batch, name) for name in JOB_FIELDS}
+        self.start = self.table.reserve(len(interval))
+        rows = slice(self.start, self.start + len(interval))
+        columns = self.table.columns
+        for name, values in fields.items():
+            columns[name][rows] = values  # due_date가 있으면 Job별 납기도 함께 기록
+        self.interval = interval
+        self.cursor = 0
+
+    def next_job(self, now):
+        """다음 Job과 그 다음 Job까지의 도착 간격을 반환 (demand를 모두 사용하면 (None, None))"""
+        if self.interval is None or self.cursor >= len(self.interval):
+            # 현재 chunk를 모두 사용하면 새 chunk 생성
+            self._new_chunk()
+            if not len(self.interval):
+                return None, None
+
+        index = self.cursor
+        self.cursor += 1
+        job_id = self.start + index
+        self.table.activate(job_id, now)
+        due_date = self.table.columns["due_date"]
+        if due_date[job_id] != due_date[job_id]:  # NaN: demand에 납기가 없으면 기본 납기
+            due_date[job_id] = now + self.compiled.due_date[self.table.columns["job_type"][job_id]]
+        return Job(self.table, job_id), self.interval[index]
@@ -0,0 +1,261 @@
+import heapq
+import itertools
+from collections import deque
+from job_table import Job  # checkpoint 복원 시 Job 생성
+
+# JobQueue 클래스: FIFO 대기열 (deque 기반)
+# - append / pop / remove 모두 O(1) (remove는 표시 후 나중에 정리하는 lazy 삭제)
+# - len()과 가장 오래 기다린 Job의 대기 시간(oldest_age)도 O(1)
+class JobQueue:
+    def __init__(self, env):
+        self.env = env  # SimPy 환경 객체 (대기 시간 계산용)
+        self._arrivals = deque()  # 도착 순서의 entry: [enqueue_time, job] (삭제되면 job = None)
+        self._entries = {}  # job_id -> entry
+
+    def _push(self, job):
+        """entry를 만들어 도착 순서 목록에 추가"""
+        entry = [self.env.now, job]
+        self._arrivals.append(entry)
+        self._entries[job.job_id] = entry
+        return entry
+
+    def _discard_head(self):
+        """도착 순서 목록 앞쪽의 삭제된 entry 정리"""
+        while self._arrivals and self._arrivals[0][1] is None:
+            self._arrivals.popleft()
+
+    def _compact(self):
+        """삭제된 entry가 많이 쌓이면 도착 순서 목록을 다시 만듦 (amortized O(1))"""
+        if len(self._arrivals) > 2 * len(self._entries) + 32:
+            self._arrivals = deque(entry for entry in self._arrivals if entry[1] is not None)
+
+    def append(self, job):
+        """Job을 대기열에 추가"""
+        self._push(job)
+
+    def pop(self):
+        """다음 Job을 꺼냄 (FIFO)"""
+        self._discard_head()
+        entry = self._arrivals.popleft()
+        del self._entries[entry[1].job_id]
+        return entry[1]
+
+    def remove(self, job):
+        """대기열 중간의 Job 삭제"""
+        entry = self._entries.pop(job.job_id)
+        entry[1] = None
+        self._discard_head()
+        self._compact()
+
+    def oldest_age(self):
+        """가장 오래 기다린 Job의 대기 시간 (비어 있으면 0)"""
+        self._discard_head()
+        if not self._arrivals:
+            return 0
+        return self.env.now - self._arrivals[0][0]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __bool__(self):
+        return bool(self._entries)
+
+    def __iter__(self):
+        """처리 순서대로 Job 순회"""
+        return (entry[1] for entry in list(self._arrivals) if entry[1] is not None)
+
+    def snapshot(self):
+        """도착 순서의 (대기열에 들어온 시간, Job ID) 목록 (checkpoint용)"""
+        return [(entry[0], entry[1].job_id) for entry in self._arrivals if entry[1] is not None]
+
+    def restore(self, items, table):
+        """snapshot()의 목록으로 대기열 복원 (도착 순서대로 다시 추가하므로 처리 순서도 같음)"""
+        for enqueue_time, job_id in items:
+            self.append(Job(table, job_id))
+            self._entries[job_id][0] = enqueue_time
+
+
+# PriorityJobQueue 클래스: key(납기, 볼륨, 생성 시간)가 작은 Job부터 꺼내는 heap 기반 대기열
+# - key가 None이면 대기열에 들어온 순번이 key (FIFO, 다시 들어온 Job은 맨 뒤)
+class PriorityJobQueue(JobQueue):
+    def __init__(self, env, key, counter=None):
+        super().__init__(env)
+        self.key = key  # Job 속성 이름 (예: "due_date", None: 들어온 순서)
+        self._heap = []  # (key 값, 순번, entry)
+        self._counter = counter if counter is not None else itertools.count()  # 같은 key 값일 때 도착 순서 유지 (여러 대기열이 공유 가능)
+
+    def append(self, job):
+        """Job을 대기열에 추가 (O(log n))"""
+        entry = self._push(job)
+        order = next(self._counter)
+        heapq.heappush(self._heap, (order if self.key is None else getattr(job, self.key), order, entry))
+
+    def peek(self):
+        """key 값이 가장 작은 Job의 (key 값, 순번) 반환 (비어 있으면 None)"""
+        while self._heap and self._heap[0][2][1] is None:
+            heapq.heappop(self._heap)  # 삭제된 entry 정리
+        return self._heap[0][:2] if self._heap else None
+
+    def pop(self):
+        """key 값이 가장 작은 Job을 꺼냄 (O(log n))"""
+        while True:
+            _, _, entry = heapq.heappop(self._heap)
+            if entry[1] is not None:
+                break
+        return self._release(entry)
+
+    def pop_item(self):
+        """key 값이 가장 작은 (key 값, 순번, entry)를 heap에서 꺼냄 (비어 있으면 None)
+        (Job은 take 또는 push_item을 호출할 때까지 대기열에 남음)
+        """
+        if self.peek() is None:
+            return None
+        return heapq.heappop(self._heap)
+
+    def push_item(self, item):
+        """pop_item으로 꺼낸 item을 같은 (key 값, 순번)으로 되돌림"""
+        heapq.heappush(self._heap, item)
+
+    def take(self, item):
+        """pop_item으로 꺼낸 item의 Job을 대기열에서 제거하고 반환"""
+        return self._release(item[2])
+
+    def items(self):
+        """삭제되지 않은 (key 값, 순번, entry) 목록 (heap 순서)"""
+        return [item for item in self._heap if item[2][1] is not None]
+
+    def _release(self, entry):
+        """heap에서 꺼낸 entry의 Job을 대기열에서 제거"""
+        job = entry[1]
+        del self._entries[job.job_id]
+        entry[1] = None
+        self._discard_head()
+        self._compact()
+        return job
+
+    def remove(self, job):
+        """대기열 중간의 Job 삭제 (heap에서는 pop할 때 건너뜀)"""
+        super().remove(job)
+        if len(self._heap) > 2 * len(self._entries) + 32:
+            self._heap = [item for item in self._heap if item[2][1] is not None]
+            heapq.heapify(self._heap)
+
+    def __iter__(self):
+        """처리 순서(key 순)대로 Job 순회"""
+        return (entry[1] for _, _, entry in sorted(self.items()))
+
+
+# FitClassQueue 클래스: 적합한 프린터 bitmask(suitable_mask)가 같은 Job끼리 묶은 우선순위 대기열
+# - 묶음(fit class)별 PriorityJobQueue 사용 (묶음 수는 프린터 치수 조합 수 이하로 Job 수와 무관)
+# - pop_best(idle_mask): idle 프린터에 들어갈 수 있는 Job 중 key가 가장 작은 Job을 꺼냄 (O(C + log n))
+# - 모든 묶음이 순번을 공유하므로 key 값이 같으면 도착 순서대로 처리
+class FitClassQueue:
+    def __init__(self, env, key):
+        self.env = env
+        self.key = key  # Job 속성 이름 (예: "due_date", None: 들어온 순서)
+        self.classes = {}  # suitable_mask -> PriorityJobQueue
+        self._counter = itertools.count()
+        self._size = 0
+
+    def append(self, job):
+        """Job을 적합 프린터 묶음의 대기열에 추가 (O(log n))"""
+        queue = self.classes.get(job.suitable_mask)
+        if queue is None:
+            queue = self.classes[job.suitable_mask] = PriorityJobQueue(self.env, self.key, self._counter)
+        queue.append(job)
+        self._size += 1
+
+    def pop_best(self, idle_mask):
+        """idle_mask의 프린터 중 하나에 들어갈 수 있는 Job 중 우선순위가 가장 높은 Job (없으면 None)"""
+        best, best_queue = None, None
+        for mask, queue in self.classes.items():
+            if mask & idle_mask and queue:
+                top = queue.peek()
+                if best is None or top < best:
+                    best, best_queue = top, queue
+        if best_queue is None:
+            return None
+        self._size -= 1
+        return best_queue.pop()
+
+    def pop(self):
+        """우선순위가 가장 높은 Job을 꺼냄"""
+        return self.pop_best(-1)
+
+    def take_fitting(self, mask, accept, limit):
+        """mask의 프린터에 들어갈 수 있는 Job을 우선순위 순서로 최대 limit개 확인하여
+        accept(job)가 True인 Job을 꺼내 반환 (나머지는 원래 순서 그대로 대기열에 남음, O(limit * (log C + log n)))
+        """
+        queues = [queue for class_mask, queue in self.classes.items() if class_mask & mask and queue]
+        frontier = []  # 묶음별 맨 앞 Job: (key 값, 순번, 묶음 번호)
+        for index, queue in enumerate(queues):
+            heapq.heappush(frontier, (*queue.peek(), index))
+        taken, rejected = [], []
+        while frontier and limit > 0:
+            _, _, index = heapq.heappop(frontier)
+            queue = queues[index]
+            item = queue.pop_item()
+            limit -= 1
+            if accept(item[2][1]):
+                taken.append(queue.take(item))
+                self._size -= 1
+            else:
+                rejected.append((queue, item))
+            top = queue.peek()
+            if top is not None:
+                heapq.heappush(frontier, (*top, index))
+        for queue, item in rejected:
+            queue.push_item(item)  # 같은 (key 값, 순번)으로 되돌림
+        return taken
+
+    def remove(self, job):
+        """대기열 중간의 Job 삭제"""
+        self.classes[job.suitable_mask].remove(job)
+        self._size -= 1
+
+    def oldest_age(self):
+        """가장 오래 기다린 Job의 대기 시간 (비어 있으면 0)"""
+        return max((queue.oldest_age() for queue in self.classes.values()), default=0)
+
+    def __len__(self):
+        return self._size
+
+    def __bool__(self):
+        return self._size > 0
+
+    def __iter__(self):
+        """처리 순서(key 순)대로 Job 순회"""
+        entries = [item for queue in self.classes.values() for item in queue.items()]
+        return (entry[1] for _, _, entry in sorted(entries))
+
+    def snapshot(self):
+        """도착 순서(순번 순)의 (대기열에 들어온 시간, Job ID) 목록 (checkpoint용)"""
+        items = sorted(
+            (counter, entry[0], entry[1].job_id)
+            for queue in self.classes.values() for _, counter, entry in queue.items()
+        )
+        return [(enqueue_time, job_id) for _, enqueue_time, job_id in items]
+
+    def restore(self, items, table):
+        """snapshot()의 목록으로 대기열 복원 (suitable_mask는 JobTable에서 읽음)"""
+        for enqueue_time, job_id in items:
+            job = Job(table, job_id)
+            self.append(job)
+            self.classes[job.suitable_mask]._entries[job_id][0] = enqueue_time
+
+
+# 대기열 방식 -> Job 속성 이름
+QUEUE_KEYS = {
+    "FIFO": None,  # FitClassQueue에서 사용: 대기열에 들어온 순번 (REQUEUE로 되돌아온 Job은 생성 시간과 관계없이 맨 뒤)
+    "DUE_DATE": "due_date",
+    "VOLUME": "volume",
+    "CREATE_TIME": "create_time",
+    "BUILD_TIME": "build_time",
+}
+
+
+def make_queue(env, policy):
+    """설정 값("FIFO", "DUE_DATE", "VOLUME", "CREATE_TIME", "BUILD_TIME")에 맞는 대기열 생성"""
+    if policy == "FIFO":
+        return JobQueue(env)
+    return PriorityJobQueue(env, QUEUE_KEYS[policy])
@@ -0,0 +1,200 @@
+import numpy as np
+
+# JobTable 열(column) 정의: 이름 -> (dtype, 초기값)
+JOB_COLUMNS = {
+    # 생성 정보
+    "day": (np.int32, 0),
+    "create_time": (np.float64, np.nan),
+    "due_date": (np.float64, np.nan),
+    # 치수 및 작업 시간
+    "width": (np.int32, 0),
+    "height": (np.int32, 0),
+    "depth": (np.int32, 0),
+    "volume": (np.int64, 0),
+    "build_time": (np.int64, 0),
+    "post_processing_time": (np.float64, 0),
+    "packaging_time": (np.int32, 0),
+    "job_type": (np.int16, 0),  # Job 유형 번호 (JOB_TYPES 순서)
+    "material": (np.int16, -1),  # 재료 코드 (CompiledConfig.materials 순서)
+    # 비용
+    "printing_cost": (np.float64, 0),
+    "post_processing_cost": (np.float64, 0),
+    "packaging_cost": (np.float64, 0),
+    "delivery_cost": (np.float64, 0),
+    "shortage_cost": (np.float64, 0),
+    "shortage": (np.int8, 0),
+    "satisfication": (np.float64, np.nan),  # Job별 고객 만족도 (포장 완료 또는 Shortage 시 기록)
+    # 할당 및 시간 기록 (-1 / NaN: 아직 처리되지 않음)
+    "printer_id": (np.int32, -1),
+    "printing_start": (np.float64, np.nan),
+    "printing_finish": (np.float64, np.nan),
+    "post_processing_worker": (np.int32, -1),
+    "post_processing_start": (np.float64, np.nan),
+    "post_processing_finish": (np.float64, np.nan),
+    "packaging_worker": (np.int32, -1),
+    "packaging_start": (np.float64, np.nan),
+    "packaging_finish": (np.float64, np.nan),
+}
+
+# 공정 코드: 이름, 자원 ID 열, DAILY_REPORTS의 자원 키
+STAGES = {
+    0: ("Printing", "printer_id", "printing", "printer_id"),
+    1: ("Post-Processing", "post_processing_worker", "post_processing", "worker_id"),
+    2: ("Packaging", "packaging_worker", "packaging", "worker_id"),
+}
+STAGE_CODES = {name: code for code, (name, _, _, _) in STAGES.items()}
+
+# JOB_LOG 행에 포함되는 열
+JOB_LOG_COLUMNS = [
+    "day", "job_id", "width", "height", "depth", "create_time", "volume",
+    "build_time", "post_processing_time", "packaging_time"
+]
+
+
+def _grow(array, capacity, fill):
+    """배열을 capacity 크기로 확장 (새 칸은 fill 값)"""
+    grown = np.full(capacity, fill, dtype=array.dtype)
+    grown[:len(array)] = array
+    return grown
+
+
+# JobTable 클래스: 모든 Job의 속성, 비용, 할당 정보, 시간 기록을 열 단위 배열로 저장
+class JobTable:
+    def __init__(self, capacity=1024):
+        self.capacity = capacity  # 할당된 행 수
+        self.reserved = 0  # 예약된 행 수 (생성 예정인 Job 포함)
+        self.size = 0  # 실제로 도착한 Job 수
+        self.columns = {
+            name: np.full(capacity, fill, dtype=dtype)
+            for name, (dtype, fill) in JOB_COLUMNS.items()
+        }
+        # 적합한 프린터 bitmask (PrinterIndex의 bit 위치 기준, 프린터 수 제한이 없도록 Python int 저장)
+        self.suitable_mask = np.zeros(capacity, dtype=object)
+
+        # 공정 완료 기록 (DAILY_REPORTS 순서 유지용)
+        self.event_job = np.zeros(capacity, dtype=np.int64)
+        self.event_stage = np.zeros(capacity, dtype=np.int8)
+        self.event_count = 0
+
+    def reserve(self, count):
+        """count개의 행을 예약하고 시작 행 번호를 반환"""
+        start = self.reserved
+        self.reserved += count
+        if self.reserved > self.capacity:
+            capacity = max(self.capacity * 2, self.reserved)
+            for name, (_, fill) in JOB_COLUMNS.items():
+                self.columns[name] = _grow(self.columns[name], capacity, fill)
+            self.suitable_mask = _grow(self.suitable_mask, capacity, 0)
+            self.capacity = capacity
+        return start
+
+    def activate(self, job_id, now):
+        """예약된 행의 Job이 도착했음을 기록"""
+        self.columns["create_time"][job_id] = now
+        self.columns["day"][job_id] = int(now // 24) + 1
+        self.size = max(self.size, job_id + 1)
+
+    def record_stage(self, job_id, stage, resource_id, start_time, end_time):
+        """공정(Printing/Post-Processing/Packaging) 완료 기록"""
+        code = STAGE_CODES[stage]
+        _, resource_column, prefix, _ = STAGES[code]
+        self.columns[resource_column][job_id] = resource_id
+        self.columns[prefix + "_start"][job_id] = start_time
+        self.columns[prefix + "_finish"][job_id] = end_time
+
+        if self.event_count == len(self.event_job):
+            self.event_job = _grow(self.event_job, self.event_count * 2, 0)
+            self.event_stage = _grow(self.event_stage, self.event_count * 2, 0)
+        self.event_job[self.event_count] = job_id
+        self.event_stage[self.event_count] = code
+        self.event_count += 1
+
+
+def _column_property(name):
+    """JobTable의 열을 읽고 쓰는 property 생성 (읽을 때는 Python 값으로 변환)"""
+    def fget(self):
+        return self.table.columns[name].item(self.job_id)
+
+    def fset(self, value):
+        self.table.columns[name][self.job_id] = value
+
+    return property(fget, fset)
+
+
+# Job 클래스: JobTable의 한 행을 가리키는 가벼운 객체
+class Job:
+    __slots__ = ("table", "job_id")
+
+    def __init__(self, table, job_id):
+        self.table = table  # Job 데이터를 가진 JobTable
+        self.job_id = job_id  # Job ID (= JobTable 행 번호)
+
+    @property
+    def suitable_mask(self):
+        return self.table.suitable_mask[self.job_id]
+
+    @suitable_mask.setter
+    def suitable_mask(self, mask):
+        self.table.suitable_mask[self.job_id] = mask
+
+
+for _name in JOB_COLUMNS:
+    setattr(Job, _name, _column_property(_name))
+
+
+# JobLogView 클래스: JobTable을 JOB_LOG(dict 리스트) 형태로 읽는 view
+class JobLogView:
+    def __init__(self, table):
+        self.table = table
+
+    def __len__(self):
+        return self.table.size
+
+    def __getitem__(self, job_id):
+        if job_id < 0:
+            job_id += self.table.size
+        if not 0 <= job_id < self.table.size:
+            raise IndexError(job_id)
+        columns = self.table.columns
+        row = {name: columns[name][job_id] for name in JOB_LOG_COLUMNS if name != "job_id"}
+        row["job_id"] = job_id
+        return row
+
+    def __iter__(self):
+        for job_id in range(self.table.size):
+            yield self[job_id]
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+# DailyReportView 클래스: JobTable의 공정 완료 기록을 DAILY_REPORTS(dict 리스트) 형태로 읽는 view
+class DailyReportView:
+    def __init__(self, table):
+        self.table = table
+
+    def __len__(self):
+        return self.table.event_count
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.table.event_count
+        if not 0 <= index < self.table.event_count:
+            raise IndexError(index)
+        job_id = int(self.table.event_job[index])
+        name, resource_column, prefix, resource_key = STAGES[int(self.table.event_stage[index])]
+        columns = self.table.columns
+        return {
+            'job_id': job_id,
+            resource_key: int(columns[resource_column][job_id]),
+            'start_time': columns[prefix + "_start"][job_id],
+            'end_time': columns[prefix + "_finish"][job_id],
+            'process': name
+        }
+
+    def __iter__(self):
+        for index in range(self.table.event_count):
+            yield self[index]
+
+    def __repr__(self):
+        return repr(list(self))
@@ -1,13 +1,21 @@
-DAILY_EVENTS = []
-DAILY_REPORTS = []
-COST_LOG = []
-SATISFICATION_LOG = []
-JOB_LOG = []
-DAILY_COST_REPORT = {
-    'Holding cost': 0,
-    'Printing cost': 0,
-    'Post Processing cost': 0,
-    'Packaging cost': 0,
-    'Delivery cost': 0,
-    'Shortage cost' : 0
-}
\ No newline at end of file
+from job_table import JobTable, JobLogView, DailyReportView
+
+# SimLogs 클래스: Simulation 하나가 사용하는 로그와 누적값
+# - job_table: 모든 Job의 속성/비용/할당/시간 기록을 저장하는 열 단위 테이블
+# - daily_reports, job_log: job_table을 dict 형태로 읽는 view (DAILY_REPORTS, JOB_LOG)
+# - cost_log, satisfication_log, daily_cost_report: 비용/만족도 기록
+class SimLogs:
+    def __init__(self):
+        self.job_table = JobTable()
+        self.daily_reports = DailyReportView(self.job_table)
+        self.cost_log = []
+        self.satisfication_log = []
+        self.job_log = JobLogView(self.job_table)
+        self.daily_cost_report = {
+            'Holding cost': 0,
+            'Printing cost': 0,
+            'Post Processing cost': 0,
+            'Packaging cost': 0,
+            'Delivery cost': 0,
+            'Shortage cost' : 0
+        }
@@ -0,0 +1,62 @@
+from bisect import bisect_left
+
+# PrinterIndex 클래스: PRINTERS의 치수로 만든 적합 프린터 검색 index
+# - 각 프린터는 PRINTERS 순서대로 bit 위치를 가짐 (bit i = i번째 프린터)
+# - 치수(WIDTH/HEIGHT/DEPTH)별로 정렬된 크기 목록과 "해당 크기 이상인 프린터" bitmask를 저장
+# - Job의 적합 프린터 집합은 치수별 이진 탐색 + bitmask AND로 계산 (O(log P))
+class PrinterIndex:
+    DIMENSIONS = ("WIDTH", "HEIGHT", "DEPTH")
+
+    def __init__(self, printers):
+        self.printer_ids = list(printers.keys())  # bit 위치 -> 프린터 ID
+        self.position = {printer_id: i for i, printer_id in enumerate(self.printer_ids)}  # 프린터 ID -> bit 위치
+        self.all_mask = (1 << len(self.printer_ids)) - 1
+        self.idle_mask = self.all_mask  # 현재 비어 있는 프린터 bitmask
+        self.down_mask = 0  # 고장 / 정비로 정지 중인 프린터 bitmask (idle도 busy도 아님)
+
+        self.sizes = {}  # 치수별 정렬된 크기 목록
+        self.masks = {}  # 치수별 sizes[k] 이상인 프린터 bitmask
+        for dimension in self.DIMENSIONS:
+            sizes = sorted({printer[dimension] for printer in printers.values()})
+            masks = [0] * len(sizes)
+            for printer_id, printer in printers.items():
+                k = bisect_left(sizes, printer[dimension])
+                masks[k] |= 1 << self.position[printer_id]
+            # 뒤에서부터 누적: masks[k] = 크기가 sizes[k] 이상인 모든 프린터
+            for k in range(len(sizes) - 2, -1, -1):
+                masks[k] |= masks[k + 1]
+            self.sizes[dimension] = sizes
+            self.masks[dimension] = masks
+
+    def fit_mask(self, width, height, depth):
+        """Job 치수를 수용할 수 있는 프린터 bitmask 반환 (없으면 0)"""
+        mask = self.all_mask
+        for dimension, value in zip(self.DIMENSIONS, (width, height, depth)):
+            k = bisect_left(self.sizes[dimension], value)
+            if k == len(self.sizes[dimension]):
+                return 0
+            mask &= self.masks[dimension][k]
+        return mask
+
+    def set_idle(self, position, idle):
+        """프린터의 idle 상태를 bitmask에 반영"""
+        if idle:
+            self.idle_mask |= 1 << position
+        else:
+            self.idle_mask &= ~(1 << position)
+
+    def set_down(self, position, down):
+        """프린터의 정지 상태를 bitmask에 반영"""
+        if down:
+            self.down_mask |= 1 << position
+        else:
+            self.down_mask &= ~(1 << position)
+
+    def busy_count(self):
+        """작업 중인 프린터 수 (정지 중인 프린터 제외)"""
+        return bin(self.all_mask & ~(self.idle_mask | self.down_mask)).count("1")
+
+    @staticmethod
+    def lowest(mask):
+        """mask에서 가장 낮은 bit 위치 반환 (first-fit)"""
+        return (mask & -mask).bit_length() - 1
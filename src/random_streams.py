@@ -0,0 +1,37 @@
+import numpy as np
+
+# 난수 stream 이름 (SeedSequence.spawn 순서와 같으므로 새 stream은 항상 뒤에 추가해야 기존 stream 값이 유지됨)
+STREAM_NAMES = ("arrivals", "dimensions", "packaging", "failures", "job_types")
+
+# RandomStreams 클래스: 용도별로 독립적인 np.random.Generator 묶음
+# - 같은 seed이면 설정(PRINTERS 등)이 달라도 각 stream이 같은 난수를 만듦 (common random numbers)
+# - 한 stream의 사용량이 바뀌어도 (예: 고장 모델 추가) 다른 stream의 난수는 바뀌지 않음
+class RandomStreams:
+    def __init__(self, seed=None):
+        # seed: int, None 또는 SeedSequence (replication에서 spawn한 seed)
+        # (spawn()과 같은 자식 seed를 만들지만 seed 객체를 변경하지 않으므로 같은 seed를 여러 시나리오에 재사용 가능)
+        seed_sequence = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        self.generators = {
+            name: np.random.default_rng(np.random.SeedSequence(
+                seed_sequence.entropy, spawn_key=(*seed_sequence.spawn_key, index), pool_size=seed_sequence.pool_size
+            ))
+            for index, name in enumerate(STREAM_NAMES)
+        }
+
+    def __getitem__(self, name):
+        return self.generators[name]
+
+    def __getattr__(self, name):
+        try:
+            return self.__dict__["generators"][name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def state(self):
+        """stream별 bit generator 상태 (checkpoint용)"""
+        return {name: generator.bit_generator.state for name, generator in self.generators.items()}
+
+    def set_state(self, state):
+        """state()로 저장한 상태 복원"""
+        for name, generator_state in state.items():
+            self.generators[name].bit_generator.state = generator_state
@@ -0,0 +1,54 @@
+import math
+
+# 프린터 신뢰성 프로세스
+# - 고장: 프린터마다 다음 고장 시간까지 한 번만 대기 (시간 단위 polling 없이 고장 횟수에 비례하는 이벤트만 발생)
+#   고장 시 출력 중이면 출력 프로세스를 interrupt (Printer.start_downtime)
+# - 정기 정비: 프린터마다 다음 정비 시작 시간까지 대기 (달력 기준이므로 checkpoint 재개 시에도 같은 시간)
+
+def failure_process(env, printer, mtbf, mttr, rng):
+    """MTBF / MTTR(지수 분포)로 프린터 고장 발생
+    (다음 고장 시간은 수리가 끝난 뒤부터 계산, 정비 중에 고장 시간이 되면 그 고장은 발생하지 않음)
+    """
+    while True:
+        if printer.next_failure is None:
+            printer.next_failure = env.now + rng.exponential(mtbf)
+        yield env.timeout(printer.next_failure - env.now)
+        repair_time = rng.exponential(mttr)
+        printer.next_failure = env.now + repair_time + rng.exponential(mtbf)
+        if printer.down:
+            continue
+        printer.failures += 1
+        printer.start_downtime("failure", repair_time)
+
+def maintenance_process(env, printer, interval, duration, first, preempt):
+    """first + k * interval 시간마다 duration 동안 정비"""
+    start = first + max(math.ceil((env.now - first) / interval), 0) * interval  # 다음 정비 시작 시간
+    while True:
+        yield env.timeout(start - env.now)
+        printer.request_maintenance(duration, preempt)
+        start += interval
+
+def start_reliability(env, sim, printers):
+    """설정(RELIABILITY, MAINTENANCE)에 따라 프린터별 고장 / 정비 프로세스 등록"""
+    config = sim.config
+    if config.RELIABILITY:
+        for position, printer in enumerate(printers):
+            env.process(failure_process(
+                env, printer, sim.compiled.printer_mtbf[position], sim.compiled.printer_mttr[position], sim.streams.failures
+            ))
+    maintenance = config.MAINTENANCE
+    if maintenance is not None:
+        for position, printer in enumerate(printers):
+            first = maintenance.get("START", 0) + position * maintenance.get("STAGGER", 0)
+            env.process(maintenance_process(
+                env, printer, maintenance["INTERVAL"], maintenance["DURATION"], first, maintenance.get("PREEMPT", False)
+            ))
+
+def reliability_kpis(sim, horizon):
+    """프린터 고장 / 정지 KPI (고장 횟수, 가용률, 중단되어 버려진 출력 시간)"""
+    printers = sim.printers
+    return {
+        "printer_failures": sum(printer.failures for printer in printers),
+        "printer_availability": 1 - sum(printer.down_time for printer in printers) / (horizon * max(len(printers), 1)),
+        "lost_print_hours": sum(printer.lost_time for printer in printers),
+    }
@@ -0,0 +1,197 @@
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from simulation import Simulation  # 독립적인 시뮬레이션 context
+from sim_stats import confidence_interval, mser_truncation, batch_means  # 신뢰구간 / warm-up / batch means 계산
+from job_table import STAGE_CODES  # 공정 코드
+from reliability import reliability_kpis  # 프린터 고장 / 정지 KPI
+from event_sink import NullSink  # replication에서는 이벤트 로그를 남기지 않음
+
+# 리드타임 백분위수
+LEAD_TIME_PERCENTILES = (50, 90, 95)
+
+def _busy_time(resource_ids, start, finish):
+    """자원 ID별 작업 시간 합계 {자원 ID: 시간}
+    (같은 build plate의 Job은 같은 프린터 구간을 공유하므로 자원별로 겹치는 구간은 한 번만 셈)
+    """
+    done = (resource_ids >= 0) & ~np.isnan(finish)
+    resource_ids, start, finish = resource_ids[done], start[done], finish[done]
+    order = np.lexsort((start, resource_ids))  # 자원별 시작 시간 순서
+    resource_ids, start, finish = resource_ids[order], start[order], finish[order]
+    totals = {}
+    groups = np.flatnonzero(np.diff(resource_ids)) + 1
+    for s, e, ids in zip(np.split(start, groups), np.split(finish, groups), np.split(resource_ids, groups)):
+        if not len(ids):
+            continue
+        reach = np.concatenate([[-np.inf], np.maximum.accumulate(e)[:-1]])  # 앞 구간들의 최대 종료 시간
+        totals[int(ids[0])] = float(np.maximum(e - np.maximum(s, reach), 0).sum())  # 새로 덮는 시간만 더함
+    return totals
+
+def completions(sim):
+    """포장 완료 순서의 (완료 Job ID, 완료 시간, 리드타임, 만족도)"""
+    table = sim.logs.job_table
+    count = table.event_count
+    done = table.event_job[:count][table.event_stage[:count] == STAGE_CODES["Packaging"]]
+    finish = table.columns["packaging_finish"][done]
+    lead_time = finish - table.columns["create_time"][done]
+    satisfication = table.columns["satisfication"][done]  # 완료 Job별 만족도 (Shortage Job 제외)
+    return done, finish, lead_time, satisfication
+
+def warmup_time(sim, finish=None, lead_time=None):
+    """warm-up 종료 시간 (WARMUP 설정: "MSER" / 시간 / None)"""
+    warmup = sim.config.WARMUP
+    if warmup is None:
+        return 0.0
+    if warmup != "MSER":
+        return float(warmup)
+    if finish is None:
+        _, finish, lead_time, _ = completions(sim)
+    d = mser_truncation(lead_time)
+    return float(finish[d - 1]) if d else 0.0
+
+def steady_state_kpis(sim, confidence=0.95):
+    """warm-up 이후 ~ Job 생성 종료(SIM_TIME) 구간의 정상 상태 KPI
+    - steady.warmup_hours: warm-up 종료 시간
+    - steady.throughput: 구간 내 완료 Job 수 / 일 (시간 구간 batch means 신뢰구간 포함)
+    - steady.lead_time_mean: 구간 내 완료 Job의 평균 리드타임 (완료 순서 batch means 신뢰구간 포함)
+    - steady.satisfication_per_day, steady.cost_per_day.<비용 항목>: 구간 내 일평균 만족도 / 비용
+    """
+    _, finish, lead_time, satisfication = completions(sim)
+    start = warmup_time(sim, finish, lead_time)
+    end = sim.config.SIM_TIME * 24  # 이후에는 Job이 생성되지 않아 정상 상태가 아님
+    kpis = {"steady.warmup_hours": start}
+    if end <= start:
+        return kpis
+    window = (finish > start) & (finish <= end)
+    days = (end - start) / 24
+    batches = sim.config.STEADY_STATE_BATCHES
+
+    # 처리량: 구간을 같은 길이의 batch로 나눈 batch별 일 처리량
+    counts, _ = np.histogram(finish[window], bins=np.linspace(start, end, batches + 1))
+    throughput = confidence_interval(counts / (days / batches), confidence)
+    kpis["steady.throughput"] = float(window.sum()) / days
+    kpis["steady.throughput_half_width"] = throughput["half_width"]
+
+    lead = batch_means(lead_time[window], batches, confidence)
+    kpis["steady.lead_time_mean"] = float(lead_time[window].mean()) if window.any() else np.nan
+    kpis["steady.lead_time_half_width"] = lead["half_width"]
+    kpis["steady.satisfication_per_day"] = float(satisfication[window].sum()) / days
+
+    # 비용: warm-up이 끝난 다음 날부터 SIM_TIME일까지의 일별 비용 평균
+    first_day, last_day = int(np.ceil(start / 24)), int(sim.config.SIM_TIME)  # CostLedger.daily 행 번호 (날짜 - 1)
+    daily = np.zeros((max(last_day - first_day, 0), len(sim.cost.cost_types)))
+    recorded = sim.cost.daily[first_day:min(last_day, sim.cost.last_day)]
+    daily[:len(recorded)] = recorded
+    for index, cost_type in enumerate(sim.cost.cost_types):
+        kpis[f"steady.cost_per_day.{cost_type}"] = float(daily[:, index].mean()) if len(daily) else np.nan
+    return kpis
+
+def collect_kpis(sim):
+    """실행이 끝난 Simulation에서 KPI를 계산하여 1단계 dict로 반환
+    - throughput: 완료 Job 수 / 일
+    - lead_time_*: Job 생성부터 포장 완료까지의 시간
+    - utilization.<자원>: 작업 시간 / 전체 기간
+    - stage_utilization.<공정>: 공정 내 자원 가동률의 평균
+    - avg_queue.<공정>, avg_wip.<공정>: 시간 가중 평균 대기열 길이 및 WIP
+    - cost.<비용 항목>: 전체 기간 누적 비용
+    - total_satisfication: 누적 고객 만족도
+    - printer_failures, printer_availability, lost_print_hours: 프린터 고장 / 정비 설정 시
+    - steady.*: warm-up 구간을 제외한 정상 상태 KPI (steady_state_kpis)
+    """
+    table = sim.logs.job_table
+    columns = {name: column[:table.size] for name, column in table.columns.items()}
+    completed = ~np.isnan(columns["packaging_finish"])
+    horizon = float(np.nanmax(columns["packaging_finish"])) if completed.any() else sim.simpy_env.now
+    horizon = max(horizon, sim.config.SIM_TIME * 24)
+
+    lead_time = (columns["packaging_finish"] - columns["create_time"])[completed]
+    kpis = {
+        "jobs_created": int(table.size),
+        "jobs_completed": int(completed.sum()),
+        "jobs_shortage": int(columns["shortage"].sum()),
+        "throughput": float(completed.sum()) / (horizon / 24),
+        "lead_time_mean": float(lead_time.mean()) if len(lead_time) else np.nan,
+        "total_satisfication": float(sim.satisfication.total_satisfication),
+    }
+    for percentile in LEAD_TIME_PERCENTILES:
+        kpis[f"lead_time_p{percentile}"] = float(np.percentile(lead_time, percentile)) if len(lead_time) else np.nan
+
+    # 자원별 가동률
+    stages = (
+        ("Printer", "printer_id", "printing", sim.config.PRINTERS),
+        ("Post-Processor", "post_processing_worker", "post_processing", sim.config.POST_PROCESSING_WORKER),
+        ("Packaging", "packaging_worker", "packaging", sim.config.PACKAGING_MACHINE),
+    )
+    for label, resource_column, prefix, resources in stages:
+        busy = _busy_time(columns[resource_column], columns[prefix + "_start"], columns[prefix + "_finish"])
+        for resource_id in resources:
+            kpis[f"utilization.{label} {resource_id}"] = busy.get(resource_id, 0.0) / horizon
+        kpis[f"stage_utilization.{label}"] = sum(busy.values()) / (horizon * max(len(resources), 1))
+
+    # 공정별 시간 가중 평균 대기열 길이 및 WIP
+    for stage, row in sim.monitor.summary(horizon).iterrows():
+        kpis[f"avg_queue.{stage}"] = float(row["avg_queue"])
+        kpis[f"avg_wip.{stage}"] = float(row["avg_wip"])
+
+    # 비용 항목별 누적 비용
+    for cost_type, cost_value in sim.cost.totals().items():
+        kpis[f"cost.{cost_type}"] = cost_value
+    if sim.config.RELIABILITY or sim.config.MAINTENANCE is not None:
+        kpis.update(reliability_kpis(sim, horizon))
+    kpis.update(steady_state_kpis(sim))
+    return kpis
+
+def run_replication(seed, overrides=None, demand=None):
+    """하나의 replication을 실행하고 KPI 반환 (seed: SeedSequence 또는 int, demand: 공유할 DemandStream)"""
+    sim = Simulation(seed=seed, events=NullSink(), demand=demand, **(overrides or {}))
+    sim.run()
+    return collect_kpis(sim)
+
+def summarize(results, confidence=0.95):
+    """replication별 KPI 목록을 KPI별 평균과 신뢰구간으로 요약"""
+    names = []
+    for result in results:
+        names.extend(name for name in result if name not in names)
+    return {
+        name: confidence_interval([result.get(name, np.nan) for result in results], confidence)
+        for name in names
+    }
+
+def run_replications(n, seed=None, overrides=None, max_workers=None, confidence=0.95):
+    """N개의 독립 replication을 process pool에서 실행
+    - 각 replication은 SeedSequence(seed).spawn(n)으로 만든 독립 난수 stream 사용
+    - max_workers=1이면 현재 process에서 순서대로 실행
+    반환: (replication별 KPI 목록, KPI별 요약)
+    """
+    seeds = np.random.SeedSequence(seed).spawn(n)
+    overrides_list = [overrides] * n
+    if max_workers == 1:
+        results = list(map(run_replication, seeds, overrides_list))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(run_replication, seeds, overrides_list))
+    return results, summarize(results, confidence)
+
+def print_summary(summary, confidence=0.95):
+    """KPI 요약을 표 형태로 출력"""
+    print(f"{'KPI':<36} {'Mean':>14} {f'{confidence:.0%} CI half-width':>22}")
+    for name, stats in summary.items():
+        print(f"{name:<36} {stats['mean']:>14.4f} {stats['half_width']:>22.4f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="3D printing farm Monte Carlo replication runner")
+    parser.add_argument("-n", "--replications", type=int, default=10, help="replication 수")
+    parser.add_argument("--seed", type=int, default=None, help="기준 seed (SeedSequence)")
+    parser.add_argument("--workers", type=int, default=None, help="process 수 (기본: CPU 수)")
+    parser.add_argument("--sim-time", type=int, default=None, help="SIM_TIME (일) 변경")
+    parser.add_argument("--confidence", type=float, default=0.95, help="신뢰수준")
+    args = parser.parse_args()
+
+    overrides = {}
+    if args.sim_time is not None:
+        overrides["SIM_TIME"] = args.sim_time
+    _, summary = run_replications(args.replications, args.seed, overrides, args.workers, args.confidence)
+    print_summary(summary, args.confidence)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+
+# Daily_Report.csv 열 순서
+REPORT_COLUMNS = [
+    "DAY", "JOB_ID", "ASSIGNED_PRINTER", "PRINTING_START", "PRINTING_FINISH",
+    "ASSIGNED_POSTPROCESS_WORKER", "POSTPROCESSING_START", "POSTPROCESSING_FINISH",
+    "ASSIGNED_PACKAGING_WORKER", "PACKAGING_START", "PACKAGING_FINISH"
+]
+
+# 공정 이름 -> (자원 키, 담당 자원 열, 시작 열, 종료 열)
+STAGE_COLUMNS = {
+    'Post-Processing': ('worker_id', "ASSIGNED_POSTPROCESS_WORKER", "POSTPROCESSING_START", "POSTPROCESSING_FINISH"),
+    'Packaging': ('worker_id', "ASSIGNED_PACKAGING_WORKER", "PACKAGING_START", "PACKAGING_FINISH"),
+}
+
+def build_daily_report(daily_reports):
+    """DAILY_REPORTS 레코드(dict)를 job_id로 색인하여 Job별 한 행의 Daily Report 생성 (O(n))
+    - 'Printing' 레코드 순서대로 행을 만들고, 후처리/포장 레코드는 job_id로 바로 찾아 채움
+    """
+    rows = {}  # job_id -> 행
+    for record in daily_reports:
+        if record['process'] == 'Printing':
+            rows[record['job_id']] = {
+                "DAY": int(record['start_time'] // 24) + 1,
+                "JOB_ID": record['job_id'],
+                "ASSIGNED_PRINTER": record.get('printer_id', None),
+                "PRINTING_START": record['start_time'],
+                "PRINTING_FINISH": record['end_time'],
+                "ASSIGNED_POSTPROCESS_WORKER": None,
+                "POSTPROCESSING_START": None,
+                "POSTPROCESSING_FINISH": None,
+                "ASSIGNED_PACKAGING_WORKER": None,
+                "PACKAGING_START": None,
+                "PACKAGING_FINISH": None
+            }
+        elif record['process'] in STAGE_COLUMNS:
+            item = rows.get(record['job_id'])
+            if item is None:
+                continue  # 프린팅 기록이 없는 Job
+            resource_key, resource_column, start_column, finish_column = STAGE_COLUMNS[record['process']]
+            item[resource_column] = record.get(resource_key, None)
+            item[start_column] = record['start_time']
+            item[finish_column] = record['end_time']
+    return list(rows.values())
+
+def daily_report_frame(job_table):
+    """JobTable의 열에서 Daily Report DataFrame을 바로 생성 (Job별 행이 이미 있으므로 join 불필요)
+    - 행 순서: 프린팅 완료 순서 (build_daily_report와 동일)
+    - 담당 자원 열은 결측값을 허용하는 정수형(Int64)
+    """
+    printed = job_table.event_job[:job_table.event_count][job_table.event_stage[:job_table.event_count] == 0]
+    columns = job_table.columns
+
+    def resource(name):
+        """자원 ID 열 (-1: 아직 처리되지 않음 -> 결측값)"""
+        values = pd.Series(columns[name][printed])
+        return values.where(values >= 0).astype("Int64")
+
+    return pd.DataFrame({
+        "DAY": (columns["printing_start"][printed] // 24).astype(np.int64) + 1,
+        "JOB_ID": printed,
+        "ASSIGNED_PRINTER": resource("printer_id"),
+        "PRINTING_START": columns["printing_start"][printed],
+        "PRINTING_FINISH": columns["printing_finish"][printed],
+        "ASSIGNED_POSTPROCESS_WORKER": resource("post_processing_worker"),
+        "POSTPROCESSING_START": columns["post_processing_start"][printed],
+        "POSTPROCESSING_FINISH": columns["post_processing_finish"][printed],
+        "ASSIGNED_PACKAGING_WORKER": resource("packaging_worker"),
+        "PACKAGING_START": columns["packaging_start"][printed],
+        "PACKAGING_FINISH": columns["packaging_finish"][printed],
+    }, columns=REPORT_COLUMNS)
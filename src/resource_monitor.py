@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+from job_table import STAGE_CODES
+
+# StageMonitor 클래스: 공정 하나의 바쁜 자원 수와 대기열 길이를 계단 함수(step function)로 기록
+# - 상태가 바뀔 때만 (시간, 바쁜 자원 수, 대기열 길이)를 배열에 추가 (O(1), dict 미사용)
+# - 시간 가중 평균은 누적 면적(cumulative area)과 이진 탐색으로 계산
+class StageMonitor:
+    def __init__(self, env, name, capacity, busy_count, queue, size=1024):
+        self.env = env  # SimPy 환경 객체
+        self.name = name  # 공정 이름 (예: "Printing")
+        self.capacity = capacity  # 자원 수
+        self.busy_count = busy_count  # 바쁜 자원 수를 반환하는 함수
+        self.queue = queue  # 대기열 (len() 사용)
+        self.times = np.zeros(size)
+        self.busy = np.zeros(size, dtype=np.int32)
+        self.queue_length = np.zeros(size, dtype=np.int32)
+        self.count = 1  # 0번 칸: 시작 상태 (시간 0, 모두 idle, 대기열 비어 있음)
+
+    def update(self):
+        """현재 상태를 기록 (이전 기록과 같으면 무시, 같은 시점의 기록은 덮어씀)"""
+        busy = self.busy_count()
+        queue_length = len(self.queue)
+        last = self.count - 1
+        if busy == self.busy[last] and queue_length == self.queue_length[last]:
+            return
+        now = self.env.now
+        if now != self.times[last]:
+            if self.count == len(self.times):
+                self.times = np.concatenate([self.times, np.zeros(self.count)])
+                self.busy = np.concatenate([self.busy, np.zeros(self.count, dtype=np.int32)])
+                self.queue_length = np.concatenate([self.queue_length, np.zeros(self.count, dtype=np.int32)])
+            last = self.count
+            self.count += 1
+        self.times[last] = now
+        self.busy[last] = busy
+        self.queue_length[last] = queue_length
+
+    def series(self):
+        """(시간, 바쁜 자원 수, 대기열 길이) 배열"""
+        return self.times[:self.count], self.busy[:self.count], self.queue_length[:self.count]
+
+    def time_averages(self, edges):
+        """구간 [edges[i], edges[i + 1])별 바쁜 자원 수와 대기열 길이의 시간 가중 평균"""
+        times, busy, queue_length = self.series()
+        edges = np.asarray(edges, dtype=float)
+        k = np.maximum(np.searchsorted(times, edges, side='right') - 1, 0)  # 각 경계 시점의 상태
+        averages = []
+        for values in (busy, queue_length):
+            area = np.concatenate([[0.0], np.cumsum(values[:-1] * np.diff(times))])  # times[i]까지의 면적
+            area_at = area[k] + values[k] * (edges - times[k])
+            averages.append(np.diff(area_at) / np.diff(edges))
+        return averages[0], averages[1]
+
+
+# ResourceMonitor 클래스: 공정별 StageMonitor 모음과 가동률/WIP/병목 보고
+# - utilization: 평균 바쁜 자원 수 / 자원 수
+# - avg_queue: 시간 가중 평균 대기열 길이, avg_wip: 처리 중 + 대기 중인 평균 Job 수
+# - 병목(bottleneck): 가동률이 가장 높은 공정 (같으면 평균 대기열이 긴 공정)
+class ResourceMonitor:
+    def __init__(self, env):
+        self.env = env
+        self.stages = {}  # 공정 이름 -> StageMonitor
+
+    def register(self, name, capacity, busy_count, queue):
+        """공정을 등록하고 StageMonitor 반환"""
+        self.stages[name] = StageMonitor(self.env, name, capacity, busy_count, queue)
+        return self.stages[name]
+
+    def _table(self, edges):
+        """시간 구간별·공정별 지표 DataFrame"""
+        rows = []
+        for name in sorted(self.stages, key=lambda name: STAGE_CODES.get(name, len(STAGE_CODES))):  # 공정 순서
+            stage = self.stages[name]
+            busy, queue_length = stage.time_averages(edges)
+            rows.append(pd.DataFrame({
+                "stage": name,
+                "start": edges[:-1],
+                "end": edges[1:],
+                "utilization": busy / max(stage.capacity, 1),
+                "avg_busy": busy,
+                "avg_queue": queue_length,
+                "avg_wip": busy + queue_length,
+            }))
+        table = pd.concat(rows, ignore_index=True)
+        # 구간별 병목 공정 표시
+        ranked = table.sort_values(["utilization", "avg_queue"], ascending=False, kind="stable")
+        table["bottleneck"] = False
+        table.loc[ranked.drop_duplicates("start").index, "bottleneck"] = True
+        return table
+
+    def summary(self, end=None):
+        """전체 기간(0 ~ end, 기본: 현재 시간)의 공정별 지표 DataFrame"""
+        end = self.env.now if end is None else end
+        return self._table(np.array([0.0, max(end, 1e-9)])).drop(columns=["start", "end"]).set_index("stage")
+
+    def daily_table(self, end=None):
+        """하루 단위 공정별 지표 DataFrame (DAY: 1부터 시작)"""
+        end = self.env.now if end is None else end
+        edges = np.arange(0.0, max(np.ceil(end / 24), 1) * 24 + 1, 24)
+        table = self._table(edges)
+        table.insert(0, "DAY", (table["start"] // 24).astype(int) + 1)
+        return table.drop(columns=["start", "end"]).sort_values("DAY", kind="stable", ignore_index=True)
+
+    def bottleneck(self, end=None):
+        """전체 기간의 병목 공정 이름"""
+        summary = self.summary(end)
+        return summary.index[summary["bottleneck"]][0]
@@ -0,0 +1,182 @@
+import os
+import numpy as np
+import pandas as pd
+from job_table import JOB_COLUMNS, STAGES, STAGE_CODES
+
+# 결과 파일 형식 -> 확장자
+EXPORT_FORMATS = {
+    "CSV": ".csv",
+    "PARQUET": ".parquet",
+    "FEATHER": ".feather",
+}
+
+# Stage 코드 -> 이름 (예: 0 -> "Printing")
+STAGE_NAMES = np.array([STAGES[code][0] for code in sorted(STAGES)])
+
+
+# TableWriter 클래스: 열(name -> 배열) 묶음을 한 파일에 chunk 단위로 추가
+# - PARQUET: chunk 하나가 row group 하나 (pyarrow 필요)
+# - FEATHER: Arrow IPC 파일에 record batch로 추가 (pyarrow 필요)
+# - CSV: 파일 끝에 행 추가 (압축 미지원)
+class TableWriter:
+    def __init__(self, path, fmt, compression=None):
+        self.path = path
+        self.fmt = fmt
+        self.compression = compression
+        self._writer = None
+        if fmt in ("PARQUET", "FEATHER"):
+            import pyarrow  # Parquet/Feather 출력에는 pyarrow 필요
+            import pyarrow.parquet
+            import pyarrow.ipc
+            self._pa = pyarrow
+        elif os.path.exists(path):
+            os.remove(path)
+
+    def write(self, columns):
+        """열 묶음을 chunk 하나로 기록 (열 dtype 유지)"""
+        if not len(next(iter(columns.values()))):
+            return
+        if self.fmt == "CSV":
+            pd.DataFrame(columns).to_csv(self.path, mode="a", header=not os.path.exists(self.path), index=False)
+            return
+        batch = self._pa.record_batch(list(columns.values()), names=list(columns))
+        if self._writer is None:
+            if self.fmt == "PARQUET":
+                self._writer = self._pa.parquet.ParquetWriter(self.path, batch.schema, compression=self.compression or "none")
+            else:
+                options = self._pa.ipc.IpcWriteOptions(compression=self.compression)
+                self._writer = self._pa.ipc.new_file(self.path, batch.schema, options=options)
+        if self.fmt == "PARQUET":
+            self._writer.write_table(self._pa.Table.from_batches([batch]))
+        else:
+            self._writer.write_batch(batch)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+# ResultExporter 클래스: 시뮬레이션 중 결과 테이블(jobs, stages, costs, satisfication)을 파일로 내보냄
+# - flush(day): 하루가 끝날 때 호출 (비용 초기화 전). 쌓인 행이 row_group_size 이상이면 기록
+# - close(): 남은 행(처리 중인 Job 포함)을 모두 기록하고 파일을 닫음
+# - jobs: 처리가 끝난 Job(포장 완료 또는 shortage)의 모든 열 (JobTable과 같은 dtype)
+# - stages: 공정 완료 기록 (job_id, stage, resource_id, start_time, end_time)
+# - costs: 하루별 비용 항목, satisfication: 하루별 누적 만족도
+class ResultExporter:
+    def __init__(self, sim, directory, fmt="PARQUET", compression="zstd", row_group_size=65536):
+        self.sim = sim
+        self.row_group_size = row_group_size
+        os.makedirs(directory, exist_ok=True)
+        self.writers = {
+            name: TableWriter(os.path.join(directory, name + EXPORT_FORMATS[fmt]), fmt, compression)
+            for name in ("jobs", "stages", "costs", "satisfication")
+        }
+        self.pending_jobs = []  # 기록 대기 중인 Job ID 배열
+        self.pending_job_count = 0
+        self.exported = np.zeros(0, dtype=bool)  # Job ID별 기록 여부
+        self.job_cursor = 0  # 이 값 미만의 Job은 모두 기록됨
+        self.stage_start = 0  # 기록 대기 중인 공정 완료 기록의 시작 위치
+        self.daily_rows = {"costs": [], "satisfication": []}
+        self.completion_start = 0  # 완료 Job 수를 세지 않은 공정 완료 기록의 시작 위치
+
+    def _collect_jobs(self, final=False):
+        """처리가 끝난 Job 중 아직 기록되지 않은 Job ID를 모음"""
+        table = self.sim.logs.job_table
+        if len(self.exported) < table.size:
+            exported = np.zeros(table.capacity, dtype=bool)
+            exported[:len(self.exported)] = self.exported
+            self.exported = exported
+        rows = slice(self.job_cursor, table.size)
+        columns = table.columns
+        done = ~self.exported[rows]
+        if not final:
+            done &= ~np.isnan(columns["packaging_finish"][rows]) | (columns["shortage"][rows] > 0)
+        job_ids = np.flatnonzero(done) + self.job_cursor
+        if len(job_ids):
+            self.exported[job_ids] = True
+            self.pending_jobs.append(job_ids)
+            self.pending_job_count += len(job_ids)
+        # 앞쪽의 연속으로 기록된 Job은 다음부터 검사하지 않음
+        remaining = np.flatnonzero(~self.exported[rows])
+        self.job_cursor = self.job_cursor + remaining[0] if len(remaining) else table.size
+
+    def _write_jobs(self):
+        if not self.pending_jobs:
+            return
+        job_ids = np.concatenate(self.pending_jobs)
+        columns = self.sim.logs.job_table.columns
+        table = {"job_id": job_ids}
+        table.update({name: columns[name][job_ids] for name in JOB_COLUMNS})
+        self.writers["jobs"].write(table)
+        self.pending_jobs = []
+        self.pending_job_count = 0
+
+    def _write_stages(self, end):
+        table = self.sim.logs.job_table
+        job_ids = table.event_job[self.stage_start:end]
+        codes = table.event_stage[self.stage_start:end]
+        resource_ids = np.full(len(job_ids), -1, dtype=np.int32)
+        start_time = np.full(len(job_ids), np.nan)
+        end_time = np.full(len(job_ids), np.nan)
+        for code, (_, resource_column, prefix, _) in STAGES.items():
+            mask = codes == code
+            resource_ids[mask] = table.columns[resource_column][job_ids[mask]]
+            start_time[mask] = table.columns[prefix + "_start"][job_ids[mask]]
+            end_time[mask] = table.columns[prefix + "_finish"][job_ids[mask]]
+        self.writers["stages"].write({
+            "job_id": job_ids,
+            "stage": STAGE_NAMES[codes],
+            "resource_id": resource_ids,
+            "start_time": start_time,
+            "end_time": end_time,
+        })
+        self.stage_start = end
+
+    def _write_daily(self, name):
+        rows = self.daily_rows[name]
+        if rows:
+            self.writers[name].write({key: np.array([row[key] for row in rows]) for key in rows[0]})
+            self.daily_rows[name] = []
+
+    def flush(self, day):
+        """하루 결과를 모으고, row_group_size 이상 쌓인 테이블을 기록"""
+        logs = self.sim.logs
+        cost_row = {"day": day}
+        cost_row.update({cost_type: float(value) for cost_type, value in logs.daily_cost_report.items()})
+        self.daily_rows["costs"].append(cost_row)
+        table = logs.job_table
+        completed = table.event_stage[self.completion_start:table.event_count] == STAGE_CODES["Packaging"]  # 포장 완료 (Shortage 제외)
+        self.daily_rows["satisfication"].append({
+            "day": day,
+            "completed_jobs": int(completed.sum()),
+            "total_satisfication": float(self.sim.satisfication.total_satisfication),
+        })
+        self.completion_start = table.event_count
+
+        self._collect_jobs()
+        if self.pending_job_count >= self.row_group_size:
+            self._write_jobs()
+        if logs.job_table.event_count - self.stage_start >= self.row_group_size:
+            self._write_stages(logs.job_table.event_count)
+        for name, rows in self.daily_rows.items():
+            if len(rows) >= self.row_group_size:
+                self._write_daily(name)
+
+    def close(self):
+        """남은 행을 모두 기록하고 파일을 닫음"""
+        self._collect_jobs(final=True)
+        self._write_jobs()
+        self._write_stages(self.sim.logs.job_table.event_count)
+        for name in self.daily_rows:
+            self._write_daily(name)
+        for writer in self.writers.values():
+            writer.close()
+
+
+def make_exporter(sim):
+    """설정(RESULT_EXPORT, RESULT_EXPORT_DIR, RESULT_EXPORT_COMPRESSION)에 맞는 exporter 생성 (None: 내보내지 않음)"""
+    config = sim.config
+    if config.RESULT_EXPORT is None:
+        return None
+    return ResultExporter(sim, config.RESULT_EXPORT_DIR, config.RESULT_EXPORT, config.RESULT_EXPORT_COMPRESSION)
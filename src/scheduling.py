@@ -0,0 +1,74 @@
+from job_queue import FitClassQueue, QUEUE_KEYS
+from build_plate import ShelfPacker  # build plate 배치 heuristic
+
+# 스케줄링 정책 -> (Job 우선순위 key, 프린터 선택 규칙)
+# - Job 우선순위 key가 None이면 QUEUE_POLICY["PRINTING"] 사용 (기본 "FIFO")
+# - FIFO: 대기열 순서, 첫 번째 적합 프린터 (기존 방식)
+# - SPT: 제작 시간이 짧은 Job 먼저, EDD: 납기가 빠른 Job 먼저
+# - BEST_FIT: 적합한 프린터 중 build volume이 가장 작은 프린터
+# - LEAST_LOADED: 적합한 프린터 중 누적 작업 시간이 가장 적은 프린터
+SCHEDULING_POLICIES = {
+    "FIFO": (None, "FIRST_FIT"),
+    "SPT": ("BUILD_TIME", "FIRST_FIT"),
+    "EDD": ("DUE_DATE", "FIRST_FIT"),
+    "BEST_FIT": (None, "BEST_FIT"),
+    "LEAST_LOADED": (None, "LEAST_LOADED"),
+}
+
+
+def _positions(mask):
+    """bitmask의 bit 위치 순회"""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+# Scheduler 클래스: 프린터 할당 대기열과 프린터 선택 규칙
+# - 대기열은 적합 프린터 묶음별 heap (FitClassQueue)이므로 Job 선택은 O(C + log n)
+# - 프린터 선택은 후보 프린터(적합 & idle) bit만 확인 (O(P))
+class Scheduler:
+    def __init__(self, env, config, printer_index):
+        self.config = config
+        self.printer_index = printer_index
+        job_key, self.printer_rule = SCHEDULING_POLICIES[config.SCHEDULING_POLICY]
+        self.job_key = QUEUE_KEYS[job_key or config.QUEUE_POLICY["PRINTING"]]
+        self.queue = FitClassQueue(env, self.job_key)  # 프린터 할당 대기열
+
+        # BEST_FIT: build volume이 작은 순서의 bit 위치 (같으면 PRINTERS 순서)
+        volumes = [
+            printer["WIDTH"] * printer["HEIGHT"] * printer["DEPTH"]
+            for printer in (config.PRINTERS[printer_id] for printer_id in printer_index.printer_ids)
+        ]
+        self.volume_order = sorted(range(len(volumes)), key=lambda position: (volumes[position], position))
+
+    def choose_printer(self, candidates, printers):
+        """후보 프린터 bitmask에서 할당할 프린터의 bit 위치 선택"""
+        if self.printer_rule == "BEST_FIT":
+            return next(position for position in self.volume_order if candidates >> position & 1)
+        if self.printer_rule == "LEAST_LOADED":
+            return min(_positions(candidates), key=lambda position: (printers[position].busy_time, position))
+        return self.printer_index.lowest(candidates)  # FIRST_FIT
+
+    def fill_plate(self, job, position):
+        """BATCHING 설정 시 job과 같은 plate에 배치할 대기 Job 목록 (job 제외, 우선순위 순서)"""
+        config = self.config
+        if not config.BATCHING or config.BATCH_MAX_JOBS <= 1:
+            return []
+        printer = config.PRINTERS[self.printer_index.printer_ids[position]]
+        packer = ShelfPacker(printer["WIDTH"], printer["HEIGHT"], printer["DEPTH"], config.BATCH_SPACING)
+        packer.place(job)  # 첫 번째 Job은 프린터에 들어가므로 항상 배치됨
+        material = job.material  # 한 plate는 한 가지 재료로만 출력
+        return self.queue.take_fitting(
+            1 << position,
+            lambda other: packer.count < config.BATCH_MAX_JOBS and other.material == material and packer.place(other),
+            config.BATCH_LOOKAHEAD
+        )
+
+    def next_assignment(self, printers):
+        """다음으로 할당할 (Job, 프린터 bit 위치) 반환 (할당할 수 있는 Job이 없으면 None)"""
+        idle_mask = self.printer_index.idle_mask
+        job = self.queue.pop_best(idle_mask)
+        if job is None:
+            return None
+        return job, self.choose_printer(job.suitable_mask & idle_mask, printers)
@@ -0,0 +1,145 @@
+from bisect import bisect_left, bisect_right
+
+# 작업자 근무 달력 (WORK_CALENDARS)
+# - 시뮬레이션 시간 0 = 월요일 0시, 달력은 1주(168시간) 단위로 반복
+# - 시작 시 근무 구간(휴식 시간 제외)을 한 번 계산하고, 근무 시간 누적값으로 작업 종료 시간을 O(log n)에 계산
+# - 근무 시작 시간마다 이벤트 하나만 발생 (시간 단위 polling 없음)
+WEEK = 168
+STAGE_CALENDARS = ("POST_PROCESSING", "PACKAGING")  # WORK_CALENDARS의 공정 이름
+
+
+def _daily(day, start, end):
+    """day 요일의 start ~ end시 구간 (end <= start이면 다음 날 end시까지, 주 경계에서 나눔)"""
+    start, end = day * 24 + start, day * 24 + end + (24 if end <= start else 0)
+    if end <= WEEK:
+        return [(start, end)]
+    return [(start, WEEK), (0, end - WEEK)]
+
+
+def _merge(intervals):
+    """겹치거나 붙어 있는 구간을 합침"""
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+
+def _subtract(intervals, holes):
+    """intervals에서 holes 구간을 뺌"""
+    result = []
+    for start, end in intervals:
+        for hole_start, hole_end in holes:
+            if hole_end <= start or hole_start >= end:
+                continue
+            if hole_start > start:
+                result.append((start, hole_start))
+            start = max(start, hole_end)
+            if start >= end:
+                break
+        if start < end:
+            result.append((start, end))
+    return result
+
+
+def _check_hours(name, hours):
+    """(시작 시, 종료 시) 목록 검증"""
+    for item in hours:
+        if len(item) != 2 or not (0 <= item[0] < 24 and 0 <= item[1] <= 24) or item[0] == item[1]:
+            raise ValueError(f"{name} entries must be (start, end) hours in [0, 24] with start != end, got {item}")
+
+
+# ShiftCalendar 클래스: 근무 요일(DAYS), 근무 시간(SHIFTS), 휴식 시간(BREAKS)으로 만든 1주 근무 구간
+class ShiftCalendar:
+    def __init__(self, spec):
+        days = tuple(spec.get("DAYS", range(7)))
+        shifts = tuple(spec.get("SHIFTS", ((0, 24),)))
+        breaks = tuple(spec.get("BREAKS", ()))
+        if not set(days) <= set(range(7)):
+            raise ValueError(f"DAYS must be weekdays 0 (Monday) to 6 (Sunday), got {days}")
+        _check_hours("SHIFTS", shifts)
+        _check_hours("BREAKS", breaks)
+
+        # 근무 요일의 근무 시간 - 매일의 휴식 시간
+        working = [interval for day in days for start, end in shifts for interval in _daily(day, start, end)]
+        holes = [interval for day in range(7) for start, end in breaks for interval in _daily(day, start, end)]
+        intervals = _subtract(_merge(working), _merge(holes))
+        if not intervals:
+            raise ValueError("has no working time")
+
+        self.starts = [start for start, _ in intervals]  # 근무 구간 시작 (주 기준 시간)
+        self.ends = [end for _, end in intervals]  # 근무 구간 종료
+        self.cumulative = []  # 근무 구간 시작까지의 누적 근무 시간
+        total = 0
+        for start, end in intervals:
+            self.cumulative.append(total)
+            total += end - start
+        self.cumulative_end = [cumulative + end - start for cumulative, start, end in zip(self.cumulative, self.starts, self.ends)]
+        self.weekly_hours = total  # 1주 근무 시간
+
+    def is_working(self, time):
+        """time이 근무 시간인지 (근무 구간 [시작, 종료))"""
+        offset = time % WEEK
+        i = bisect_right(self.starts, offset) - 1
+        return i >= 0 and offset < self.ends[i]
+
+    def next_start(self, time, after=False):
+        """time 이후(after가 False이면 time 포함) 첫 근무 구간 시작 시간"""
+        week, offset = divmod(time, WEEK)
+        i = (bisect_right if after else bisect_left)(self.starts, offset)
+        if i == len(self.starts):
+            week, i = week + 1, 0
+        return week * WEEK + self.starts[i]
+
+    def worked(self, time):
+        """시간 0부터 time까지의 누적 근무 시간"""
+        week, offset = divmod(time, WEEK)
+        i = bisect_right(self.starts, offset) - 1
+        if i < 0:
+            return week * self.weekly_hours
+        return week * self.weekly_hours + self.cumulative[i] + min(offset, self.ends[i]) - self.starts[i]
+
+    def finish_time(self, start, duration):
+        """start부터 근무 시간 중에만 duration 시간 작업했을 때의 종료 시간 (근무 외 시간에는 작업이 멈춤)"""
+        if duration <= 0:
+            return start
+        week, target = divmod(self.worked(start) + duration, self.weekly_hours)
+        if target == 0:  # 주의 마지막 근무 구간 종료 시간에 끝남
+            week, target = week - 1, self.weekly_hours
+        i = bisect_left(self.cumulative_end, target)
+        return week * WEEK + self.starts[i] + target - self.cumulative[i]
+
+
+def compile_calendars(config, errors):
+    """WORK_CALENDARS를 공정 이름 -> ShiftCalendar(None이면 24시간 근무)로 변환 (잘못된 설정은 errors에 추가)"""
+    calendars = {}
+    for stage in STAGE_CALENDARS:
+        spec = config.WORK_CALENDARS.get(stage)
+        try:
+            calendars[stage] = None if spec is None else ShiftCalendar(spec)
+        except ValueError as error:
+            errors.append(f"WORK_CALENDARS[{stage!r}] {error}")
+    unknown = set(config.WORK_CALENDARS) - set(STAGE_CALENDARS)
+    if unknown:
+        errors.append(f"WORK_CALENDARS has unknown stage(s): {sorted(unknown)}")
+    return calendars
+
+
+def shift_process(env, stage, calendar):
+    """근무 시작 시간마다 대기 중인 Job을 비어 있는 작업자에게 할당
+    (달력 기준이므로 checkpoint 재개 시에도 같은 시간, 재개 시점의 근무 시작도 포함)
+    """
+    start = calendar.next_start(env.now)
+    while True:
+        yield env.timeout(start - env.now)
+        stage.start_shift()
+        start = calendar.next_start(start, after=True)
+
+
+def start_shifts(env, stages):
+    """근무 달력이 있는 공정(PostProcessing / Packaging)별 근무 시작 프로세스 등록"""
+    for stage in stages:
+        if stage.calendar is not None:
+            env.process(shift_process(env, stage, stage.calendar))
@@ -0,0 +1,74 @@
+import math
+from statistics import NormalDist
+import numpy as np
+
+def t_quantile(p, df):
+    """Student t 분포의 p 분위수
+    - df = 1, 2: 닫힌 형태의 정확한 값
+    - df >= 3: 정규 분위수의 Cornish-Fisher 전개 (오차 약 1e-3 이하)
+    """
+    if df == 1:
+        return math.tan(math.pi * (p - 0.5))
+    if df == 2:
+        return (2 * p - 1) / math.sqrt(2 * p * (1 - p))
+    z = NormalDist().inv_cdf(p)
+    g1 = (z ** 3 + z) / 4
+    g2 = (5 * z ** 5 + 16 * z ** 3 + 3 * z) / 96
+    g3 = (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / 384
+    g4 = (79 * z ** 9 + 776 * z ** 7 + 1482 * z ** 5 - 1920 * z ** 3 - 945 * z) / 92160
+    return z + g1 / df + g2 / df ** 2 + g3 / df ** 3 + g4 / df ** 4
+
+def confidence_interval(values, confidence=0.95):
+    """표본 평균과 t 분포 기반 신뢰구간 계산
+    반환: {"mean", "std", "half_width", "low", "high", "n"} (n < 2이면 half_width = NaN)
+    """
+    values = np.asarray(values, dtype=float)
+    values = values[~np.isnan(values)]
+    n = len(values)
+    mean = float(values.mean()) if n else math.nan
+    if n < 2:
+        std = math.nan
+        half_width = math.nan
+    else:
+        std = float(values.std(ddof=1))
+        half_width = t_quantile(0.5 + confidence / 2, n - 1) * std / math.sqrt(n)
+    return {
+        "mean": mean,
+        "std": std,
+        "half_width": half_width,
+        "low": mean - half_width,
+        "high": mean + half_width,
+        "n": n
+    }
+
+def mser_truncation(series, batch_size=5):
+    """MSER (Marginal Standard Error Rule) warm-up 절단 위치 계산
+    - series를 batch_size개씩 평균한 batch 평균(MSER-5: batch_size = 5)에 대해
+      d개를 버렸을 때의 통계량 sum((x_i - mean_d)^2) / (n - d)^2 이 최소인 d를 선택
+    - d는 batch 수의 절반 이하에서만 탐색 (뒤쪽 절반만 남는 경우는 warm-up 판단을 신뢰할 수 없음)
+    반환: 버릴 관측값 수 (원래 series 기준, batch가 2개 미만이면 0)
+    """
+    series = np.asarray(series, dtype=float)
+    n = len(series) // batch_size
+    if n < 2:
+        return 0
+    batches = series[:n * batch_size].reshape(n, batch_size).mean(axis=1)
+    # 뒤에서부터 누적한 합계/제곱합으로 모든 d의 통계량을 한 번에 계산 (O(n))
+    tail_sum = np.cumsum(batches[::-1])[::-1]
+    tail_square = np.cumsum(batches[::-1] ** 2)[::-1]
+    count = n - np.arange(n)
+    statistic = (tail_square - tail_sum ** 2 / count) / count ** 2
+    d = int(np.argmin(statistic[:n // 2 + 1]))
+    return d * batch_size
+
+def batch_means(values, batches=20, confidence=0.95):
+    """비중첩 batch means 방법으로 한 실행의 상관된 관측값 평균과 신뢰구간 계산
+    (values를 순서대로 batches개 구간으로 나눈 구간 평균을 독립 표본으로 보고 confidence_interval 적용)
+    """
+    values = np.asarray(values, dtype=float)
+    values = values[~np.isnan(values)]
+    size = len(values) // batches
+    if size == 0:
+        return confidence_interval(values[:0], confidence)
+    means = values[:size * batches].reshape(batches, size).mean(axis=1)
+    return confidence_interval(means, confidence)
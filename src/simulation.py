@@ -0,0 +1,120 @@
+import copy
+from types import SimpleNamespace
+import config_Simpy  # 기본 설정 값
+from log_simpy import SimLogs  # Simulation별 로그
+import environment as env  # 환경 생성 및 프로세스 정의
+from event_sink import make_sink  # 이벤트 sink (console / file / no-op)
+import checkpoint  # 상태 저장/복원
+from random_streams import RandomStreams  # 용도별 난수 stream
+from trace_demand import TraceDemand  # 과거 주문 파일 replay
+from compiled_config import compile_config  # 설정 검증 및 lookup table 변환
+
+def load_config(**overrides):
+    """config_Simpy의 설정 값(대문자 이름)을 복사하고 overrides로 덮어쓴 설정 객체 반환"""
+    values = {
+        name: copy.deepcopy(value)
+        for name, value in vars(config_Simpy).items()
+        if name.isupper()
+    }
+    unknown = set(overrides) - set(values)
+    if unknown:
+        raise KeyError(f"Unknown config name(s): {sorted(unknown)}")
+    values.update(copy.deepcopy(overrides))
+    return SimpleNamespace(**values)
+
+# Simulation 클래스: 설정, 로그, 누적값과 SimPy 객체를 한 시뮬레이션 단위로 묶음
+# - 모듈 전역 변수를 사용하지 않으므로 한 프로세스(또는 여러 프로세스)에서
+#   서로 독립적인 시뮬레이션을 여러 개 실행할 수 있음
+class Simulation:
+    def __init__(self, seed=None, events=None, demand=None, **overrides):
+        self.config = load_config(**overrides)  # 설정 (예: self.config.PRINTERS)
+        self.compiled = compile_config(self.config)  # Job 유형 / 프린터 기술 lookup table (잘못된 설정이면 ValueError)
+        self.logs = SimLogs()  # 로그 및 누적값 (예: self.logs.daily_reports)
+        self.events = events if events is not None else make_sink(self.config)  # 이벤트 sink
+        self.streams = RandomStreams(seed)  # 용도별 난수 stream (seed: int 또는 SeedSequence)
+        # Job 도착 stream (DemandStream / TraceDemand, 여러 시나리오가 공유 가능, None이면 난수로 생성)
+        if demand is None and self.config.DEMAND_TRACE:
+            demand = TraceDemand(self.config.DEMAND_TRACE, self.config, seed=seed)
+        self.demand = demand
+
+        # create_env에서 채워지는 객체
+        self.cost = None
+        self.monitor = None
+        self.simpy_env = None
+        self.packaging = None
+        self.post_processor = None
+        self.customer = None
+        self.display = None
+        self.printers = None
+        self.satisfication = None
+
+    def build(self, initial_time=0):
+        """SimPy 환경 및 객체를 생성하고 이벤트 프로세스를 등록"""
+        components = env.create_env(self, initial_time)
+        env.simpy_event_processes(*components[:-1])
+        return components
+
+    def has_work(self):
+        """처리 중이거나 대기 중인 Job이 남아 있는지 확인 (Job 생성 여부는 보지 않음)"""
+        return (
+            bool(self.customer.create_job_list)
+            or any(printer.is_busy for printer in self.printers)
+            or bool(self.post_processor.queue)
+            or self.post_processor.workers.busy_count() > 0
+            or bool(self.packaging.queue)
+            or self.packaging.workers.busy_count() > 0
+        )
+
+    def run(self, horizon=None, drain=True, snapshot_every=None, snapshot_path="checkpoint_{time:g}.pkl", on_day=None):
+        """horizon 시간(기본: SIM_TIME * 24)까지 실행
+        - drain: horizon에서 Job 생성을 멈추고 남은 Job을 모두 처리할 때까지 하루 단위로 계속 실행
+          (False이면 horizon에서 멈춤, 이후 run을 다시 호출하거나 checkpoint에서 재개 가능)
+        - snapshot_every: 이 시간 간격마다 snapshot_path({time}: 시뮬레이션 시간)에 checkpoint 저장
+        - on_day: 하루(24시간)가 끝날 때마다 날짜(1부터)를 인자로 호출 (일별 보고서 출력 등)
+        (이벤트 sink는 checkpoint / 하루마다 flush, drain이 끝나면 close)
+        """
+        if self.simpy_env is None:
+            self.build()
+        horizon = self.config.SIM_TIME * 24 if horizon is None else horizon
+        if drain:
+            self.customer.arrival_end = min(self.customer.arrival_end, horizon)
+        while self.simpy_env.now < horizon:
+            until = horizon
+            if snapshot_every:
+                until = min(until, (self.simpy_env.now // snapshot_every + 1) * snapshot_every)
+            if on_day is not None:
+                until = min(until, (self.simpy_env.now // 24 + 1) * 24)
+            self._run_until(until, on_day)
+            if snapshot_every and until % snapshot_every == 0:
+                self.save_checkpoint(snapshot_path.format(time=until))
+        if drain:
+            while self.has_work():
+                self._run_until((self.simpy_env.now // 24 + 1) * 24, on_day)
+            self.events.close()
+        return self
+
+    def _run_until(self, until, on_day):
+        """until 시간까지 실행하고 이벤트 sink flush (하루가 끝났으면 on_day 호출)"""
+        self.simpy_env.run(until=until)
+        self.events.flush()
+        if on_day is not None and until % 24 == 0:
+            on_day(int(until // 24))
+
+    def save_checkpoint(self, path):
+        """현재 상태를 path에 저장 (simpy_env.run(until=...)이 끝난 시점에 호출)"""
+        checkpoint.save_checkpoint(self, path)
+        return path
+
+    @classmethod
+    def resume(cls, path, events=None, demand=None, **overrides):
+        """checkpoint 파일에서 Simulation을 복원 (overrides: 재개 후 바꿀 설정, 예: 정책 비교용 분기)
+        (DemandStream으로 실행한 경우 같은 demand를 다시 넘겨야 함)
+        """
+        state = checkpoint.load_checkpoint(path)
+        unknown = set(overrides) - set(state["config"])
+        if unknown:
+            raise KeyError(f"Unknown config name(s): {sorted(unknown)}")
+        sim = cls(events=events, demand=demand, **{**state["config"], **overrides})
+        sim.build(initial_time=state["now"])
+        checkpoint.restore_state(sim, state)
+        return sim
@@ -0,0 +1,216 @@
+import argparse
+import csv
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+import numpy as np
+import config_Simpy  # 기본 설정 값 (PRINTERS 등)
+from replication import run_replication, summarize  # replication 실행 및 요약
+
+#### 실험 설계 ################################################################
+# Sweep point는 {이름: 값} dict이며, 이름은 config_Simpy의 설정 이름이거나 아래 축약 이름
+# - PRINTER_COUNT: config_Simpy.PRINTERS의 모델을 순서대로 반복하여 N대의 프린터 구성
+# - POST_PROCESSING_WORKER_COUNT: 후처리 작업자 수
+# - PACKAGING_MACHINE_COUNT: 포장 기계 수
+
+def grid_design(grid):
+    """{이름: 값 목록} 격자의 모든 조합을 sweep point 목록으로 반환"""
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[name] for name in names))]
+
+def latin_hypercube_design(ranges, samples, seed=None):
+    """{이름: (최소, 최대)} 범위에서 Latin hypercube 표본을 sweep point 목록으로 반환
+    (최소/최대가 모두 정수이면 정수로 반올림)
+    """
+    rng = np.random.default_rng(seed)
+    points = [{} for _ in range(samples)]
+    for name, (low, high) in ranges.items():
+        # 구간을 samples개로 나누고 각 구간에서 하나씩 뽑은 뒤 순서를 섞음
+        values = low + (rng.permutation(samples) + rng.random(samples)) / samples * (high - low)
+        if isinstance(low, int) and isinstance(high, int):
+            values = np.rint(values).astype(int)
+        for point, value in zip(points, values.tolist()):
+            point[name] = value
+    return points
+
+def point_to_overrides(point):
+    """sweep point를 Simulation 설정 overrides로 변환"""
+    overrides = {}
+    for name, value in point.items():
+        if name == "PRINTER_COUNT":
+            models = list(config_Simpy.PRINTERS.values())
+            overrides["PRINTERS"] = {
+                printer_id: {**models[printer_id % len(models)], "ID": printer_id}
+                for printer_id in range(value)
+            }
+        elif name == "POST_PROCESSING_WORKER_COUNT":
+            overrides["POST_PROCESSING_WORKER"] = {worker_id: {"ID": worker_id} for worker_id in range(value)}
+        elif name == "PACKAGING_MACHINE_COUNT":
+            overrides["PACKAGING_MACHINE"] = {worker_id: {"ID": worker_id} for worker_id in range(value)}
+        else:
+            overrides[name] = value
+    return overrides
+
+#### 결과 저장 ################################################################
+# ResultWriter 클래스: sweep 결과 행을 파일에 바로바로 추가
+# - ".parquet": pyarrow가 설치된 경우 row group 단위로 기록
+# - 그 외: CSV (헤더는 첫 기록 시 한 번만)
+# - 열은 지금까지 기록한 모든 행의 열 합집합 (일부 point에만 있는 KPI가 나오면 열을 추가하여 파일을 다시 씀, 없는 값은 빈 칸)
+# - 파일이 이미 있으면 overwrite가 True일 때만 덮어씀 (아니면 FileExistsError)
+class ResultWriter:
+    def __init__(self, path, overwrite=False):
+        self.path = path
+        self.columns = []
+        self.rows = []  # 기록한 행 (열이 추가되면 다시 쓰기 위해 보관, point당 한 행)
+        self._parquet_writer = None
+        self._use_parquet = path.endswith(".parquet")
+        if os.path.exists(path):
+            if not overwrite:
+                raise FileExistsError(f"{path} already exists (use overwrite=True to replace it)")
+            os.remove(path)
+        if self._use_parquet:
+            import pyarrow  # Parquet 출력에는 pyarrow 필요
+            import pyarrow.parquet
+            self._pa = pyarrow
+
+    def write(self, rows):
+        """행(dict) 목록 기록"""
+        if not rows:
+            return
+        new_columns = [name for name in dict.fromkeys(name for row in rows for name in row) if name not in self.columns]
+        self.rows.extend(rows)
+        if new_columns:
+            self.columns.extend(new_columns)
+            rows = self.rows  # 새 열이 생기면 모든 행을 새 열 목록으로 다시 씀
+        if self._use_parquet:
+            batch = self._pa.table({name: [row.get(name) for row in rows] for name in self.columns})
+            if new_columns:
+                if self._parquet_writer is not None:
+                    self._parquet_writer.close()
+                self._parquet_writer = self._pa.parquet.ParquetWriter(self.path, batch.schema)
+            self._parquet_writer.write_table(batch.cast(self._parquet_writer.schema))
+        else:
+            with open(self.path, "w" if new_columns else "a", newline="") as file:
+                writer = csv.DictWriter(file, fieldnames=self.columns)
+                if new_columns:
+                    writer.writeheader()
+                writer.writerows(rows)
+
+    def close(self):
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+
+#### Sweep 실행 ###############################################################
+
+def _replication_seed(seed_sequence, index):
+    """replication 번호별 seed (모든 sweep point에서 같은 번호는 같은 seed 사용)
+    (Simulation의 난수 stream이 용도별로 분리되어 있으므로 같은 번호의 replication은 모든 point에서 같은 수요를 처리함)
+    """
+    return np.random.SeedSequence(seed_sequence.entropy, spawn_key=(index,))
+
+def _point_row(point, results, confidence):
+    """sweep point 하나의 결과 행 생성
+    (자원 수가 point마다 다르므로 자원별 utilization 대신 stage_utilization만 기록)
+    """
+    row = {
+        name: value if np.isscalar(value) else json.dumps(value)
+        for name, value in point.items()
+    }
+    row["replications"] = len(results)
+    for name, stats in summarize(results, confidence).items():
+        if name.startswith("utilization."):
+            continue
+        row[f"{name}_mean"] = stats["mean"]
+        row[f"{name}_half_width"] = stats["half_width"]
+    return row
+
+def _precise_enough(results, target_kpi, target_half_width, relative, confidence):
+    """목표 KPI의 신뢰구간 half-width가 기준 이하인지 확인 (기준이 없으면 min_replications 이후 바로 종료)"""
+    if target_half_width is None:
+        return True
+    stats = summarize(results, confidence)[target_kpi]
+    half_width = stats["half_width"]
+    if relative:
+        half_width = half_width / abs(stats["mean"]) if stats["mean"] else np.inf
+    return half_width <= target_half_width
+
+def run_sweep(points, output, seed=None, min_replications=5, max_replications=30, batch_replications=None,
+              target_kpi="throughput", target_half_width=None, relative=True, confidence=0.95, max_workers=None,
+              overwrite=False):
+    """sweep point마다 replication을 process pool에서 병렬 실행하고 결과를 파일에 스트리밍
+    - 처음에 min_replications개를 실행하고, 목표 KPI의 신뢰구간 half-width가
+      target_half_width(relative=True이면 평균 대비 비율) 이하가 될 때까지
+      batch_replications개씩 추가 (최대 max_replications, target_half_width가 None이면 min_replications개만 실행)
+    - 하나의 process pool을 모든 point가 공유하며, 끝난 point부터 결과 행을 기록
+    - output 파일이 이미 있으면 overwrite가 True일 때만 덮어씀
+    반환: point별 결과 행 목록
+    """
+    seed_sequence = np.random.SeedSequence(seed)
+    batch_replications = batch_replications or min_replications
+    writer = ResultWriter(output, overwrite)
+    results = [[] for _ in points]  # point별 replication KPI
+    submitted = [0] * len(points)  # point별 제출한 replication 수
+    pending = {}  # future -> point 번호
+    rows = []
+
+    def submit(executor, index, count):
+        overrides = point_to_overrides(points[index])
+        count = min(count, max_replications - submitted[index])
+        for _ in range(count):
+            future = executor.submit(run_replication, _replication_seed(seed_sequence, submitted[index]), overrides)
+            pending[future] = index
+            submitted[index] += 1
+
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for index in range(len(points)):
+                submit(executor, index, min_replications)
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    results[index].append(future.result())
+                    if len(results[index]) < submitted[index]:
+                        continue  # 같은 point의 replication이 아직 실행 중
+                    if (submitted[index] < max_replications
+                            and not _precise_enough(results[index], target_kpi, target_half_width, relative, confidence)):
+                        submit(executor, index, batch_replications)
+                        continue
+                    # point 완료: 결과 행 기록
+                    row = _point_row(points[index], results[index], confidence)
+                    rows.append(row)
+                    writer.write([row])
+    finally:
+        writer.close()
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description="3D printing farm scenario sweep")
+    design = parser.add_mutually_exclusive_group(required=True)
+    design.add_argument("--grid", type=json.loads, help='예: \'{"PRINTER_COUNT": [3, 5], "JOB_CREATION_INTERVAL": [1, 2]}\'')
+    design.add_argument("--lhs", type=json.loads, help='예: \'{"JOB_CREATION_INTERVAL": [0.5, 3], "PRINTER_COUNT": [2, 10]}\'')
+    parser.add_argument("--samples", type=int, default=10, help="Latin hypercube 표본 수")
+    parser.add_argument("--output", default="sweep_results.csv", help="결과 파일 (.csv 또는 .parquet)")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--min-reps", type=int, default=5)
+    parser.add_argument("--max-reps", type=int, default=30)
+    parser.add_argument("--target-kpi", default="throughput")
+    parser.add_argument("--half-width", type=float, default=None, help="조기 종료 기준 신뢰구간 half-width (없으면 --min-reps만 실행)")
+    parser.add_argument("--absolute", action="store_true", help="half-width를 평균 대비 비율이 아닌 절대값으로 사용")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--overwrite", action="store_true", help="결과 파일이 이미 있으면 덮어씀")
+    args = parser.parse_args()
+
+    if args.grid is not None:
+        points = grid_design(args.grid)
+    else:
+        points = latin_hypercube_design({name: tuple(bounds) for name, bounds in args.lhs.items()}, args.samples, args.seed)
+    rows = run_sweep(points, args.output, args.seed, args.min_reps, args.max_reps,
+                     target_kpi=args.target_kpi, target_half_width=args.half_width,
+                     relative=not args.absolute, max_workers=args.workers, overwrite=args.overwrite)
+    print(f"{len(rows)} sweep points written to {args.output}")
+
+if __name__ == "__main__":
+    main()
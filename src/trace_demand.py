@@ -0,0 +1,152 @@
+import os
+import numpy as np
+import pandas as pd
+from job_generator import JOB_FIELDS, job_attributes  # Job 속성 계산 (JobBatch와 같은 공식)
+from random_streams import RandomStreams  # 포장 시간 선택용 난수 stream
+from compiled_config import compile_config  # 재료 -> Job 유형 lookup
+
+# 주문 파일의 기본 열 이름 (Job 속성 -> 파일 열 이름, material / due_date는 없어도 됨)
+TRACE_COLUMNS = {
+    "timestamp": "timestamp",
+    "width": "width",
+    "height": "height",
+    "depth": "depth",
+    "material": "material",
+    "due_date": "due_date",
+}
+
+# TraceDemand 클래스: 과거 주문 파일(CSV / Parquet)을 chunk 단위로 읽어 Job 도착 stream으로 제공
+# - JobGenerator의 demand 인자로 사용 (DemandStream과 같은 chunk 인터페이스)
+# - 파일 전체를 읽지 않고 read_size 행씩 읽음 (CSV: pandas chunksize + memory_map, Parquet: pyarrow row batch + memory_map)
+# - timestamp / due_date: 숫자이면 시간 단위 (time_unit 배수), 날짜 문자열이면 origin(기본: 첫 주문 시간)부터의 경과 시간
+# - 도착 간격은 다음 주문과의 시간 차이 (마지막 주문은 0), 주문은 timestamp 순서로 정렬되어 있어야 함
+# - Job 유형은 material 열의 재료를 사용하는 첫 번째 JOB_TYPES 유형 (열이 없거나 빈 값이면 JOB_TYPE_MIX의 주 유형)
+# - 볼륨과 작업 시간은 Job 유형의 공식으로 계산 (포장 시간 범위 선택만 난수 사용)
+class TraceDemand:
+    def __init__(self, path, sim_config, columns=None, origin=None, time_unit=1.0, read_size=65536, seed=None):
+        self.path = path
+        self.sim_config = sim_config
+        self.compiled = compile_config(sim_config)
+        self.columns = {**TRACE_COLUMNS, **(columns or {})}
+        self.origin = None if origin is None else pd.Timestamp(origin)  # 날짜 timestamp의 시간 0
+        self.time_unit = time_unit  # 숫자 timestamp 1단위의 시간 (예: 분 단위이면 1 / 60)
+        self.read_size = read_size
+        self.seed = seed
+        self._first_arrival = None  # 첫 주문의 도착 시간 (처음 읽을 때 기록, 읽기 위치와 무관)
+        self._reset()
+
+    def _reset(self):
+        """파일 처음부터 다시 읽을 준비"""
+        self._reader = None  # 파일 chunk iterator (처음 읽을 때 생성)
+        self._position = 0  # 버퍼 첫 행의 주문 번호
+        self._buffer = None  # 읽었지만 아직 반환하지 않은 행 {열 이름: 배열} (arrival: 도착 시간)
+        self._finished = False
+        self._last_arrival = -np.inf  # 마지막으로 읽은 주문의 도착 시간 (정렬 확인용)
+        self._streams = RandomStreams(self.seed)
+
+    def __getstate__(self):
+        # 파일 iterator는 pickle할 수 없으므로 process pool 등에 넘길 때는 처음 상태로 보냄
+        state = vars(self).copy()
+        state.update(_reader=None, _position=0, _buffer=None, _finished=False, _last_arrival=-np.inf,
+                     _streams=RandomStreams(self.seed))
+        return state
+
+    def _open(self):
+        """파일 형식에 맞는 chunk iterator 생성 (DataFrame 단위)"""
+        extension = os.path.splitext(self.path)[1].lower()
+        if extension == ".parquet":
+            import pyarrow.parquet  # Parquet 읽기에는 pyarrow 필요
+            parquet = pyarrow.parquet.ParquetFile(self.path, memory_map=True)
+            names = [name for name in self.columns.values() if name in parquet.schema_arrow.names]
+            return (batch.to_pandas() for batch in parquet.iter_batches(batch_size=self.read_size, columns=names))
+        header = pd.read_csv(self.path, nrows=0).columns
+        names = [name for name in self.columns.values() if name in header]
+        return pd.read_csv(self.path, usecols=names, chunksize=self.read_size, memory_map=True)
+
+    def _hours(self, values):
+        """timestamp 열을 시뮬레이션 시간(시간 단위) 배열로 변환"""
+        if pd.api.types.is_numeric_dtype(values):
+            return values.to_numpy(dtype=float) * self.time_unit
+        times = pd.to_datetime(values)
+        if self.origin is None:
+            self.origin = times.iloc[0]
+        return ((times - self.origin) / pd.Timedelta(hours=1)).to_numpy(dtype=float)
+
+    def _job_types(self, values):
+        """재료 이름을 Job 유형 번호로 변환 (JOB_TYPES에 없는 재료이면 ValueError)"""
+        material_type = self.compiled.material_type
+        job_types = np.empty(len(values), dtype=np.int16)
+        for index, material in enumerate(values.tolist()):
+            if material is None or material != material:  # 빈 값 (None / NaN)
+                job_types[index] = self.compiled.single_type
+            elif material in material_type:
+                job_types[index] = material_type[material]
+            else:
+                raise ValueError(f"Material {material!r} in {self.path} has no job type in JOB_TYPES")
+        return job_types
+
+    def _convert(self, frame):
+        """파일 chunk를 Job 속성 배열로 변환"""
+        names = self.columns
+        rows = {
+            "arrival": self._hours(frame[names["timestamp"]]),
+            **{name: frame[names[name]].to_numpy(dtype=np.int32) for name in ("width", "height", "depth")},
+        }
+        if names["material"] in frame:
+            rows["job_type"] = self._job_types(frame[names["material"]])
+        else:
+            rows["job_type"] = np.full(len(frame), self.compiled.single_type, dtype=np.int16)
+        rows.update(job_attributes(
+            self.sim_config, self.compiled, rows["job_type"], rows["width"], rows["height"], rows["depth"], self._streams
+        ))
+        if names["due_date"] in frame:
+            rows["due_date"] = self._hours(frame[names["due_date"]])
+        arrival = rows["arrival"]
+        if len(arrival) and (arrival[0] < self._last_arrival or np.any(np.diff(arrival) < 0)):
+            raise ValueError(f"Orders in {self.path} must be sorted by {names['timestamp']}")
+        if len(arrival):
+            self._last_arrival = arrival[-1]
+            if self._first_arrival is None:
+                self._first_arrival = max(float(arrival[0]), 0.0)
+        return rows
+
+    def _fill(self, count):
+        """버퍼에 count개 이상의 행이 있도록 파일을 읽음 (파일 끝이면 남은 행만)"""
+        if self._reader is None:
+            self._reader = iter(self._open())
+        while not self._finished and (self._buffer is None or len(self._buffer["arrival"]) < count):
+            frame = next(self._reader, None)
+            if frame is None:
+                self._finished = True
+                break
+            rows = self._convert(frame)
+            if self._buffer is not None:
+                rows = {name: np.concatenate([self._buffer[name], values]) for name, values in rows.items()}
+            self._buffer = rows
+
+    def first_arrival(self):
+        """첫 주문의 도착 시간 (주문이 없으면 None, 여러 Simulation이 같은 객체를 사용해도 같은 값)"""
+        if self._first_arrival is None and self._position == 0:
+            self._fill(1)
+        return self._first_arrival
+
+    def chunk(self, start, size):
+        """start번째 주문부터 최대 size개 Job의 (도착 간격, {속성 이름: 배열})"""
+        if start < self._position:
+            self._reset()  # checkpoint 재개 등으로 앞쪽 위치를 요청하면 처음부터 다시 읽음
+        # 마지막 행의 도착 간격을 계산하려면 다음 행이 하나 더 필요
+        self._fill(start - self._position + size + 1)
+        if self._buffer is None:
+            return np.zeros(0), {name: np.zeros(0, dtype=np.int64) for name in JOB_FIELDS}
+        skip = start - self._position
+        arrival = self._buffer["arrival"]
+        end = min(skip + size, len(arrival))
+        following = arrival[skip + 1:end + 1]
+        interval = np.zeros(max(end - skip, 0))
+        interval[:len(following)] = following - arrival[skip:skip + len(following)]  # 마지막 주문은 0
+        fields = {name: values[skip:end] for name, values in self._buffer.items() if name != "arrival"}
+
+        # 반환한 행은 버퍼에서 제거
+        self._buffer = {name: values[end:] for name, values in self._buffer.items()}
+        self._position += end
+        return interval, fields
@@ -1,147 +1,307 @@
+import base64
+import io
+import os
 import matplotlib.pyplot as plt
+from matplotlib.collections import PolyCollection
+from matplotlib.patches import Patch
+import numpy as np
 import pandas as pd
-import random
 
-def visualization(export_Daily_Report):
+# 공정별 (리소스 라벨, 담당 자원 열, 시작 열, 종료 열)
+GANTT_STAGES = [
+    ("Printer", "ASSIGNED_PRINTER", "PRINTING_START", "PRINTING_FINISH"),
+    ("Post-Processor", "ASSIGNED_POSTPROCESS_WORKER", "POSTPROCESSING_START", "POSTPROCESSING_FINISH"),
+    ("Packaging", "ASSIGNED_PACKAGING_WORKER", "PACKAGING_START", "PACKAGING_FINISH"),
+]
+
+BAR_HEIGHT = 0.8  # 막대 높이 (ax.barh 기본값과 동일)
+
+def convert_time_to_float(time_value):
+    """시간 값을 float로 변환 ("HH:MM" 문자열 지원, 그 외 형식은 NaN)"""
+    if isinstance(time_value, str):  # 문자열인 경우
+        try:
+            hours, minutes = map(int, time_value.split(":"))
+            return hours + minutes / 60.0
+        except ValueError:
+            return None
+    elif isinstance(time_value, (int, float)):  # 숫자형 데이터인 경우
+        return time_value
+    return None  # 기타 형식은 NaN으로 처리
+
+def gantt_intervals(daily_reports):
+    """Daily Report DataFrame을 리소스별 작업 구간 배열로 변환
+    :return: (resource_labels, y 위치, 시작 시간, 작업 시간, Job ID) - 배열은 모든 공정의 구간을 이어 붙인 것
+    """
+    resource_labels = []
+    y_positions, starts, durations, job_ids = [], [], [], []
+    for label, resource_column, start_column, finish_column in GANTT_STAGES:
+        # 시간 열 변환 (숫자형 열은 그대로 사용)
+        start = daily_reports[start_column]
+        finish = daily_reports[finish_column]
+        if start.dtype == object:
+            start = start.apply(convert_time_to_float)
+            finish = finish.apply(convert_time_to_float)
+
+        resources = pd.to_numeric(daily_reports[resource_column], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+        assigned = ~np.isnan(resources)
+        # 리소스(프린터, 작업자) 번호를 세로축 위치로 변환
+        resource_ids, index = np.unique(resources[assigned].astype(np.int64), return_inverse=True)
+        y_positions.append(index + len(resource_labels))
+        resource_labels.extend(f"{label} {resource_id}" for resource_id in resource_ids)
+
+        start = start.to_numpy(dtype=float)[assigned]
+        starts.append(start)
+        durations.append(finish.to_numpy(dtype=float)[assigned] - start)
+        job_ids.append(daily_reports["JOB_ID"].to_numpy()[assigned])
+    return (resource_labels, np.concatenate(y_positions), np.concatenate(starts),
+            np.concatenate(durations), np.concatenate(job_ids))
+
+def bar_polygons(y_positions, starts, durations, height=BAR_HEIGHT):
+    """작업 구간을 PolyCollection용 사각형 꼭짓점 배열 (n, 4, 2)로 변환"""
+    left = starts
+    right = starts + durations
+    bottom = y_positions - height / 2
+    top = y_positions + height / 2
+    return np.stack([
+        np.column_stack([left, bottom]),
+        np.column_stack([left, top]),
+        np.column_stack([right, top]),
+        np.column_stack([right, bottom]),
+    ], axis=1)
+
+def visualization(export_Daily_Report, label_max_jobs=200):
     """
     Gantt 차트를 생성하여 3D 프린팅 팜의 모든 작업자와 프린터를 포함하고 Job별로 고유 색상으로 작업을 시각화합니다.
+    모든 작업 막대는 PolyCollection 하나로 그립니다.
     :param export_Daily_Report: 시뮬레이션 작업 기록 데이터 리스트
+    :param label_max_jobs: Job 수가 이 값 이하일 때만 막대별 라벨(Job ID, 작업 시간)과 Job 범례 표시 (None: 항상 표시)
     """
     # 데이터 프레임 변환
     daily_reports = pd.DataFrame(export_Daily_Report)
+    resource_labels, y_positions, starts, durations, job_ids = gantt_intervals(daily_reports)
 
-    # 시간 데이터를 변환
-    def convert_time_to_float(time_value):
-        if isinstance(time_value, str):  # 문자열인 경우
-            try:
-                hours, minutes = map(int, time_value.split(":"))
-                return hours + minutes / 60.0
-            except ValueError:
-                return None
-        elif isinstance(time_value, (int, float)):  # 숫자형 데이터인 경우
-            return time_value
-        return None  # 기타 형식은 NaN으로 처리
-
-    # 시간 열 변환
-    time_columns = [
-        "PRINTING_START", "PRINTING_FINISH",
-        "POSTPROCESSING_START", "POSTPROCESSING_FINISH",
-        "PACKAGING_START", "PACKAGING_FINISH"
-    ]
-    for col in time_columns:
-        if col in daily_reports.columns:
-            daily_reports[col] = daily_reports[col].apply(convert_time_to_float)
-
-    # Job ID별 고유 색상 생성
-    def generate_unique_color():
-        """고유한 색상을 생성 (RGB 값)"""
-        return [random.random() for _ in range(3)]  # R, G, B 값 무작위 생성
-
-    job_colors = {job_id: generate_unique_color() for job_id in daily_reports['JOB_ID'].unique()}
-
-    # 리소스(프린터, 작업자) 목록 생성
-    all_printers = sorted(daily_reports["ASSIGNED_PRINTER"].dropna().unique())
-    all_post_processors = sorted(daily_reports["ASSIGNED_POSTPROCESS_WORKER"].dropna().unique())
-    all_packaging_workers = sorted(daily_reports["ASSIGNED_PACKAGING_WORKER"].dropna().unique())
-
-    resource_labels = (
-        [f"Printer {int(printer)}" for printer in all_printers] +
-        [f"Post-Processor {int(worker)}" for worker in all_post_processors] +
-        [f"Packaging {int(worker)}" for worker in all_packaging_workers]
-    )
-
-    # 리소스를 세로축에 표시하기 위해 리소스별로 번호 매기기
-    resource_map = {label: idx for idx, label in enumerate(resource_labels)}
+    # Job ID별 고유 색상 생성 (RGB 값 무작위 생성)
+    unique_jobs, job_index = np.unique(job_ids, return_inverse=True)
+    job_colors = np.random.random((len(unique_jobs), 3))
 
     fig, ax = plt.subplots(figsize=(16, 10))
 
-    # 각 작업(Job)을 리소스별로 시각화
-    for _, row in daily_reports.iterrows():
-        # 프린팅 작업
-        if not pd.isna(row["ASSIGNED_PRINTER"]):
-            y_pos = resource_map[f"Printer {int(row['ASSIGNED_PRINTER'])}"]
-            duration = row["PRINTING_FINISH"] - row["PRINTING_START"]
-            ax.barh(
-                y_pos,
-                duration,
-                left=row["PRINTING_START"],
-                color=job_colors[row["JOB_ID"]],
-                edgecolor='black',
-                label=f"Job {row['JOB_ID']}" if f"Job {row['JOB_ID']}" not in ax.get_legend_handles_labels()[1] else None
-            )
-            ax.text(
-                row["PRINTING_START"] + duration / 2,
-                y_pos,
-                f"{row['JOB_ID']}",
-                va='center', ha='center', color='white', fontsize=8, weight='bold'
-            )
-            ax.text(
-                row["PRINTING_START"] + duration / 2,
-                y_pos - 0.2,
-                f"{duration:.2f}h",
-                va='center', ha='center', color='black', fontsize=8
-            )
-
-        # 후처리 작업
-        if not pd.isna(row["ASSIGNED_POSTPROCESS_WORKER"]):
-            y_pos = resource_map[f"Post-Processor {int(row['ASSIGNED_POSTPROCESS_WORKER'])}"]
-            duration = row["POSTPROCESSING_FINISH"] - row["POSTPROCESSING_START"]
-            ax.barh(
-                y_pos,
-                duration,
-                left=row["POSTPROCESSING_START"],
-                color=job_colors[row["JOB_ID"]],
-                edgecolor='black'
-            )
-            ax.text(
-                row["POSTPROCESSING_START"] + duration / 2,
-                y_pos,
-                f"{row['JOB_ID']}",
-                va='center', ha='center', color='white', fontsize=8, weight='bold'
-            )
-            ax.text(
-                row["POSTPROCESSING_START"] + duration / 2,
-                y_pos - 0.2,
-                f"{duration:.2f}h",
-                va='center', ha='center', color='black', fontsize=8
-            )
-
-        # 포장 작업
-        if not pd.isna(row["ASSIGNED_PACKAGING_WORKER"]):
-            y_pos = resource_map[f"Packaging {int(row['ASSIGNED_PACKAGING_WORKER'])}"]
-            duration = row["PACKAGING_FINISH"] - row["PACKAGING_START"]
-            ax.barh(
-                y_pos,
-                duration,
-                left=row["PACKAGING_START"],
-                color=job_colors[row["JOB_ID"]],
-                edgecolor='black'
-            )
-            ax.text(
-                row["PACKAGING_START"] + duration / 2,
-                y_pos,
-                f"{row['JOB_ID']}",
-                va='center', ha='center', color='white', fontsize=8, weight='bold'
-            )
-            ax.text(
-                row["PACKAGING_START"] + duration / 2,
-                y_pos - 0.2,
-                f"{duration:.2f}h",
-                va='center', ha='center', color='black', fontsize=8
-            )
+    # 모든 작업(Job)을 한 번에 그림
+    bars = PolyCollection(
+        bar_polygons(y_positions, starts, durations),
+        facecolors=job_colors[job_index],
+        edgecolors='black',
+        linewidths=0.5
+    )
+    ax.add_collection(bars)
+    if len(starts):
+        ax.set_xlim(np.nanmin(starts), np.nanmax(starts + durations))
+    ax.set_ylim(-0.5, len(resource_labels) - 0.5)
+
+    show_labels = label_max_jobs is None or len(unique_jobs) <= label_max_jobs
+    if show_labels:
+        # 막대별 Job ID 및 작업 시간 표시
+        centers = starts + durations / 2
+        for x, y, job_id, duration in zip(centers, y_positions, job_ids, durations):
+            ax.text(x, y, f"{job_id}", va='center', ha='center', color='white', fontsize=8, weight='bold')
+            ax.text(x, y - 0.2, f"{duration:.2f}h", va='center', ha='center', color='black', fontsize=8)
 
     # 세로축 설정
-    ax.set_yticks(list(resource_map.values()))
-    ax.set_yticklabels(list(resource_map.keys()))
+    ax.set_yticks(range(len(resource_labels)))
+    ax.set_yticklabels(resource_labels)
     ax.set_xlabel("Time")
     ax.set_ylabel("Resources")
     ax.set_title("Job Scheduling Gantt Chart")
 
-    # 범례 추가
-    handles, labels = ax.get_legend_handles_labels()
-    unique_labels = dict(zip(labels, handles))
-    ax.legend(unique_labels.values(), unique_labels.keys(), loc='upper right', bbox_to_anchor=(1.15, 1))
+    # 범례 추가 (Job별 handle을 한 번에 생성)
+    if show_labels:
+        handles = [Patch(facecolor=color, edgecolor='black') for color in job_colors]
+        ax.legend(handles, [f"Job {job_id}" for job_id in unique_jobs], loc='upper right', bbox_to_anchor=(1.15, 1))
 
     # 레이아웃 조정 및 출력
     plt.tight_layout()
     plt.show()
+
+
+# OccupancyIndex 클래스: 긴 시뮬레이션의 Gantt 차트를 시간 창(window) 단위로 그리기 위한 index
+# - 리소스별로 작업 구간을 시작 시간 순으로 정렬 (한 리소스는 한 번에 한 작업(또는 같은 구간의 build plate)만 처리하므로 종료 시간도 정렬됨)
+# - 점유율은 리소스별로 겹치는 구간을 합친 구간으로 계산 (같은 plate의 Job을 중복해서 세지 않음)
+# - 시간 창과 겹치는 구간은 리소스별 이진 탐색으로 찾음 (O(R log n))
+# - 여러 확대 수준(level)의 점유율(occupancy) 행렬을 미리 계산:
+#   level 0은 base_bin 시간 단위, level k는 base_bin * factor**k 시간 단위 (값: 0~1)
+class OccupancyIndex:
+    def __init__(self, resource_labels, y_positions, starts, durations, job_ids, base_bin=0.25, factor=4, levels=6, seed=None):
+        self.resource_labels = resource_labels
+        order = np.lexsort((starts, y_positions))
+        self.y_positions = y_positions[order]
+        self.starts = starts[order]
+        self.durations = durations[order]
+        self.ends = self.starts + self.durations
+        self.job_ids = job_ids[order]
+        # 리소스별 구간 범위: bounds[r] ~ bounds[r + 1]
+        self.bounds = np.searchsorted(self.y_positions, np.arange(len(resource_labels) + 1))
+        # 점유율 계산용 리소스별 병합 구간 및 누적 작업 시간
+        self.busy_starts, self.busy_ends, self.busy_bounds = self._merged_intervals()
+        self.cumulative = np.concatenate([[0.0], np.cumsum(self.busy_ends - self.busy_starts)])
+
+        # Job별 색상 (모든 창에서 같은 색상 사용)
+        unique_jobs, self.job_index = np.unique(self.job_ids, return_inverse=True)
+        self.job_colors = np.random.default_rng(seed).random((len(unique_jobs), 3))
+
+        # 점유율 행렬 (level별)
+        self.origin = np.floor(np.min(self.starts, initial=0) / base_bin) * base_bin
+        horizon = max(np.max(self.ends, initial=0) - self.origin, base_bin)
+        block = factor ** (levels - 1)
+        bin_count = int(np.ceil(horizon / base_bin / block)) * block  # 가장 큰 level에서도 나누어 떨어지도록
+        edges = self.origin + base_bin * np.arange(bin_count + 1)
+        busy = np.array([self.busy_until(resource, edges) for resource in range(len(resource_labels))])
+        occupancy = np.diff(busy.reshape(len(resource_labels), bin_count + 1), axis=1) / base_bin
+        self.bin_widths = [base_bin * factor ** level for level in range(levels)]
+        self.occupancy = [occupancy]
+        for _ in range(1, levels):
+            occupancy = occupancy.reshape(len(resource_labels), -1, factor).mean(axis=2)
+            self.occupancy.append(occupancy)
+
+    @classmethod
+    def from_report(cls, export_Daily_Report, **kwargs):
+        """Daily Report(dict 리스트 또는 DataFrame)로 index 생성"""
+        return cls(*gantt_intervals(pd.DataFrame(export_Daily_Report)), **kwargs)
+
+    @property
+    def end(self):
+        return np.max(self.ends, initial=self.origin)
+
+    def _merged_intervals(self):
+        """리소스별로 겹치거나 붙어 있는 구간을 합친 (시작 시간, 종료 시간, 리소스별 범위) 배열"""
+        starts, ends, bounds = [np.zeros(0)], [np.zeros(0)], [0]
+        for resource in range(len(self.resource_labels)):
+            lo, hi = self.bounds[resource], self.bounds[resource + 1]
+            s, e = self.starts[lo:hi], self.ends[lo:hi]
+            group = np.flatnonzero(np.concatenate([[True], s[1:] > np.maximum.accumulate(e)[:-1]])) if hi > lo else []
+            starts.append(s[group])  # 새 병합 구간을 시작하는 구간
+            ends.append(np.maximum.reduceat(e, group) if hi > lo else np.zeros(0))
+            bounds.append(bounds[-1] + len(group))
+        return np.concatenate(starts), np.concatenate(ends), np.array(bounds)
+
+    def busy_until(self, resource, times):
+        """리소스가 times 시점까지 작업한 누적 시간 (겹치는 구간은 한 번만 셈)"""
+        lo, hi = self.busy_bounds[resource], self.busy_bounds[resource + 1]
+        k = lo + np.searchsorted(self.busy_starts[lo:hi], times, side='right') - 1  # times 이전에 시작한 마지막 구간
+        started = k >= lo
+        k = np.where(started, k, lo)
+        partial = (
+            np.clip(times - self.busy_starts[k], 0, self.busy_ends[k] - self.busy_starts[k]) if hi > lo else np.zeros(len(times))
+        )
+        return np.where(started, self.cumulative[k] - self.cumulative[lo] + partial, 0.0)
+
+    def window(self, start, end):
+        """시간 창 [start, end)와 겹치는 구간의 index 배열"""
+        selected = []
+        for resource in range(len(self.resource_labels)):
+            lo, hi = self.bounds[resource], self.bounds[resource + 1]
+            first = lo + np.searchsorted(self.ends[lo:hi], start, side='right')
+            last = lo + np.searchsorted(self.starts[lo:hi], end, side='left')
+            selected.append(np.arange(first, last))
+        return np.concatenate(selected) if selected else np.zeros(0, dtype=np.int64)
+
+    def level_for(self, start, end, max_bins):
+        """시간 창을 max_bins개 이하의 bin으로 표시할 수 있는 가장 세밀한 level"""
+        for level, width in enumerate(self.bin_widths):
+            if (end - start) / width <= max_bins:
+                return level
+        return len(self.bin_widths) - 1
+
+    def occupancy_window(self, level, start, end):
+        """시간 창에 해당하는 점유율 행렬과 x축 범위 (bin 경계에 맞춤)"""
+        width = self.bin_widths[level]
+        occupancy = self.occupancy[level]
+        first = int(np.clip(np.floor((start - self.origin) / width), 0, occupancy.shape[1]))
+        last = int(np.clip(np.ceil((end - self.origin) / width), first, occupancy.shape[1]))
+        return occupancy[:, first:last], (self.origin + first * width, self.origin + last * width)
+
+def plot_gantt_window(index, start, end, ax=None, max_bars=2000, max_bins=800, label_max_jobs=200):
+    """OccupancyIndex의 시간 창 [start, end)를 그림
+    - 보이는 구간이 max_bars개 이하이면 Job별 막대, 그보다 많으면 점유율 heatmap (level 자동 선택)
+    """
+    if ax is None:
+        _, ax = plt.subplots(figsize=(16, 10))
+    visible = index.window(start, end)
+    if len(visible) <= max_bars:
+        # 보이는 구간만 막대로 그림
+        y_positions, starts, durations = index.y_positions[visible], index.starts[visible], index.durations[visible]
+        ax.add_collection(PolyCollection(
+            bar_polygons(y_positions, starts, durations),
+            facecolors=index.job_colors[index.job_index[visible]],
+            edgecolors='black',
+            linewidths=0.5
+        ))
+        job_ids = index.job_ids[visible]
+        if label_max_jobs is None or len(np.unique(job_ids)) <= label_max_jobs:
+            centers = (np.maximum(starts, start) + np.minimum(starts + durations, end)) / 2  # 창 안에 보이는 부분의 가운데
+            for x, y, job_id, duration in zip(centers, y_positions, job_ids, durations):
+                ax.text(x, y, f"{job_id}", va='center', ha='center', color='white', fontsize=8, weight='bold')
+                ax.text(x, y - 0.2, f"{duration:.2f}h", va='center', ha='center', color='black', fontsize=8)
+        detail = "jobs"
+    else:
+        # bin별 점유율을 heatmap으로 그림
+        level = index.level_for(start, end, max_bins)
+        occupancy, (left, right) = index.occupancy_window(level, start, end)
+        image = ax.imshow(
+            occupancy, aspect='auto', origin='lower', interpolation='nearest', cmap='Blues', vmin=0, vmax=1,
+            extent=(left, right, -0.5, len(index.resource_labels) - 0.5)
+        )
+        ax.figure.colorbar(image, ax=ax, label="Occupancy")
+        detail = f"occupancy, {index.bin_widths[level]:g}h bins"
+
+    ax.set_xlim(start, end)
+    ax.set_ylim(-0.5, len(index.resource_labels) - 0.5)
+    ax.set_yticks(range(len(index.resource_labels)))
+    ax.set_yticklabels(index.resource_labels)
+    ax.set_xlabel("Time")
+    ax.set_ylabel("Resources")
+    ax.set_title(f"Job Scheduling Gantt Chart ({start:g}h - {end:g}h, {detail})")
+    return ax
+
+def export_gantt_windows(export_Daily_Report, window_hours, output, **kwargs):
+    """전체 기간을 window_hours 단위 시간 창으로 나누어 Gantt 차트 저장
+    - output이 ".html"로 끝나면 전체 개요 + 창별 이미지를 담은 HTML 파일 하나
+    - 그 외에는 output 디렉토리에 창별 PNG 파일 (gantt_000.png, ...)
+    :return: 저장한 파일 경로 목록
+    """
+    index = OccupancyIndex.from_report(export_Daily_Report)
+    start = np.floor(index.origin / window_hours) * window_hours
+    windows = [(t, t + window_hours) for t in np.arange(start, index.end, window_hours)]
+
+    def render(window_start, window_end):
+        fig, ax = plt.subplots(figsize=(16, 10))
+        plot_gantt_window(index, window_start, window_end, ax=ax, **kwargs)
+        fig.tight_layout()
+        return fig
+
+    if output.endswith(".html"):
+        views = [("Overview", start, index.end)] + [
+            (f"{window_start:g}h - {window_end:g}h", window_start, window_end) for window_start, window_end in windows
+        ]
+        sections = []
+        for title, window_start, window_end in views:
+            fig = render(window_start, window_end)
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format="png")
+            plt.close(fig)
+            image = base64.b64encode(buffer.getvalue()).decode("ascii")
+            sections.append(f'<h2>{title}</h2>\n<img src="data:image/png;base64,{image}">')
+        with open(output, "w", encoding="utf-8") as file:
+            file.write("<html><head><meta charset=\"utf-8\"><title>Gantt Chart</title></head><body>\n")
+            file.write("\n".join(sections))
+            file.write("\n</body></html>\n")
+        return [output]
+
+    os.makedirs(output, exist_ok=True)
+    paths = []
+    for number, (window_start, window_end) in enumerate(windows):
+        fig = render(window_start, window_end)
+        path = os.path.join(output, f"gantt_{number:03d}.png")
+        fig.savefig(path)
+        plt.close(fig)
+        paths.append(path)
+    return paths
@@ -0,0 +1,30 @@
+from collections import deque
+
+# WorkerPool 클래스: 작업자(또는 포장 기계)의 idle free list
+# - acquire: 비어 있는 작업자 하나를 O(1)로 꺼냄 (없으면 None)
+# - release: 작업을 마친 작업자를 free list에 반환 (O(1))
+class WorkerPool:
+    def __init__(self, worker_ids):
+        self.idle = deque(worker_ids)  # 비어 있는 작업자 ID (free list)
+        self.is_busy = {worker_id: False for worker_id in self.idle}  # 작업자별 바쁨 상태
+
+    def acquire(self):
+        """비어 있는 작업자를 꺼내 바쁨 상태로 변경"""
+        if not self.idle:
+            return None
+        worker_id = self.idle.popleft()
+        self.is_busy[worker_id] = True
+        return worker_id
+
+    def release(self, worker_id):
+        """작업자를 free list에 반환"""
+        self.is_busy[worker_id] = False
+        self.idle.append(worker_id)
+
+    def idle_count(self):
+        """비어 있는 작업자 수"""
+        return len(self.idle)
+
+    def busy_count(self):
+        """작업 중인 작업자 수"""
+        return len(self.is_busy) - len(self.idle)
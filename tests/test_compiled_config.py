@@ -0,0 +1,84 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from compiled_config import compile_config  # 설정 검증 및 lookup table
+from simulation import load_config  # config_Simpy 복사 + overrides
+
+# FDM 2대(0, 3), SLA 1대(1), SLS 1대(2)
+MIXED_PRINTERS = {
+    0: {"ID": 0, "WIDTH": 256, "HEIGHT": 256, "DEPTH": 256, "TECHNOLOGY": "FDM"},
+    1: {"ID": 1, "WIDTH": 150, "HEIGHT": 150, "DEPTH": 150, "TECHNOLOGY": "SLA"},
+    2: {"ID": 2, "WIDTH": 200, "HEIGHT": 300, "DEPTH": 200, "TECHNOLOGY": "SLS"},
+    3: {"ID": 3, "WIDTH": 220, "HEIGHT": 220, "DEPTH": 250},  # TECHNOLOGY가 없으면 FDM
+}
+ALL_TYPES_MIX = {"DEFAULT": 1, "ABS_PART": 1, "RESIN_DETAIL": 1, "NYLON_FUNCTIONAL": 1}
+
+
+def _compile(**overrides):
+    return compile_config(load_config(**overrides))
+
+
+def _job_types(**changes):
+    """기본 JOB_TYPES의 DEFAULT 유형 값을 changes로 바꾼 JOB_TYPES"""
+    job_types = load_config().JOB_TYPES
+    job_types["DEFAULT"].update(changes)
+    return job_types
+
+
+@pytest.mark.parametrize("overrides, message", [
+    ({"PRINTERS": {0: {"ID": 0, "WIDTH": 100, "HEIGHT": 100, "DEPTH": 100, "TECHNOLOGY": "DLP"}}}, "'DLP' is not in PRINTER_TECHNOLOGIES"),
+    ({"PRINTER_TECHNOLOGIES": {"FDM": {"BUILD_MODEL": "SINTER", "MATERIALS": ("PLA",)}}}, "BUILD_MODEL"),
+    ({"PRINTER_TECHNOLOGIES": {"FDM": {"BUILD_MODEL": "LAYER", "MATERIALS": ("PLA",)}}}, "positive LAYER_TIME"),
+    ({"JOB_TYPES": _job_types(MATERIAL="TPU")}, "No printer can print job type"),
+    ({"JOB_TYPES": _job_types(INFILL=0)}, "INFILL"),
+    ({"JOB_TYPES": _job_types(WIDTH_RANGE=(50, 10))}, "low < high"),
+    ({"JOB_TYPE_MIX": {"DEFAULT": 1, "UNKNOWN": 1}}, "unknown job type"),
+    ({"JOB_TYPE_MIX": {"DEFAULT": 1, "ABS_PART": -1}}, "non-negative with a positive sum"),
+    ({"JOB_TYPE_MIX": {"DEFAULT": 0}}, "non-negative with a positive sum"),
+    ({"RELIABILITY": True, "PRINTER_RELIABILITY": {}}, "positive MTBF and MTTR"),
+    ({"FAILURE_POLICY": "SKIP"}, "FAILURE_POLICY"),
+    ({"MAINTENANCE": {"INTERVAL": 10, "DURATION": 20}}, "0 < DURATION < INTERVAL"),
+    ({"WORK_CALENDARS": {"POST_PROCESSING": {"DAYS": (7,)}}}, "DAYS must be weekdays"),
+    ({"WORK_CALENDARS": {"POST_PROCESSING": {"SHIFTS": ((8, 8),)}}}, "SHIFTS entries"),
+    ({"WORK_CALENDARS": {"PRINTING": None}}, "unknown stage"),
+])
+def test_invalid_configuration_raises_value_error(overrides, message):
+    with pytest.raises(ValueError, match=message):
+        _compile(**overrides)
+
+
+def test_material_masks_suitable_printers_by_technology():
+    """Job 유형의 재료를 출력할 수 있는 기술의 프린터만 적합 (bit 위치 = PRINTERS 순서)"""
+    compiled = _compile(PRINTERS=MIXED_PRINTERS, JOB_TYPE_MIX=ALL_TYPES_MIX)
+    masks = dict(zip(compiled.type_names, compiled.type_mask))
+    assert masks == {"DEFAULT": 0b1001, "ABS_PART": 0b1001, "RESIN_DETAIL": 0b0010, "NYLON_FUNCTIONAL": 0b0100}
+    technology = [compiled.technology_names[index] for index in compiled.primary_technology]
+    assert technology == ["FDM", "FDM", "SLA", "SLS"]
+
+
+def test_extrusion_build_time_uses_volume_infill_and_filament_area():
+    """EXTRUSION: 볼륨 * INFILL / (BUILD_SPEED * 필라멘트 단면적), 높이와 무관"""
+    compiled = _compile(PRINTERS=MIXED_PRINTERS, JOB_TYPE_MIX=ALL_TYPES_MIX)
+    area = 3.14 * (1.75 / 2) ** 2
+    job_type = np.array([0, 1, 1], dtype=np.int16)  # DEFAULT (BUILD_SPEED 3600, INFILL 1), ABS_PART (3000, 0.4)
+    volume = np.array([1e7, 1e7, 2e7])
+    times = compiled.build_times(job_type, volume, np.array([100, 100, 10]))
+    assert times.tolist() == [round(1e7 / (3600 * area)), round(1e7 * 0.4 / (3000 * area)), round(2e7 * 0.4 / (3000 * area))]
+
+
+def test_layer_build_time_counts_layers_of_tallest_job_on_plate():
+    """LAYER: ceil(높이 / LAYER_HEIGHT) * LAYER_TIME, plate는 가장 높은 Job 기준 (볼륨과 무관)"""
+    compiled = _compile(PRINTERS=MIXED_PRINTERS, JOB_TYPE_MIX=ALL_TYPES_MIX)
+    resin, nylon = compiled.type_index["RESIN_DETAIL"], compiled.type_index["NYLON_FUNCTIONAL"]
+    job_type = np.array([resin, resin, nylon], dtype=np.int16)
+    # RESIN: 100 / 0.05 = 2000층 * 0.01 (SLA), 30.01 / 0.05 -> 601층, NYLON: 30 / 0.1 = 300층 * 0.02 (SLS)
+    times = compiled.build_times(job_type, np.array([1e6, 1e3, 1e6]), np.array([100, 30.01, 30]))
+    assert times.tolist() == [20, 6, 6]
+
+    sla = compiled.technology_index["SLA"]
+    plate = [SimpleNamespace(job_type=resin, volume=1e6, height=height) for height in (100, 50, 20)]
+    assert compiled.plate_build_time(plate, sla) == 20
+    # 같은 Job을 FDM에서 출력하면 EXTRUSION 모델 (plate는 볼륨 합)
+    fdm = compiled.technology_index["FDM"]
+    assert compiled.plate_build_time(plate, fdm) == round(3e6 / (3600 * 3.14 * (1.75 / 2) ** 2))
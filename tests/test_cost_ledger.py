@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+from cost_ledger import COST_COLUMNS  # 비용 항목 -> JobTable 비용 열
+from simulation import Simulation  # 시뮬레이션 context
+from event_sink import NullSink  # 이벤트 로그를 남기지 않음
+
+
+@pytest.fixture(scope="module")
+def finished():
+    """main.py처럼 하루마다 daily_cost_report를 읽고 초기화한 시뮬레이션과 일별 비용 보고"""
+    sim = Simulation(seed=2, events=NullSink(), SIM_TIME=10)
+    sim.build()
+    reports = {}
+
+    def on_day(day):
+        reports[day] = dict(sim.logs.daily_cost_report)
+        sim.cost.clear_cost()
+
+    sim.run(on_day=on_day)
+    return sim, reports
+
+
+def test_ledger_matches_daily_cost_report_and_job_costs(finished):
+    sim, reports = finished
+    ledger = sim.cost
+    assert ledger.last_day == max(reports) > 7
+    for day, report in reports.items():
+        assert ledger.day_costs(day) == pytest.approx(report)
+    assert ledger.day_costs(ledger.last_day + 1) == dict.fromkeys(ledger.cost_types, 0.0)
+
+    totals = ledger.totals()
+    assert totals == pytest.approx({cost_type: sum(report[cost_type] for report in reports.values()) for cost_type in totals})
+    assert totals["Printing cost"] > 0
+    jobs = ledger.job_table()
+    assert len(jobs) == sim.logs.job_table.size
+    for cost_type, column in COST_COLUMNS.items():
+        if column is not None:
+            assert jobs[column].sum() == pytest.approx(totals[cost_type])
+
+
+def test_weekly_and_rolling_tables_aggregate_daily_costs(finished):
+    sim, reports = finished
+    ledger = sim.cost
+    daily = ledger.daily_table()
+    assert list(daily.index) == list(range(1, ledger.last_day + 1))
+
+    weekly = ledger.weekly_table()
+    assert weekly.index.name == "WEEK" and len(weekly) == -(-ledger.last_day // 7)
+    assert weekly.loc[2, "Printing cost"] == pytest.approx(sum(reports[day]["Printing cost"] for day in range(8, 15)))
+    pd.testing.assert_series_equal(weekly.sum(), daily.sum())
+
+    rolling = ledger.rolling_table(days=3)
+    assert rolling.loc[1].tolist() == daily.loc[1].tolist()  # 3일이 안 되면 있는 날짜만 합침
+    for day in (3, 10, ledger.last_day):
+        assert rolling.loc[day].to_numpy() == pytest.approx(daily.loc[day - 2:day].sum().to_numpy())
+
+
+def test_resource_table_sums_stage_costs_per_resource(finished):
+    sim, _ = finished
+    ledger = sim.cost
+    table = sim.logs.job_table
+    resources = ledger.resource_table()
+    totals = ledger.totals()
+    stage_totals = resources.groupby("stage")["cost"].sum()
+    assert stage_totals["Printing"] == pytest.approx(totals["Printing cost"])
+    assert stage_totals["Post-Processing"] == pytest.approx(totals["Post Processing cost"])
+    assert stage_totals["Packaging"] == pytest.approx(totals["Packaging cost"])
+
+    # 프린터별 비용 = 그 프린터에서 출력한 Job의 출력 비용 합
+    printers = resources[resources["stage"] == "Printing"].set_index("resource_id")["cost"]
+    printer_id = table.columns["printer_id"][:table.size]
+    printing_cost = table.columns["printing_cost"][:table.size]
+    for resource_id, cost in printers.items():
+        assert cost == pytest.approx(printing_cost[printer_id == resource_id].sum())
+    assert set(printers.index) <= set(sim.config.PRINTERS)
+    assert np.isclose(printers.sum(), printing_cost.sum())
@@ -0,0 +1,77 @@
+from types import SimpleNamespace
+
+import simpy
+from job_queue import JobQueue, PriorityJobQueue  # 대기열
+
+
+def _job(job_id, **values):
+    return SimpleNamespace(job_id=job_id, **values)
+
+
+def _advance(env, time):
+    """SimPy 시간을 time까지 진행"""
+    env.run(until=time)
+
+
+def test_job_queue_removes_lazily_and_keeps_fifo_order():
+    env = simpy.Environment()
+    queue = JobQueue(env)
+    jobs = [_job(job_id) for job_id in range(5)]
+    for job in jobs:
+        queue.append(job)
+    queue.remove(jobs[0])  # 맨 앞: 바로 정리됨
+    queue.remove(jobs[2])  # 중간: 표시만 하고 pop할 때 건너뜀
+
+    assert len(queue) == 3
+    assert [job.job_id for job in queue] == [1, 3, 4]
+    assert queue.snapshot() == [(0, 1), (0, 3), (0, 4)]
+    assert [queue.pop().job_id for _ in range(3)] == [1, 3, 4]
+    assert not queue
+
+
+def test_job_queue_compacts_removed_entries():
+    """삭제된 entry가 쌓여도 도착 순서 목록은 남은 Job 수에 비례"""
+    queue = JobQueue(simpy.Environment())
+    jobs = [_job(job_id) for job_id in range(1000)]
+    for job in jobs:
+        queue.append(job)
+    for job in jobs[1:-1]:
+        queue.remove(job)
+    assert len(queue) == 2 and len(queue._arrivals) <= 2 * len(queue) + 32
+    assert [queue.pop().job_id for _ in range(2)] == [0, 999]
+
+
+def test_oldest_age_skips_removed_and_popped_jobs():
+    env = simpy.Environment()
+    queue = PriorityJobQueue(env, "due_date")
+    assert queue.oldest_age() == 0
+    first, second, third = _job(0, due_date=30), _job(1, due_date=10), _job(2, due_date=20)
+    queue.append(first)
+    _advance(env, 5)
+    queue.append(second)
+    _advance(env, 8)
+    queue.append(third)
+    _advance(env, 10)
+    assert queue.oldest_age() == 10
+
+    queue.remove(first)  # 가장 오래 기다린 Job 삭제
+    assert queue.oldest_age() == 5
+    assert queue.pop() is second  # 납기가 가장 빠른 Job
+    assert queue.oldest_age() == 2
+    assert queue.pop() is third
+    assert queue.oldest_age() == 0 and not queue
+
+
+def test_priority_queue_skips_lazily_removed_jobs():
+    queue = PriorityJobQueue(simpy.Environment(), "volume")
+    jobs = [_job(job_id, volume=volume) for job_id, volume in enumerate([5, 1, 3, 1, 4])]
+    for job in jobs:
+        queue.append(job)
+    queue.remove(jobs[1])  # heap의 맨 앞 (key 값이 가장 작음)
+    queue.remove(jobs[2])
+
+    assert len(queue) == 3
+    assert queue.peek() == (1, 3)  # (key 값, 순번): 같은 key 값이면 먼저 들어온 Job
+    assert [job.job_id for job in queue] == [3, 4, 0]
+    assert [queue.pop().job_id for _ in range(3)] == [3, 4, 0]
+    assert queue.peek() is None
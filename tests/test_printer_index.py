@@ -0,0 +1,36 @@
+import numpy as np
+from printer_index import PrinterIndex  # 적합 프린터 bitmask index
+from simulation import load_config  # config_Simpy 복사
+
+
+def _linear_fit_mask(printers, width, height, depth):
+    """기존 방식: 모든 프린터의 치수를 차례로 비교"""
+    mask = 0
+    for position, printer in enumerate(printers.values()):
+        if width <= printer["WIDTH"] and height <= printer["HEIGHT"] and depth <= printer["DEPTH"]:
+            mask |= 1 << position
+    return mask
+
+
+def test_fit_mask_matches_linear_scan_for_config_printers():
+    """기본 PRINTERS: 프린터 치수 경계값(같음 / 1 초과)을 포함한 치수 조합"""
+    printers = load_config().PRINTERS
+    index = PrinterIndex(printers)
+    values = sorted({0, 1, 300} | {printer[key] + offset for printer in printers.values()
+                                   for key in PrinterIndex.DIMENSIONS for offset in (-1, 0, 1)})
+    for width in values:
+        for height in values:
+            for depth in values:
+                assert index.fit_mask(width, height, depth) == _linear_fit_mask(printers, width, height, depth)
+
+
+def test_fit_mask_matches_linear_scan_for_random_printers():
+    """치수가 겹치는 임의의 프린터 40대와 임의의 Job 치수"""
+    rng = np.random.default_rng(7)
+    printers = {
+        printer_id: dict(zip(PrinterIndex.DIMENSIONS, rng.integers(50, 300, size=3).tolist()))
+        for printer_id in range(40)
+    }
+    index = PrinterIndex(printers)
+    for width, height, depth in rng.integers(1, 320, size=(2000, 3)).tolist():
+        assert index.fit_mask(width, height, depth) == _linear_fit_mask(printers, width, height, depth)
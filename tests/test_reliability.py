@@ -0,0 +1,34 @@
+import pytest
+from simulation import Simulation  # 시뮬레이션 context
+from event_sink import NullSink  # 이벤트 로그를 남기지 않음
+from job_table import Job  # JobTable 행
+
+
+def _add_job(sim, build_time=10):
+    """모든 프린터에 들어가는 Job 하나를 JobTable에 추가"""
+    table = sim.logs.job_table
+    job = Job(table, table.reserve(1))
+    table.activate(job.job_id, sim.simpy_env.now)
+    job.width = job.height = job.depth = 10
+    job.volume = 1000
+    job.build_time = build_time
+    job.due_date = 1000
+    job.suitable_mask = sim.customer.printer_index.all_mask
+    return job
+
+
+@pytest.mark.parametrize("policy", ["RESTART", "REQUEUE"])
+def test_job_assigned_when_printer_fails_does_not_print_during_repair(policy):
+    """할당과 같은 시간에 고장이 나면 (출력 시작 전) 수리 중인 프린터에서 출력하지 않음"""
+    sim = Simulation(seed=1, events=NullSink(), FAILURE_POLICY=policy, SIM_TIME=1, JOB_CREATION_INTERVAL=1e9)
+    sim.build()
+    printer = sim.printers[0]
+    job = _add_job(sim)
+    printer.assign_job(job)
+    printer.start_downtime("failure", 5)  # 출력 프로세스가 시작되기 전
+    sim.run()
+
+    assert job.printing_start >= 5 or job.printer_id != printer.printer_id
+    if policy == "RESTART":
+        assert (job.printer_id, job.printing_start) == (printer.printer_id, 5)
+    assert job.packaging_finish == job.packaging_finish  # 완료됨 (NaN 아님)
@@ -0,0 +1,34 @@
+import numpy as np
+from simulation import Simulation  # 시뮬레이션 context
+from event_sink import NullSink  # 이벤트 로그를 남기지 않음
+from replication import completions, steady_state_kpis, collect_kpis  # 포장 완료 기록 / 정상 상태 KPI / 전체 KPI
+
+
+def test_completion_satisfication_matches_completed_jobs():
+    """완료 Job별 만족도는 Shortage Job을 제외하고 같은 Job의 값"""
+    sim = Simulation(seed=1, events=NullSink()).run()
+    table = sim.logs.job_table
+    assert table.columns["shortage"][:table.size].sum() > 0  # Shortage Job이 있는 경우
+
+    done, finish, _, satisfication = completions(sim)
+    expected = sim.config.SATISFICATION_TYPE["POSITIVE"] / (finish - table.columns["create_time"][done])
+    np.testing.assert_allclose(satisfication, expected)
+
+    kpis = steady_state_kpis(sim)
+    start, end = kpis["steady.warmup_hours"], sim.config.SIM_TIME * 24
+    window = (finish > start) & (finish <= end)
+    assert kpis["steady.satisfication_per_day"] == satisfication[window].sum() / ((end - start) / 24)
+
+
+def test_printer_utilization_counts_plate_once():
+    """BATCHING이면 같은 plate의 Job이 프린터 구간을 공유하지만 가동률은 1 이하"""
+    sim = Simulation(seed=2, events=NullSink(), BATCHING=True, SCHEDULING_POLICY="SPT", SIM_TIME=10).run()
+    table = sim.logs.job_table
+    intervals = list(zip(*(table.columns[name][:table.size] for name in ("printer_id", "printing_start", "printing_finish"))))
+    printed = [interval for interval in intervals if interval[0] >= 0]
+    assert len(set(printed)) < len(printed)  # plate를 공유한 Job이 있음
+
+    kpis = collect_kpis(sim)
+    utilization = [value for name, value in kpis.items() if name.startswith("utilization.Printer")]
+    assert max(utilization) <= 1 + 1e-9
+    assert kpis["stage_utilization.Printer"] <= 1 + 1e-9
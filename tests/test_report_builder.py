@@ -0,0 +1,24 @@
+import pandas as pd
+import pytest
+import report_builder  # Daily Report 생성
+from simulation import Simulation  # 시뮬레이션 context
+from event_sink import NullSink  # 이벤트 로그를 남기지 않음
+
+
+@pytest.mark.parametrize("overrides", [
+    {},
+    {"BATCHING": True},
+    {"RELIABILITY": True, "FAILURE_POLICY": "RESTART"},
+    {"RELIABILITY": True, "FAILURE_POLICY": "REQUEUE"},
+])
+def test_daily_report_frame_writes_same_csv_as_daily_reports(tmp_path, overrides):
+    """JobTable에서 만든 Daily Report와 DAILY_REPORTS 레코드를 합친 Daily Report의 CSV가 같음"""
+    sim = Simulation(seed=3, events=NullSink(), SIM_TIME=5, **overrides)
+    sim.build()
+    sim.run()
+    records, frame = tmp_path / "records.csv", tmp_path / "frame.csv"
+    pd.DataFrame(report_builder.build_daily_report(sim.logs.daily_reports)).to_csv(records, index=False)
+    report_builder.daily_report_frame(sim.logs.job_table).to_csv(frame, index=False)
+
+    assert len(sim.logs.daily_reports) > 0
+    assert frame.read_text() == records.read_text()
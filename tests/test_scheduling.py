@@ -0,0 +1,74 @@
+from types import SimpleNamespace
+
+import pytest
+import simpy
+
+from job_queue import FitClassQueue, QUEUE_KEYS  # 적합 프린터 묶음별 우선순위 대기열
+from printer_index import PrinterIndex  # 적합/idle 프린터 bitmask index
+from scheduling import Scheduler  # 프린터 스케줄링 정책
+
+# 큰 프린터 1대(0)와 작은 프린터 2대(1, 2), 누적 작업 시간은 0 > 1 > 2
+PRINTERS = {
+    0: {"ID": 0, "WIDTH": 300, "HEIGHT": 300, "DEPTH": 300},
+    1: {"ID": 1, "WIDTH": 100, "HEIGHT": 100, "DEPTH": 100},
+    2: {"ID": 2, "WIDTH": 100, "HEIGHT": 100, "DEPTH": 100},
+}
+BUSY_TIMES = [50, 20, 5]
+# 대기열 순서대로 (이름, 치수, 제작 시간, 납기), B는 큰 프린터에만 들어감
+JOBS = [("A", 50, 30, 300), ("B", 200, 10, 200), ("C", 50, 20, 100)]
+
+
+def _job(job_id, suitable_mask=1, **values):
+    """대기열 테스트용 Job (job_id, suitable_mask와 key 속성만 가짐)"""
+    return SimpleNamespace(job_id=job_id, suitable_mask=suitable_mask, **values)
+
+
+def test_fifo_requeued_job_goes_behind_earlier_entries():
+    """FIFO: 다시 들어온 Job은 생성 시간이 빨라도 먼저 들어와 있던 Job 뒤에 처리됨"""
+    queue = FitClassQueue(simpy.Environment(), QUEUE_KEYS["FIFO"])
+    old = _job(0, create_time=0)
+    queue.append(old)
+    queue.append(_job(1, suitable_mask=2, create_time=5))
+    queue.append(_job(2, create_time=6))
+    assert queue.pop() is old
+    queue.append(old)  # 프린터 고장으로 다시 들어옴 (REQUEUE)
+
+    assert [job.job_id for job in queue] == [1, 2, 0]
+    assert [queue.pop().job_id for _ in range(3)] == [1, 2, 0]
+
+
+def test_take_fitting_keeps_rejected_jobs_in_order():
+    """take_fitting: accept가 False인 Job은 원래 순서 그대로 대기열에 남음"""
+    queue = FitClassQueue(simpy.Environment(), "due_date")
+    for job_id, (mask, due_date) in enumerate([(1, 30), (3, 10), (1, 20), (2, 5)]):
+        queue.append(_job(job_id, suitable_mask=mask, due_date=due_date))
+
+    taken = queue.take_fitting(1, lambda job: job.due_date != 20, limit=10)
+
+    assert [job.job_id for job in taken] == [1, 0]
+    assert [job.job_id for job in queue] == [3, 2]
+    assert len(queue) == 2
+
+
+@pytest.mark.parametrize("policy, expected", [
+    ("FIFO", [("A", 0), ("C", 1)]),  # 대기열 순서, 첫 번째 적합 프린터 (B는 큰 프린터가 비어 있지 않아 대기)
+    ("SPT", [("B", 0), ("C", 1), ("A", 2)]),  # 제작 시간이 짧은 순서
+    ("EDD", [("C", 0), ("A", 1)]),  # 납기가 빠른 순서
+    ("BEST_FIT", [("A", 1), ("B", 0), ("C", 2)]),  # build volume이 가장 작은 프린터
+    ("LEAST_LOADED", [("A", 2), ("B", 0), ("C", 1)]),  # 누적 작업 시간이 가장 적은 프린터
+])
+def test_scheduling_policy_assigns_jobs_to_expected_printers(policy, expected):
+    """스케줄링 정책별로 idle 프린터가 없어질 때까지 할당한 (Job, 프린터) 순서"""
+    config = SimpleNamespace(SCHEDULING_POLICY=policy, QUEUE_POLICY={"PRINTING": "FIFO"}, PRINTERS=PRINTERS, BATCHING=False)
+    index = PrinterIndex(PRINTERS)
+    scheduler = Scheduler(simpy.Environment(), config, index)
+    printers = [SimpleNamespace(busy_time=busy_time) for busy_time in BUSY_TIMES]
+    for name, size, build_time, due_date in JOBS:
+        scheduler.queue.append(_job(name, index.fit_mask(size, size, size), build_time=build_time, due_date=due_date))
+
+    assignments = []
+    while (assignment := scheduler.next_assignment(printers)) is not None:
+        job, position = assignment
+        index.set_idle(position, False)
+        assignments.append((job.job_id, index.printer_ids[position]))
+    assert assignments == expected
@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+from shift_calendar import ShiftCalendar  # 작업자 근무 달력
+from simulation import Simulation  # 시뮬레이션 context
+from event_sink import NullSink  # 이벤트 로그를 남기지 않음
+
+# 월~금 8~17시, 점심 12~13시 (시간 0 = 월요일 0시)
+DAY_SHIFT = {"DAYS": (0, 1, 2, 3, 4), "SHIFTS": ((8, 17),), "BREAKS": ((12, 13),)}
+# 금/토/일 22시 ~ 다음 날 6시 (일요일 야간 근무는 다음 주 월요일로 이어짐)
+NIGHT_SHIFT = {"DAYS": (4, 5, 6), "SHIFTS": ((22, 6),)}
+
+
+def test_day_shift_intervals_exclude_breaks():
+    calendar = ShiftCalendar(DAY_SHIFT)
+    assert calendar.starts[:2] == [8, 13] and calendar.ends[:2] == [12, 17]
+    assert calendar.weekly_hours == 40
+    assert calendar.is_working(8) and calendar.is_working(16.9)
+    assert not calendar.is_working(12.5) and not calendar.is_working(17) and not calendar.is_working(5 * 24 + 9)
+
+
+@pytest.mark.parametrize("start, duration, finish", [
+    (9, 2, 11),  # 근무 시간 안에서 끝남
+    (11.5, 1, 13.5),  # 점심 휴식 동안 멈춤
+    (16.5, 0.5, 17),  # 근무 종료 시간에 정확히 끝남
+    (16, 2, 33),  # 다음 날 근무 시작 후 이어서 처리
+    (3, 1, 9),  # 근무 전에 시작하면 근무 시작부터 처리
+    (12.5, 1, 14),  # 휴식 중에 시작
+    (4 * 24 + 16, 2, 7 * 24 + 9),  # 금요일 -> 주말을 건너 다음 주 월요일
+    (20, 0, 20),  # 작업 시간 0
+])
+def test_day_shift_finish_time(start, duration, finish):
+    assert ShiftCalendar(DAY_SHIFT).finish_time(start, duration) == pytest.approx(finish)
+
+
+def test_next_start():
+    calendar = ShiftCalendar(DAY_SHIFT)
+    assert calendar.next_start(17) == 32
+    assert calendar.next_start(8) == 8
+    assert calendar.next_start(8, after=True) == 13
+    assert calendar.next_start(4 * 24 + 13, after=True) == 7 * 24 + 8
+
+
+def test_overnight_shift_wraps_week():
+    calendar = ShiftCalendar(NIGHT_SHIFT)
+    assert calendar.starts == [0, 118, 142, 166] and calendar.ends == [6, 126, 150, 168]
+    assert calendar.is_working(5) and not calendar.is_working(7)
+    assert calendar.next_start(7) == 118
+    assert calendar.finish_time(167, 3) == pytest.approx(170)  # 일요일 23시 -> 다음 주 월요일 2시
+
+
+def test_overnight_shift_with_break():
+    calendar = ShiftCalendar({**NIGHT_SHIFT, "BREAKS": ((2, 3),)})
+    assert not calendar.is_working(4 * 24 + 26.5)  # 토요일 2시 30분 휴식
+    assert calendar.finish_time(4 * 24 + 22, 5) == pytest.approx(4 * 24 + 28)
+
+
+def test_finish_time_matches_worked_hours():
+    """종료 시간까지의 근무 시간 = 작업 시간, 종료 시간 직전은 근무 시간"""
+    rng = np.random.default_rng(0)
+    for spec in (DAY_SHIFT, NIGHT_SHIFT):
+        calendar = ShiftCalendar(spec)
+        for start, duration in zip(rng.uniform(0, 500, 200), rng.uniform(0.01, 60, 200)):
+            finish = calendar.finish_time(start, duration)
+            assert calendar.worked(finish) - calendar.worked(start) == pytest.approx(duration)
+            assert calendar.is_working(finish - 1e-7)
+
+
+@pytest.mark.parametrize("spec, message", [
+    ({"SHIFTS": ((8, 30),)}, "SHIFTS"),
+    ({"DAYS": (7,)}, "DAYS"),
+    ({"SHIFTS": ((8, 17),), "BREAKS": ((0, 24),)}, "no working time"),
+])
+def test_invalid_calendar(spec, message):
+    with pytest.raises(ValueError, match=message):
+        Simulation(WORK_CALENDARS={"POST_PROCESSING": spec, "PACKAGING": None})
+
+
+def test_workers_start_jobs_only_on_shift():
+    """근무 외 시간에 도착한 Job은 근무 시작 시 처리되고, 작업 시간은 근무 시간으로 계산됨"""
+    sim = Simulation(seed=3, events=NullSink(), SIM_TIME=4, WORK_CALENDARS={"POST_PROCESSING": DAY_SHIFT, "PACKAGING": None})
+    sim.run()
+    calendar = sim.compiled.work_calendars["POST_PROCESSING"]
+    table = sim.logs.job_table
+    columns = {name: column[:table.size] for name, column in table.columns.items()}
+    done = ~np.isnan(columns["post_processing_finish"])
+    assert done.any()
+    for start, finish, duration in zip(columns["post_processing_start"][done], columns["post_processing_finish"][done],
+                                       columns["post_processing_time"][done]):
+        assert calendar.is_working(start)
+        assert calendar.worked(finish) - calendar.worked(start) == pytest.approx(duration)
@@ -0,0 +1,52 @@
+import numpy as np
+from simulation import Simulation  # 시뮬레이션 context
+from event_sink import NullSink  # 이벤트 로그를 남기지 않음
+
+FINISH_COLUMNS = ("create_time", "printing_finish", "post_processing_finish", "packaging_finish")
+
+
+def _finish_times(sim):
+    table = sim.logs.job_table
+    return {name: table.columns[name][:table.size] for name in FINISH_COLUMNS}
+
+
+def test_resume_reproduces_uninterrupted_run(tmp_path):
+    """checkpoint에서 재개한 실행은 중단 없이 실행한 결과와 같음"""
+    full = Simulation(seed=3, events=NullSink()).run()
+    partial = Simulation(seed=3, events=NullSink())
+    partial.run(horizon=24, drain=False, snapshot_every=24, snapshot_path=str(tmp_path / "checkpoint_{time:g}.pkl"))
+    resumed = Simulation.resume(str(tmp_path / "checkpoint_24.pkl"), events=NullSink()).run()
+
+    assert resumed.logs.job_table.size == full.logs.job_table.size == 28
+    expected, actual = _finish_times(full), _finish_times(resumed)
+    for name in FINISH_COLUMNS:
+        np.testing.assert_array_equal(actual[name], expected[name])
+    assert resumed.satisfication.total_satisfication == full.satisfication.total_satisfication
+
+
+def test_run_horizon_stops_arrivals_when_draining():
+    """drain=True이면 horizon에서 Job 생성을 멈추고 남은 Job을 모두 처리"""
+    full = Simulation(seed=1, events=NullSink()).run()
+    short = Simulation(seed=1, events=NullSink()).run(horizon=24)
+
+    create_time = _finish_times(short)["create_time"]
+    assert create_time.max() < 24
+    assert short.logs.job_table.size < full.logs.job_table.size
+    assert not short.has_work()
+    table = short.logs.job_table
+    fit = table.columns["shortage"][:table.size] == 0
+    assert not np.isnan(table.columns["packaging_finish"][:table.size][fit]).any()
+
+
+def test_run_without_drain_stops_at_horizon():
+    """drain=False이면 horizon 시간에서 멈춤"""
+    sim = Simulation(seed=1, events=NullSink()).run(horizon=30, drain=False)
+    assert sim.simpy_env.now == 30
+
+
+def test_run_calls_on_day_for_every_day():
+    """on_day는 Job 생성 기간과 drain 기간의 모든 날짜에 한 번씩 호출됨"""
+    days = []
+    sim = Simulation(seed=1, events=NullSink()).run(on_day=days.append)
+    assert days == list(range(1, len(days) + 1))
+    assert days[-1] * 24 == sim.simpy_env.now
@@ -0,0 +1,41 @@
+import pandas as pd
+import pytest
+from sweep import ResultWriter, run_sweep  # sweep 결과 기록 / 실행
+
+
+@pytest.mark.parametrize("name", ["results.csv", "results.parquet"])
+def test_result_writer_keeps_columns_of_all_points(tmp_path, name):
+    """일부 point에만 있는 KPI도 열로 기록 (없는 값은 빈 칸)"""
+    path = str(tmp_path / name)
+    writer = ResultWriter(path)
+    writer.write([{"point": 1, "throughput_mean": 2.0}])
+    writer.write([{"point": 2, "throughput_mean": 3.0, "printer_failures_mean": 4.0}])
+    writer.write([{"point": 3, "throughput_mean": 1.0}])
+    writer.close()
+    table = pd.read_parquet(path) if name.endswith(".parquet") else pd.read_csv(path)
+    assert list(table.columns) == ["point", "throughput_mean", "printer_failures_mean"]
+    assert table["printer_failures_mean"].isna().tolist() == [True, False, True]
+
+
+def test_result_writer_refuses_existing_file(tmp_path):
+    """결과 파일이 이미 있으면 overwrite=True일 때만 덮어씀"""
+    path = tmp_path / "results.csv"
+    path.write_text("old\n")
+    with pytest.raises(FileExistsError):
+        ResultWriter(str(path))
+    assert path.read_text() == "old\n"
+    ResultWriter(str(path), overwrite=True).close()
+    assert not path.exists()
+
+
+@pytest.mark.parametrize("target_half_width, expected", [
+    (None, 2),  # 기준이 없으면 min_replications만 실행
+    (1e9, 2),  # 기준을 만족하면 조기 종료
+    (0.0, 4),  # 기준을 만족하지 못하면 max_replications까지 실행
+])
+def test_sweep_stops_when_half_width_target_is_met(tmp_path, target_half_width, expected):
+    rows = run_sweep(
+        [{"SIM_TIME": 1}], str(tmp_path / "results.csv"), seed=1, min_replications=2, max_replications=4,
+        batch_replications=2, target_half_width=target_half_width, relative=False, max_workers=2,
+    )
+    assert rows[0]["replications"] == expected
@@ -0,0 +1,27 @@
+import numpy as np
+from simulation import Simulation, load_config  # 시뮬레이션 context / 설정
+from event_sink import NullSink  # 이벤트 로그를 남기지 않음
+from trace_demand import TraceDemand  # 주문 파일 replay
+
+
+def _write_trace(path):
+    path.write_text("timestamp,width,height,depth\n5,100,100,100\n6,120,100,90\n9,80,80,80\n")
+    return str(path)
+
+
+def test_trace_replays_order_timestamps(tmp_path):
+    """주문 파일의 timestamp가 Job 생성 시간이 됨"""
+    demand = TraceDemand(_write_trace(tmp_path / "orders.csv"), load_config())
+    sim = Simulation(seed=1, events=NullSink(), demand=demand).run()
+    table = sim.logs.job_table
+    np.testing.assert_array_equal(table.columns["create_time"][:table.size], [5, 6, 9])
+
+
+def test_shared_trace_keeps_first_arrival(tmp_path):
+    """같은 TraceDemand를 여러 Simulation이 사용해도 첫 주문 시간부터 replay"""
+    demand = TraceDemand(_write_trace(tmp_path / "orders.csv"), load_config())
+    for _ in range(2):
+        assert demand.first_arrival() == 5
+        sim = Simulation(seed=1, events=NullSink(), demand=demand).run()
+        table = sim.logs.job_table
+        np.testing.assert_array_equal(table.columns["create_time"][:table.size], [5, 6, 9])
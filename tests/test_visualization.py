@@ -0,0 +1,17 @@
+import numpy as np
+from visualization import OccupancyIndex  # Gantt 차트 시간 창 index
+
+
+def test_occupancy_counts_shared_plate_interval_once():
+    """같은 build plate의 Job(같은 프린터 구간)은 점유율을 한 번만 셈"""
+    index = OccupancyIndex(
+        ["Printer 0", "Printer 1"],
+        np.array([0, 0, 0]), np.array([1.0, 1.0, 5.0]), np.array([2.0, 2.0, 1.0]), np.array([1, 2, 3]),
+        base_bin=1, factor=2, levels=2,
+    )
+    np.testing.assert_allclose(index.occupancy[0][0], [0, 1, 1, 0, 0, 1])
+    np.testing.assert_allclose(index.occupancy[0][1], 0)
+    np.testing.assert_allclose(index.busy_until(0, np.array([0.0, 2.0, 3.0, 10.0])), [0, 1, 2, 3])
+    assert all(level.max() <= 1 for level in index.occupancy)
+    # Job별 막대에는 두 Job이 모두 보임
+    assert len(index.window(0, 4)) == 2